@@ -0,0 +1,90 @@
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from simplequant import storage_dtype
+
+from .suite import (
+    SAMPLE,
+    SIZES,
+    compare,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmarks and compare them with a baseline.
+
+    Exits with 1 when a case regressed against the baseline, so the command can
+    gate CI. `--save` records the run as the new baseline instead.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time SimpleQuant factors, neutralization and I/O.",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=["small", SAMPLE],
+        choices=[*SIZES, SAMPLE],
+        help="scaling points to run (default: small sample)",
+    )
+    parser.add_argument(
+        "--factors", nargs="+", default=None, help="factors to time (default: all)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--dtype", choices=["float32", "float64"], default="float64")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON")
+    parser.add_argument(
+        "--save", action="store_true", help="write this run as the baseline"
+    )
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    def progress(result):
+        print(
+            f"{result.size:>8} {result.case:<40} {result.seconds * 1e3:10.2f} ms "
+            f"{result.peak_mb:10.1f} MiB",
+            flush=True,
+        )
+
+    with storage_dtype(args.dtype):
+        results = run_suite(args.sizes, args.factors, args.repeat, progress=progress)
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save to record one.")
+        return 0
+
+    report = compare(
+        results,
+        load_baseline(args.baseline),
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+    )
+    with pd.option_context("display.width", 200, "display.max_rows", None):
+        print(report.to_string(float_format="{:.4g}".format))
+    regressions = report[report["regression"]]
+    if regressions.empty:
+        print("No regressions.")
+        return 0
+    print(f"{len(regressions)} regression(s):")
+    for size, case in regressions.index:
+        print(f"  {size} {case}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,394 @@
+import json
+import os
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from simplequant import (
+    Panel,
+    calculate_daily_return,
+    compute_correlation_from_covariance,
+    get_storage_dtype,
+    neutralize_all_factors,
+    regress_model,
+    to_panel,
+)
+from simplequant.factor.registry import get_factor_specs
+
+_BASELINE_VERSION = 1
+
+
+# Performance benchmarks of the factor, neutralization and I/O paths.
+#
+# Every case runs on one or more scaling points: synthetic random-walk OHLCV
+# panels of a given (n_dates, n_symbols), and the real `data/sample_data.csv`.
+# A case is timed as the best of `repeat` runs after one warm-up run; the warm-up
+# runs under `tracemalloc` (which numpy reports its buffers to) to record the peak
+# memory allocated by the call, so tracing never slows the timed runs.
+#
+# Results are plain records, saved to and compared against a JSON baseline.
+# Timings depend on the machine, so a baseline should be recorded and compared
+# on the same one.
+
+SIZES: dict[str, tuple[int, int]] = {
+    "small": (250, 200),
+    "medium": (1000, 1000),
+    "large": (2500, 5000),
+}
+SAMPLE = "sample"
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "sample_data.csv",
+)
+
+# Width of the synthetic cross-sections used by the regression cases
+N_FACTORS = 20
+N_INDUSTRIES = 8
+N_STYLES = 2
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timing and memory of one case at one scaling point.
+
+    Attributes:
+        case (str): Case name, e.g. "factor:alpha_001" or "regress_model".
+        size (str): Scaling point, a key of `SIZES` or "sample".
+        n_dates (int): Dates of the panel.
+        n_symbols (int): Symbols of the panel.
+        cells (int): Input cells processed per call, the unit of `throughput`.
+        seconds (float): Best wall time of one call.
+        throughput (float): `cells / seconds`.
+        peak_mb (float): Peak memory allocated during one call, in MiB.
+    """
+
+    case: str
+    size: str
+    n_dates: int
+    n_symbols: int
+    cells: int
+    seconds: float
+    throughput: float
+    peak_mb: float
+
+
+def synthetic_panel(
+    n_dates: int, n_symbols: int, missing: float = 0.01, seed: int = 0
+) -> Panel:
+    """
+    Random-walk OHLCV panel with the fields of `data/sample_data.csv`.
+
+    Args:
+        n_dates (int): Number of business dates, from 2015-01-01.
+        n_symbols (int): Number of symbols, named 600000, 600001, ...
+        missing (float): Fraction of (date, symbol) bars set to NaN in every field,
+            like suspensions. Defaults to 0.01.
+        seed (int): Random seed.
+
+    Returns:
+        Panel: The panel, in the storage dtype.
+    """
+    rng = np.random.default_rng(seed)
+    shape = (n_dates, n_symbols)
+    close = 10 * np.exp(np.cumsum(rng.normal(0, 0.02, shape), axis=0))
+    open_price = close * np.exp(rng.normal(0, 0.01, shape))
+    high = np.maximum(open_price, close) * (1 + rng.uniform(0, 0.02, shape))
+    low = np.minimum(open_price, close) * (1 - rng.uniform(0, 0.02, shape))
+    volume = np.round(np.exp(rng.normal(15, 1, shape)))
+    fields = {
+        "OpenPrice": open_price,
+        "HighPrice": high,
+        "LowPrice": low,
+        "ClosePrice": close,
+        "Volume": volume,
+        "Amount": volume * (open_price + close) / 2,
+    }
+    suspended = rng.random(shape) < missing
+    for values in fields.values():
+        values[suspended] = np.nan
+    panel = Panel(
+        dates=pd.bdate_range("2015-01-01", periods=n_dates, name="Date"),
+        symbols=pd.Index(np.arange(600000, 600000 + n_symbols), name="Symbol"),
+        fields=fields,
+    )
+    return panel.astype(None)
+
+
+def sample_panel(path: str = SAMPLE_PATH) -> Panel:
+    """The real sample data as a panel."""
+    return to_panel(pd.read_csv(path))
+
+
+def _prices(panel: Panel) -> pd.DataFrame:
+    # Long-format closes with MultiIndex ['Date', 'Symbol'], sorted, bars present
+    close = panel["ClosePrice"]
+    rows, cols = np.nonzero(~np.isnan(close))
+    index = pd.MultiIndex.from_arrays(
+        [panel.dates[rows], panel.symbols[cols]], names=["Date", "Symbol"]
+    )
+    return pd.DataFrame({"ClosePrice": close[rows, cols]}, index=index)
+
+
+def _cross_section(n_symbols: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    # Factors, and industry dummies plus style exposures, of one date
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(size=(n_symbols, N_FACTORS))
+    industry = rng.integers(0, N_INDUSTRIES, n_symbols)
+    exposures = np.hstack(
+        [
+            np.eye(N_INDUSTRIES)[industry],
+            rng.normal(size=(n_symbols, N_STYLES)),
+        ]
+    )
+    return factors, exposures
+
+
+def _cases(
+    panel: Panel, names: list[str] | None
+) -> Iterator[tuple[str, int, Callable[[], object]]]:
+    """(case, cells, call) of every benchmark on `panel`."""
+    n_dates, n_symbols = panel.shape
+    for spec in get_factor_specs(names):
+        cells = n_dates * n_symbols * len(spec.columns)
+        yield f"factor:{spec.name}", cells, lambda spec=spec: spec.panel_func(panel)
+
+    prices = _prices(panel)
+    yield "calculate_daily_return", len(prices), lambda: calculate_daily_return(prices)
+
+    factors, exposures = _cross_section(n_symbols)
+    yield (
+        "regress_model",
+        factors.size,
+        lambda: regress_model(factors, exposures, fit_intercept=True),
+    )
+    yield (
+        "neutralize_all_factors",
+        factors.size,
+        lambda: neutralize_all_factors(factors, exposures, fit_intercept=True),
+    )
+
+    returns = pd.DataFrame(panel["ClosePrice"], columns=panel.symbols).pct_change(
+        fill_method=None
+    )
+    cov = returns.cov()
+    yield (
+        "compute_correlation_from_covariance",
+        cov.size,
+        lambda: compute_correlation_from_covariance(cov),
+    )
+
+
+def measure(func: Callable[[], object], repeat: int = 3) -> tuple[float, float]:
+    """
+    Best wall time of `func` over `repeat` runs, and its peak allocation.
+
+    Returns:
+        tuple[float, float]: (seconds, peak MiB). The peak comes from an extra
+            warm-up run under `tracemalloc`.
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1; got {repeat}.")
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    best = np.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best, max(peak - start, 0) / 2**20
+
+
+def run_suite(
+    sizes: list[str] = ("small", SAMPLE),
+    names: list[str] | None = None,
+    repeat: int = 3,
+    panels: dict[str, Panel] | None = None,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """
+    Run every case at every scaling point.
+
+    Args:
+        sizes (list[str]): Keys of `SIZES`, and/or "sample" for the real data.
+            Defaults to ("small", "sample").
+        names (list[str], optional): Factors to time. Defaults to every
+            registered factor.
+        repeat (int): Timed runs per case; the best one is kept. Defaults to 3.
+        panels (dict[str, Panel], optional): Extra scaling points by name, used
+            before `SIZES` (e.g. a panel loaded from another data file).
+        progress (Callable, optional): Called with each result as it completes.
+
+    Returns:
+        list[BenchmarkResult]: One result per case and scaling point.
+
+    Raises:
+        ValueError: If a size is unknown.
+    """
+    panels = dict(panels or {})
+    unknown = [s for s in sizes if s not in panels and s not in SIZES and s != SAMPLE]
+    if unknown:
+        raise ValueError(
+            f"sizes must be in {[*SIZES, SAMPLE, *panels]}; got unknown {unknown}."
+        )
+
+    results = []
+    for size in sizes:
+        if size in panels:
+            panel = panels[size]
+        elif size == SAMPLE:
+            panel = sample_panel()
+        else:
+            panel = synthetic_panel(*SIZES[size])
+        n_dates, n_symbols = panel.shape
+        for case, cells, func in _cases(panel, names):
+            seconds, peak_mb = measure(func, repeat)
+            result = BenchmarkResult(
+                case=case,
+                size=size,
+                n_dates=n_dates,
+                n_symbols=n_symbols,
+                cells=cells,
+                seconds=seconds,
+                throughput=cells / seconds if seconds > 0 else np.inf,
+                peak_mb=peak_mb,
+            )
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def to_frame(results: list[BenchmarkResult]) -> pd.DataFrame:
+    """Results as a DataFrame indexed by (size, case)."""
+    frame = pd.DataFrame([asdict(r) for r in results])
+    return frame.set_index(["size", "case"])
+
+
+def save_baseline(results: list[BenchmarkResult], path: str) -> None:
+    """
+    Write results and the environment they were measured in to a JSON file.
+    """
+    payload = {
+        "version": _BASELINE_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "storage_dtype": str(get_storage_dtype()),
+        },
+        "results": [asdict(r) for r in results],
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_baseline(path: str) -> list[BenchmarkResult]:
+    """
+    Read results written by `save_baseline`.
+
+    Raises:
+        ValueError: If the file was written by an incompatible version.
+    """
+    with open(path) as f:
+        payload = json.load(f)
+    if payload.get("version") != _BASELINE_VERSION:
+        raise ValueError(
+            f"Unsupported baseline version {payload.get('version')}; expected {_BASELINE_VERSION}."
+        )
+    return [BenchmarkResult(**r) for r in payload["results"]]
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    time_tolerance: float = 0.25,
+    memory_tolerance: float = 0.25,
+    min_seconds: float = 1e-3,
+) -> pd.DataFrame:
+    """
+    Compare results with a baseline and flag regressions.
+
+    A case regresses when it is more than `time_tolerance` slower, or allocates
+    more than `memory_tolerance` more, than in the baseline. Times below
+    `min_seconds` are raised to it first, so timer noise on very fast cases is
+    not flagged.
+
+    Args:
+        results (list[BenchmarkResult]): Current results.
+        baseline (list[BenchmarkResult]): Results from `load_baseline`.
+        time_tolerance (float): Allowed relative slowdown. Defaults to 0.25.
+        memory_tolerance (float): Allowed relative growth of the peak. Defaults
+            to 0.25.
+        min_seconds (float): Floor of the compared times. Defaults to 1 ms.
+
+    Returns:
+        pd.DataFrame: Indexed by (size, case), for the cases in `results`, with
+            columns seconds, baseline_seconds, time_ratio, peak_mb,
+            baseline_peak_mb, memory_ratio, slower, more_memory and regression.
+            Cases missing from the baseline have NaN ratios and are not flagged.
+    """
+    current = to_frame(results)
+    base = to_frame(baseline) if baseline else current.iloc[:0]
+    base = base.reindex(current.index)
+    out = pd.DataFrame(
+        {
+            "seconds": current["seconds"],
+            "baseline_seconds": base["seconds"],
+            "peak_mb": current["peak_mb"],
+            "baseline_peak_mb": base["peak_mb"],
+        },
+        index=current.index,
+    )
+    out.insert(
+        2,
+        "time_ratio",
+        np.maximum(out["seconds"], min_seconds)
+        / np.maximum(out["baseline_seconds"], min_seconds),
+    )
+    # A few KiB of bookkeeping are noise, like sub-millisecond times
+    floor_mb = 1.0
+    out["memory_ratio"] = np.maximum(out["peak_mb"], floor_mb) / np.maximum(
+        out["baseline_peak_mb"], floor_mb
+    )
+    out["slower"] = out["time_ratio"] > 1 + time_tolerance
+    out["more_memory"] = out["memory_ratio"] > 1 + memory_tolerance
+    out["regression"] = out["slower"] | out["more_memory"]
+    return out
+
+
+__all__ = [
+    "SIZES",
+    "BenchmarkResult",
+    "synthetic_panel",
+    "sample_panel",
+    "measure",
+    "run_suite",
+    "to_frame",
+    "save_baseline",
+    "load_baseline",
+    "compare",
+]
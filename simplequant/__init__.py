@@ -1,3 +1,47 @@
+from . import helper_func as _helper_func
+from . import precision as _precision
+from . import ingest as _ingest
+from . import panel as _panel
+from . import store as _store
+from . import diagnostics as _diagnostics
+from . import regression as _regression
+from . import covariance as _covariance
+from . import analytics as _analytics
+from . import backtest as _backtest
+from . import fama_macbeth as _fama_macbeth
+from . import parallel as _parallel
+from ._lazy import lazy_exports as _lazy_exports
 from .helper_func import *
-from .plot import *
+from .precision import *
+from .ingest import *
+from .panel import *
+from .store import *
+from .diagnostics import *
 from .regression import *
+from .covariance import *
+from .analytics import *
+from .backtest import *
+from .fama_macbeth import *
+from .parallel import *
+
+# Plotting pulls in matplotlib and seaborn, so it is imported on first use
+_LAZY_EXPORTS = {
+    ".plot": ["plot_factor_matrix", "plot_model_comparison", "render_factor_matrices"]
+}
+__getattr__, __dir__ = _lazy_exports(__name__, _LAZY_EXPORTS, globals())
+
+__all__ = [
+    *_helper_func.__all__,
+    *_precision.__all__,
+    *_ingest.__all__,
+    *_panel.__all__,
+    *_store.__all__,
+    *_LAZY_EXPORTS[".plot"],
+    *_diagnostics.__all__,
+    *_regression.__all__,
+    *_covariance.__all__,
+    *_analytics.__all__,
+    *_backtest.__all__,
+    *_fama_macbeth.__all__,
+    *_parallel.__all__,
+]
@@ -0,0 +1,61 @@
+import importlib
+from typing import Callable
+
+
+# Deferred imports of heavy optional dependencies (matplotlib, seaborn, scipy).
+#
+# A headless worker that only computes factors never pays for them: the modules
+# are imported on the first access of a name that needs them, after which the
+# name is an ordinary module attribute or function.
+
+
+def lazy_exports(
+    package: str, exports: dict[str, list[str]], namespace: dict
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    Module `__getattr__`/`__dir__` pair (PEP 562) for lazily imported submodules.
+
+    Each submodule is imported when it, or one of the names it exports, is first
+    accessed on the package.
+
+    Args:
+        package (str): Name of the importing package (its `__name__`).
+        exports (dict[str, list[str]]): Relative submodule name (e.g. ".plot") to
+            the names it exports.
+        namespace (dict): The package's `globals()`, where each loaded name is
+            stored so later lookups skip `__getattr__`.
+    """
+    owners = {name: module for module, names in exports.items() for name in names}
+    submodules = {module.lstrip("."): module for module in exports}
+
+    def __getattr__(name: str) -> object:
+        if name in submodules:
+            module = importlib.import_module(submodules[name], package)
+            namespace[name] = module
+            return module
+        if name not in owners:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(owners[name], package)
+        for attr in exports[owners[name]]:
+            namespace[attr] = getattr(module, attr)
+        return namespace[name]
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(owners) | set(submodules))
+
+    return __getattr__, __dir__
+
+
+def lazy_function(module: str, name: str) -> Callable:
+    """Function `module.name`, imported on its first call."""
+    func = None
+
+    def call(*args, **kwargs):
+        nonlocal func
+        if func is None:
+            func = getattr(importlib.import_module(module), name)
+        return func(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = f"`{module}.{name}`, imported on first call."
+    return call
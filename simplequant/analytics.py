@@ -0,0 +1,252 @@
+from typing import Literal, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .factor.cross_section import cs_rank
+from .factor.operators import ts_prod
+
+
+# Information-coefficient (IC) analytics.
+#
+# A factor's IC on date t is the cross-sectional correlation between its values
+# on t and the forward returns from t to t + h: Pearson on the raw values, rank IC
+# (Spearman) on their cross-sectional ranks. Both are computed for every date,
+# factor and horizon in batched array operations over the Date×Symbol×Factor
+# cube, a chunk of dates at a time. Each (date, factor, horizon) uses the symbols
+# where both the factor and the forward return are finite.
+#
+# `information_coefficient` returns a tidy table with one row per (Date, factor,
+# horizon); `ic_summary`, `ic_decay` and `ic_frame` aggregate or reshape it.
+
+_IC_COLUMNS = ["Date", "factor", "horizon", "ic", "rank_ic", "n_obs"]
+
+
+def _as_returns(returns: pd.DataFrame) -> pd.DataFrame:
+    # Date×Symbol daily returns, from either layout
+    if isinstance(returns.index, pd.MultiIndex):
+        if returns.index.names != ["Date", "Symbol"] or "Return" not in returns:
+            raise ValueError(
+                "Long-format returns must have MultiIndex ['Date', 'Symbol'] and a 'Return' column, as from calculate_daily_return"
+            )
+        returns = returns["Return"].unstack("Symbol")
+    returns = returns.copy()
+    returns.index = pd.DatetimeIndex(pd.to_datetime(returns.index), name="Date")
+    return returns.sort_index()
+
+
+def _forward_returns(returns: np.ndarray, horizon: int) -> np.ndarray:
+    # Compounded return from the close of t to the close of t + horizon
+    growth = ts_prod(1.0 + returns, horizon)
+    out = np.full(returns.shape, np.nan)
+    out[:-horizon] = growth[horizon:] - 1.0
+    return out
+
+
+def _row_corr(a: np.ndarray, b: np.ndarray, min_obs: int) -> np.ndarray:
+    """Pearson correlation along the last axis; `a` and `b` share their NaN cells."""
+    n = (~np.isnan(a)).sum(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        da = a - np.nansum(a, axis=-1, keepdims=True) / n
+        db = b - np.nansum(b, axis=-1, keepdims=True) / n
+        corr = np.nansum(da * db, axis=-1) / np.sqrt(
+            np.nansum(da * da, axis=-1) * np.nansum(db * db, axis=-1)
+        )
+    corr[n[..., 0] < min_obs] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def information_coefficient(
+    factors: Mapping[str, pd.DataFrame],
+    returns: pd.DataFrame,
+    horizons: Sequence[int] = (1,),
+    min_obs: int = 3,
+    max_memory_mb: float = 512.0,
+) -> pd.DataFrame:
+    """
+    Pearson and rank IC of every factor against forward returns, per date and horizon.
+
+    Args:
+        factors (Mapping[str, pd.DataFrame]): Factor name to Date×Symbol matrix, e.g.
+            the output of `registry.compute_factors`. Aligned to `returns`; missing
+            dates and symbols count as NaN.
+        returns (pd.DataFrame): Daily returns, either a Date×Symbol matrix or the
+            output of `calculate_daily_return` (MultiIndex ['Date', 'Symbol'] with
+            a 'Return' column). The return on date t is from t - 1 to t.
+        horizons (Sequence[int]): Forward horizons in dates. The forward return of
+            horizon h on date t compounds the returns of t + 1, ..., t + h.
+        min_obs (int): Minimum number of symbols for an IC; fewer gives NaN.
+            Defaults to 3.
+        max_memory_mb (float): Approximate memory budget of one chunk of dates.
+
+    Returns:
+        pd.DataFrame: Tidy table with columns
+            - Date, factor, horizon: the key, sorted by horizon, factor then date.
+            - ic: Pearson correlation of factor values and forward returns.
+            - rank_ic: Spearman correlation (Pearson of cross-sectional ranks,
+              average ranks for ties).
+            - n_obs: number of symbols used.
+            Dates whose forward return is not yet known have NaN ICs.
+
+    Raises:
+        ValueError: If there are no factors, a horizon is not a positive integer,
+            or `returns` has the wrong layout.
+    """
+    if not factors:
+        raise ValueError("factors must contain at least one factor.")
+    horizons = [int(h) for h in horizons]
+    if not horizons or min(horizons) < 1:
+        raise ValueError(f"horizons must be positive integers; got {horizons}.")
+
+    returns = _as_returns(returns)
+    dates, symbols = returns.index, returns.columns
+    names = list(factors)
+    cube = np.stack(
+        [
+            factors[name]
+            .reindex(index=pd.DatetimeIndex(dates), columns=symbols)
+            .to_numpy(dtype=float)
+            for name in names
+        ],
+        axis=1,
+    )  # (n_dates, n_factors, n_symbols)
+    cube[~np.isfinite(cube)] = np.nan
+    daily = returns.to_numpy(dtype=float)
+
+    n_dates, n_factors, n_symbols = cube.shape
+    # Masked factors and returns, their ranks and the centered products of one date
+    bytes_per_date = 8 * n_factors * n_symbols * 8
+    chunk = max(1, int(max_memory_mb * 2**20 // max(bytes_per_date, 1)))
+
+    ic = np.full((len(horizons), n_dates, n_factors), np.nan)
+    rank_ic = np.full_like(ic, np.nan)
+    n_obs = np.zeros(ic.shape, dtype=int)
+    for i, h in enumerate(horizons):
+        forward = _forward_returns(daily, h)
+        forward[~np.isfinite(forward)] = np.nan
+        for start in range(0, n_dates, chunk):
+            rows = slice(start, start + chunk)
+            r = np.broadcast_to(forward[rows, None, :], cube[rows].shape)
+            f = np.where(np.isnan(r), np.nan, cube[rows])
+            r = np.where(np.isnan(f), np.nan, r)
+            n_obs[i, rows] = (~np.isnan(f)).sum(axis=-1)
+            ic[i, rows] = _row_corr(f, r, min_obs)
+
+            shape = f.shape
+            f_rank = cs_rank(f.reshape(-1, n_symbols)).reshape(shape)
+            r_rank = cs_rank(r.reshape(-1, n_symbols)).reshape(shape)
+            rank_ic[i, rows] = _row_corr(f_rank, r_rank, min_obs)
+
+    index = pd.MultiIndex.from_product(
+        [horizons, names, pd.DatetimeIndex(dates, name="Date")],
+        names=["horizon", "factor", "Date"],
+    )
+    table = pd.DataFrame(
+        {
+            "ic": ic.transpose(0, 2, 1).ravel(),
+            "rank_ic": rank_ic.transpose(0, 2, 1).ravel(),
+            "n_obs": n_obs.transpose(0, 2, 1).ravel(),
+        },
+        index=index,
+    ).reset_index()
+    return table[_IC_COLUMNS]
+
+
+def ic_summary(ic: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mean, standard deviation and IR of the IC of each factor and horizon.
+
+    Args:
+        ic (pd.DataFrame): Output of `information_coefficient`.
+
+    Returns:
+        pd.DataFrame: Indexed by (factor, horizon) with columns ic_mean, ic_std,
+            icir (= ic_mean / ic_std), rank_ic_mean, rank_ic_std, rank_icir, and
+            n_dates (dates with a non-NaN IC). Not annualized.
+    """
+    grouped = ic.groupby(["factor", "horizon"], sort=False)
+    out = pd.DataFrame(
+        {
+            "ic_mean": grouped["ic"].mean(),
+            "ic_std": grouped["ic"].std(),
+            "rank_ic_mean": grouped["rank_ic"].mean(),
+            "rank_ic_std": grouped["rank_ic"].std(),
+            "n_dates": grouped["ic"].count(),
+        }
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out.insert(2, "icir", out["ic_mean"] / out["ic_std"])
+        out.insert(5, "rank_icir", out["rank_ic_mean"] / out["rank_ic_std"])
+    return out
+
+
+def ic_decay(
+    ic: pd.DataFrame, metric: Literal["ic", "rank_ic"] = "rank_ic"
+) -> pd.DataFrame:
+    """
+    Mean IC of every factor (rows) at every horizon (columns).
+
+    Args:
+        ic (pd.DataFrame): Output of `information_coefficient`.
+        metric ("ic" | "rank_ic"): IC to average. Defaults to "rank_ic".
+
+    Returns:
+        pd.DataFrame: factor × horizon table of mean ICs.
+    """
+    _check_metric(metric)
+    return ic.pivot_table(
+        index="factor", columns="horizon", values=metric, aggfunc="mean", sort=False
+    )
+
+
+def ic_frame(
+    ic: pd.DataFrame,
+    metric: Literal["ic", "rank_ic"] = "ic",
+    horizon: int = 1,
+    window: int | None = None,
+    min_periods: int | None = None,
+) -> pd.DataFrame:
+    """
+    Date×factor IC series of one horizon, optionally as a rolling mean.
+
+    The result has the layout `plot_model_comparison` expects, e.g.
+    `plot_model_comparison(ic_frame(ic, "rank_ic", window=20), metric="rank_ic")`.
+
+    Args:
+        ic (pd.DataFrame): Output of `information_coefficient`.
+        metric ("ic" | "rank_ic"): IC to return. Defaults to "ic".
+        horizon (int): Forward horizon. Defaults to 1.
+        window (int, optional): Rolling-mean window in dates. Defaults to no smoothing.
+        min_periods (int, optional): Minimum non-NaN ICs per window. Defaults to `window`.
+
+    Returns:
+        pd.DataFrame: Indexed by Date with one column per factor.
+
+    Raises:
+        ValueError: If `metric` is unknown or `horizon` is not in `ic`.
+    """
+    _check_metric(metric)
+    rows = ic[ic["horizon"] == horizon]
+    if rows.empty:
+        raise ValueError(
+            f"horizon must be one of {sorted(ic['horizon'].unique())}; got {horizon}."
+        )
+    frame = rows.pivot(index="Date", columns="factor", values=metric)
+    frame = frame[list(dict.fromkeys(rows["factor"]))]
+    frame.columns.name = None
+    if window is not None:
+        frame = frame.rolling(window, min_periods=min_periods).mean()
+    return frame
+
+
+def _check_metric(metric: str) -> None:
+    if metric not in ("ic", "rank_ic"):
+        raise ValueError(f"metric must be 'ic' or 'rank_ic'; got {metric!r}.")
+
+
+__all__ = [
+    "information_coefficient",
+    "ic_summary",
+    "ic_decay",
+    "ic_frame",
+]
@@ -0,0 +1,227 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from .analytics import _as_returns
+from .factor.cross_section import cs_rank
+
+
+# Quantile (bucket) backtests of a factor.
+#
+# On every rebalance date the symbols with a factor value are split into
+# `n_quantiles` equal-weighted buckets by cross-sectional rank (bucket 1 lowest).
+# Buckets are formed at the close and held for `holding_period` dates, so the
+# bucket of a symbol on return date s is the one formed on the last rebalance
+# date before s. A held symbol without a return on s (e.g. suspended) is left
+# out of that day's bucket mean.
+#
+# The whole history is processed at once: one argsort-based rank per date, then
+# np.bincount over (date, bucket) bins for bucket returns, sizes and turnover.
+# Ranks do not depend on `n_quantiles` or `holding_period`, so `backtest_sweep`
+# computes them once for all combinations.
+
+
+@dataclass
+class BacktestResult:
+    """
+    Output of `quantile_backtest`. Every frame is indexed by return date.
+
+    Attributes:
+        bucket_returns (pd.DataFrame): Equal-weighted daily return of each bucket,
+            columns 1..n_quantiles (lowest factor first).
+        spread (pd.Series): Top minus bottom bucket return, before costs.
+        turnover (pd.DataFrame): Traded notional of each bucket as a fraction of its
+            capital, sum(|w_new - w_old|), booked on the first date after each
+            rebalance (1 when a bucket is first formed) and 0 otherwise.
+        cost (pd.Series): Transaction cost of the long-short portfolio.
+        pnl (pd.Series): Cost-adjusted long-short return, `spread - cost`.
+    """
+
+    bucket_returns: pd.DataFrame
+    spread: pd.Series
+    turnover: pd.DataFrame
+    cost: pd.Series
+    pnl: pd.Series
+
+    def summary(self, periods_per_year: int = 252) -> pd.Series:
+        """
+        Annualized return, volatility and Sharpe ratio of `pnl`, its maximum
+        drawdown (of cumulative simple returns), and the mean long-short turnover
+        per rebalance.
+        """
+        pnl = self.pnl.dropna()
+        ann_return = pnl.mean() * periods_per_year
+        ann_vol = pnl.std() * np.sqrt(periods_per_year)
+        wealth = (1.0 + pnl).cumprod()
+        drawdown = 1.0 - wealth / np.maximum.accumulate(wealth.to_numpy())
+        legs = self.turnover.iloc[:, [0, -1]].sum(axis=1)
+        return pd.Series(
+            {
+                "ann_return": ann_return,
+                "ann_vol": ann_vol,
+                "sharpe": ann_return / ann_vol if ann_vol > 0 else np.nan,
+                "max_drawdown": drawdown.max() if len(drawdown) else np.nan,
+                "mean_turnover": legs[legs > 0].mean(),
+            }
+        )
+
+
+def _align(
+    factor: pd.DataFrame, returns: pd.DataFrame
+) -> tuple[np.ndarray, np.ndarray, pd.DatetimeIndex]:
+    returns = _as_returns(returns)
+    values = factor.reindex(index=returns.index, columns=returns.columns)
+    x = values.to_numpy(dtype=float)
+    x[~np.isfinite(x)] = np.nan
+    r = returns.to_numpy(dtype=float)
+    r[~np.isfinite(r)] = np.nan
+    return x, r, returns.index
+
+
+def _check_params(n_quantiles: int, holding_period: int, cost_bps: float) -> None:
+    if n_quantiles < 2:
+        raise ValueError(f"n_quantiles must be at least 2; got {n_quantiles}.")
+    if holding_period < 1:
+        raise ValueError(f"holding_period must be at least 1; got {holding_period}.")
+    if cost_bps < 0:
+        raise ValueError(f"cost_bps must be non-negative; got {cost_bps}.")
+
+
+def _run(
+    pct: np.ndarray,
+    r: np.ndarray,
+    dates: pd.DatetimeIndex,
+    n_quantiles: int,
+    holding_period: int,
+    cost_bps: float,
+) -> BacktestResult:
+    n_dates, n_symbols = pct.shape
+    q = n_quantiles
+
+    # Bucket 0..q-1 of every symbol on every rebalance date, -1 without a value;
+    # ties share the bucket of their average rank
+    rebalance = np.arange(0, n_dates, holding_period)
+    formed = np.where(
+        np.isnan(pct[rebalance]),
+        -1,
+        np.minimum(np.ceil(np.nan_to_num(pct[rebalance]) * q), q) - 1,
+    ).astype(np.int64)
+
+    # Return date s (>= 1) earns the buckets of the last rebalance before s
+    period = (np.arange(1, n_dates) - 1) // holding_period
+    held = formed[period]  # (n_dates - 1, n_symbols)
+    ret = r[1:]
+    use = (held >= 0) & ~np.isnan(ret)
+    bins = np.arange(n_dates - 1)[:, None] * q + held
+    size = (n_dates - 1) * q
+    sums = np.bincount(bins[use], weights=ret[use], minlength=size)
+    counts = np.bincount(bins[use], minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        bucket = (sums / counts).reshape(n_dates - 1, q)
+
+    # Turnover per rebalance from bucket sizes and the symbols that stay:
+    # stayers trade |1/new - 1/old|, leavers 1/old and joiners 1/new
+    previous = np.vstack([np.full((1, n_symbols), -1), formed[:-1]])
+    rebal_bins = np.arange(len(rebalance))[:, None] * q
+    size = len(rebalance) * q
+
+    def count(b: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        return np.bincount((rebal_bins + b)[mask], minlength=size).reshape(-1, q)
+
+    n_new, n_old = count(formed, formed >= 0), count(previous, previous >= 0)
+    n_stay = count(formed, (formed >= 0) & (formed == previous))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        inv_new = np.where(n_new > 0, 1.0 / n_new, 0.0)
+        inv_old = np.where(n_old > 0, 1.0 / n_old, 0.0)
+    traded = (
+        n_stay * np.abs(inv_new - inv_old)
+        + (n_new - n_stay) * inv_new
+        + (n_old - n_stay) * inv_old
+    )
+    turnover = np.zeros((n_dates - 1, q))
+    booked = rebalance < n_dates - 1
+    turnover[rebalance[booked]] = traded[booked]
+
+    spread = bucket[:, -1] - bucket[:, 0]
+    cost = (turnover[:, -1] + turnover[:, 0]) * cost_bps / 1e4
+
+    index = dates[1:]
+    columns = pd.RangeIndex(1, q + 1, name="bucket")
+    return BacktestResult(
+        bucket_returns=pd.DataFrame(bucket, index=index, columns=columns),
+        spread=pd.Series(spread, index=index, name="spread"),
+        turnover=pd.DataFrame(turnover, index=index, columns=columns),
+        cost=pd.Series(cost, index=index, name="cost"),
+        pnl=pd.Series(spread - cost, index=index, name="pnl"),
+    )
+
+
+def quantile_backtest(
+    factor: pd.DataFrame,
+    returns: pd.DataFrame,
+    n_quantiles: int = 5,
+    holding_period: int = 1,
+    cost_bps: float = 0.0,
+) -> BacktestResult:
+    """
+    Equal-weighted quantile portfolios and the top-minus-bottom spread of a factor.
+
+    Args:
+        factor (pd.DataFrame): Date×Symbol factor matrix, e.g. from
+            `registry.compute_factors`. Higher values go to higher buckets.
+        returns (pd.DataFrame): Daily returns, either a Date×Symbol matrix or the
+            output of `calculate_daily_return`. The factor is aligned to its dates
+            and symbols.
+        n_quantiles (int): Number of buckets. Defaults to 5.
+        holding_period (int): Dates between rebalances, starting with the first
+            date. Defaults to 1 (daily).
+        cost_bps (float): One-way cost in basis points of traded notional.
+            Defaults to 0.
+
+    Returns:
+        BacktestResult: Bucket returns, spread, turnover, cost and net PnL, indexed
+            by return date (every date but the first).
+
+    Raises:
+        ValueError: If a parameter is out of range or `returns` has the wrong layout.
+    """
+    _check_params(n_quantiles, holding_period, cost_bps)
+    x, r, dates = _align(factor, returns)
+    return _run(cs_rank(x), r, dates, n_quantiles, holding_period, cost_bps)
+
+
+def backtest_sweep(
+    factor: pd.DataFrame,
+    returns: pd.DataFrame,
+    n_quantiles: Sequence[int] = (5, 10),
+    holding_periods: Sequence[int] = (1, 5, 20),
+    cost_bps: float = 0.0,
+    periods_per_year: int = 252,
+) -> pd.DataFrame:
+    """
+    `BacktestResult.summary` for every bucket count and holding period.
+
+    The factor is aligned and ranked once and reused by every combination.
+
+    Returns:
+        pd.DataFrame: Indexed by (n_quantiles, holding_period) with the columns
+            of `BacktestResult.summary`.
+    """
+    for q in n_quantiles:
+        for h in holding_periods:
+            _check_params(q, h, cost_bps)
+    x, r, dates = _align(factor, returns)
+    pct = cs_rank(x)
+    rows = {
+        (q, h): _run(pct, r, dates, q, h, cost_bps).summary(periods_per_year)
+        for q in n_quantiles
+        for h in holding_periods
+    }
+    out = pd.DataFrame.from_dict(rows, orient="index")
+    out.index.names = ["n_quantiles", "holding_period"]
+    return out
+
+
+__all__ = ["BacktestResult", "quantile_backtest", "backtest_sweep"]
@@ -0,0 +1,341 @@
+import numpy as np
+import pandas as pd
+
+from .precision import resolve_dtype
+
+
+def shrink_covariance(cov: np.ndarray, shrinkage: float) -> np.ndarray:
+    """
+    Shrink a covariance matrix towards a scaled identity.
+
+    Returns `(1 - shrinkage) * cov + shrinkage * mu * I` with `mu = trace(cov) / K`,
+    the target used by Ledoit-Wolf.
+
+    Args:
+        cov (np.ndarray): Covariance matrix, shape (K, K).
+        shrinkage (float): Shrinkage intensity in [0, 1].
+
+    Returns:
+        np.ndarray: Shrunk covariance matrix, shape (K, K).
+
+    Raises:
+        ValueError: If `shrinkage` is outside [0, 1].
+    """
+    if not 0.0 <= shrinkage <= 1.0:
+        raise ValueError(f"shrinkage must be in [0, 1]; got {shrinkage}.")
+    mu = np.trace(cov) / cov.shape[0]
+    out = (1.0 - shrinkage) * cov
+    out[np.diag_indices_from(out)] += shrinkage * mu
+    return out
+
+
+def _ledoit_wolf_intensity(centered: np.ndarray, emp_cov: np.ndarray) -> float:
+    # Ledoit-Wolf (2004) optimal intensity for the scaled-identity target, from
+    # demeaned rows and their biased covariance. sum((X**2).T @ X**2) collapses to
+    # sum of squared row norms, so only the K×K matrix we already have is O(K²).
+    n, k = centered.shape
+    trace = np.trace(emp_cov)
+    mu = trace / k
+    row_norms = np.einsum("ij,ij->i", centered, centered)
+    frobenius = np.einsum("ij,ij->", emp_cov, emp_cov)
+    beta = (row_norms @ row_norms / n - frobenius) / (k * n)
+    delta = (frobenius - 2.0 * mu * trace + k * mu * mu) / k
+    beta = min(beta, delta)
+    return 0.0 if beta == 0 else beta / delta
+
+
+class RollingCovariance:
+    """
+    Sample covariance of the last `window` observations, updated one row at a time.
+
+    Each `update` adds the newest row and removes the row leaving the window with
+    rank-one (Welford) updates of the mean and co-moment matrix, so a step costs
+    O(K²) instead of the O(window·K²) of recomputing `np.cov`. The co-moment is
+    rebuilt exactly from the buffer once per pass over the window to keep
+    rounding drift bounded.
+
+    Rows containing NaN are treated as missing: they occupy a slot in the window
+    but do not enter the estimate.
+
+    Args:
+        window (int): Number of trailing rows (dates) in the window.
+        min_periods (int, optional): Minimum number of valid rows for an estimate.
+            Defaults to `window`.
+        shrinkage (float | "ledoit-wolf", optional): Fixed shrinkage intensity, or
+            "ledoit-wolf" for the optimal intensity of each window. Defaults to None.
+
+    Raises:
+        ValueError: If `window` or `min_periods` is invalid.
+    """
+
+    def __init__(
+        self,
+        window: int,
+        min_periods: int | None = None,
+        shrinkage: float | str | None = None,
+    ):
+        if not isinstance(window, (int, np.integer)) or window < 2:
+            raise ValueError(f"window must be an integer >= 2; got {window}.")
+        min_periods = window if min_periods is None else min_periods
+        if not 2 <= min_periods <= window:
+            raise ValueError(
+                f"min_periods must be in [2, window]; got min_periods={min_periods}, window={window}."
+            )
+        _check_shrinkage(shrinkage)
+        self.window = window
+        self.min_periods = min_periods
+        self.shrinkage = shrinkage
+        self.n = 0
+        self._head = 0
+        self._steps = 0
+        self._buffer: np.ndarray | None = None
+        self._valid = np.zeros(window, dtype=bool)
+        self._mean: np.ndarray | None = None
+        self._comoment: np.ndarray | None = None
+
+    def update(self, x: np.ndarray) -> np.ndarray:
+        """
+        Append one row of factor returns and return the current covariance.
+
+        Args:
+            x (np.ndarray): Factor returns for one date, shape (K,).
+
+        Returns:
+            np.ndarray: Covariance matrix, shape (K, K); all NaN while fewer than
+                `min_periods` valid rows are in the window.
+        """
+        x = np.asarray(x, dtype=float)
+        if self._buffer is None:
+            k = x.shape[0]
+            self._buffer = np.zeros((self.window, k))
+            self._mean = np.zeros(k)
+            self._comoment = np.zeros((k, k))
+        elif x.shape != self._mean.shape:
+            raise ValueError(
+                f"x must have shape {self._mean.shape}; got x.shape={x.shape}."
+            )
+
+        if self._valid[self._head]:
+            self._remove(self._buffer[self._head])
+        valid = bool(np.isfinite(x).all())
+        self._buffer[self._head] = x
+        self._valid[self._head] = valid
+        if valid:
+            self._add(x)
+        self._head = (self._head + 1) % self.window
+
+        self._steps += 1
+        if self._steps % self.window == 0:
+            self._refresh()
+        return self.covariance()
+
+    def covariance(self) -> np.ndarray:
+        """Current covariance matrix (ddof=1), shrunk if requested."""
+        if self._comoment is None:
+            raise ValueError("covariance is undefined before the first update.")
+        if self.n < self.min_periods:
+            return np.full_like(self._comoment, np.nan)
+        cov = self._comoment / (self.n - 1)
+        if self.shrinkage is None:
+            return cov
+        if self.shrinkage == "ledoit-wolf":
+            rows = self._buffer[self._valid] - self._mean
+            intensity = _ledoit_wolf_intensity(rows, self._comoment / self.n)
+        else:
+            intensity = self.shrinkage
+        return shrink_covariance(cov, intensity)
+
+    def _add(self, x: np.ndarray) -> None:
+        self.n += 1
+        d = x - self._mean
+        self._mean += d / self.n
+        self._comoment += np.outer(d, x - self._mean)
+
+    def _remove(self, x: np.ndarray) -> None:
+        self.n -= 1
+        if self.n == 0:
+            self._mean[:] = 0.0
+            self._comoment[:] = 0.0
+            return
+        d = x - self._mean
+        self._mean -= d / self.n
+        self._comoment -= np.outer(x - self._mean, d)
+
+    def _refresh(self) -> None:
+        rows = self._buffer[self._valid]
+        if len(rows) == 0:
+            return
+        self._mean = rows.mean(axis=0)
+        centered = rows - self._mean
+        self._comoment = centered.T @ centered
+
+
+class EWMCovariance:
+    """
+    Exponentially weighted covariance, updated one row at a time.
+
+    Uses the recursive (RiskMetrics) form with `alpha = 1 - exp(-ln 2 / halflife)`:
+
+        mean_t = mean_{t-1} + alpha * d,  d = x_t - mean_{t-1}
+        cov_t  = (1 - alpha) * (cov_{t-1} + alpha * d dᵀ)
+
+    which equals `DataFrame.ewm(alpha=alpha, adjust=False).cov(bias=True)`. Rows
+    containing NaN are skipped.
+
+    Args:
+        halflife (float): Half-life in rows (dates).
+        min_periods (int, optional): Minimum number of valid rows for an estimate.
+            Defaults to 2.
+        shrinkage (float, optional): Fixed shrinkage intensity. Defaults to None.
+
+    Raises:
+        ValueError: If `halflife`, `min_periods` or `shrinkage` is invalid.
+    """
+
+    def __init__(
+        self, halflife: float, min_periods: int = 2, shrinkage: float | None = None
+    ):
+        if not halflife > 0:
+            raise ValueError(f"halflife must be positive; got {halflife}.")
+        if min_periods < 1:
+            raise ValueError(f"min_periods must be >= 1; got {min_periods}.")
+        if shrinkage == "ledoit-wolf":
+            raise ValueError("EWMCovariance supports a fixed shrinkage intensity only.")
+        _check_shrinkage(shrinkage)
+        self.halflife = halflife
+        self.alpha = 1.0 - np.exp(-np.log(2.0) / halflife)
+        self.min_periods = min_periods
+        self.shrinkage = shrinkage
+        self.n = 0
+        self._mean: np.ndarray | None = None
+        self._cov: np.ndarray | None = None
+
+    def update(self, x: np.ndarray) -> np.ndarray:
+        """
+        Append one row of factor returns and return the current covariance.
+
+        Args:
+            x (np.ndarray): Factor returns for one date, shape (K,).
+
+        Returns:
+            np.ndarray: Covariance matrix, shape (K, K); all NaN while fewer than
+                `min_periods` valid rows have been seen.
+        """
+        x = np.asarray(x, dtype=float)
+        if self._mean is None:
+            self._mean = np.zeros(x.shape[0])
+            self._cov = np.zeros((x.shape[0], x.shape[0]))
+        elif x.shape != self._mean.shape:
+            raise ValueError(
+                f"x must have shape {self._mean.shape}; got x.shape={x.shape}."
+            )
+
+        if np.isfinite(x).all():
+            if self.n == 0:
+                self._mean[:] = x
+            else:
+                d = x - self._mean
+                self._mean += self.alpha * d
+                self._cov += self.alpha * np.outer(d, d)
+                self._cov *= 1.0 - self.alpha
+            self.n += 1
+        return self.covariance()
+
+    def covariance(self) -> np.ndarray:
+        """Current covariance matrix, shrunk if requested."""
+        if self._cov is None:
+            raise ValueError("covariance is undefined before the first update.")
+        if self.n < self.min_periods:
+            return np.full_like(self._cov, np.nan)
+        if self.shrinkage is None:
+            return self._cov.copy()
+        return shrink_covariance(self._cov, self.shrinkage)
+
+
+def _check_shrinkage(shrinkage: float | str | None) -> None:
+    if shrinkage is None or shrinkage == "ledoit-wolf":
+        return
+    if isinstance(shrinkage, str) or not 0.0 <= shrinkage <= 1.0:
+        raise ValueError(
+            f"shrinkage must be None, 'ledoit-wolf' or a float in [0, 1]; got {shrinkage!r}."
+        )
+
+
+def _run_history(
+    estimator: RollingCovariance | EWMCovariance,
+    returns: pd.DataFrame | np.ndarray,
+    dtype,
+) -> np.ndarray:
+    values = np.asarray(returns, dtype=float)
+    if values.ndim != 2:
+        raise ValueError(
+            f"returns must be 2-D (n_dates, n_factors); got shape={values.shape}."
+        )
+    out = np.empty(
+        (values.shape[0], values.shape[1], values.shape[1]), dtype=resolve_dtype(dtype)
+    )
+    for t, row in enumerate(values):
+        out[t] = estimator.update(row)
+    return out
+
+
+def rolling_covariance(
+    returns: pd.DataFrame | np.ndarray,
+    window: int,
+    min_periods: int | None = None,
+    shrinkage: float | str | None = None,
+    dtype=None,
+) -> np.ndarray:
+    """
+    Rolling-window factor covariance for every date.
+
+    Args:
+        returns (pd.DataFrame | np.ndarray): Factor returns, shape (n_dates, K),
+            e.g. a Date-indexed DataFrame with one column per factor.
+        window (int): Number of trailing dates per estimate.
+        min_periods (int, optional): Minimum number of valid rows. Defaults to `window`.
+        shrinkage (float | "ledoit-wolf", optional): See `RollingCovariance`.
+        dtype (optional): Output dtype, e.g. `np.float32` to halve memory. Defaults
+            to the storage dtype. The estimator state is float64 either way.
+
+    Returns:
+        np.ndarray: Covariance history, shape (n_dates, K, K). Row t equals
+            `np.cov(returns[t - window + 1 : t + 1], rowvar=False)` once the
+            window is full. Use `pd.DataFrame(out[t], index=names, columns=names)`
+            for `compute_correlation_from_covariance` or `plot_factor_matrix`.
+    """
+    estimator = RollingCovariance(window, min_periods=min_periods, shrinkage=shrinkage)
+    return _run_history(estimator, returns, dtype)
+
+
+def ewm_covariance(
+    returns: pd.DataFrame | np.ndarray,
+    halflife: float,
+    min_periods: int = 2,
+    shrinkage: float | None = None,
+    dtype=None,
+) -> np.ndarray:
+    """
+    Exponentially weighted factor covariance for every date.
+
+    Args:
+        returns (pd.DataFrame | np.ndarray): Factor returns, shape (n_dates, K).
+        halflife (float): Half-life in dates.
+        min_periods (int): Minimum number of valid rows. Defaults to 2.
+        shrinkage (float, optional): Fixed shrinkage intensity. Defaults to None.
+        dtype (optional): Output dtype. Defaults to the storage dtype.
+
+    Returns:
+        np.ndarray: Covariance history, shape (n_dates, K, K). See `EWMCovariance`.
+    """
+    estimator = EWMCovariance(halflife, min_periods=min_periods, shrinkage=shrinkage)
+    return _run_history(estimator, returns, dtype)
+
+
+__all__ = [
+    "shrink_covariance",
+    "RollingCovariance",
+    "EWMCovariance",
+    "rolling_covariance",
+    "ewm_covariance",
+]
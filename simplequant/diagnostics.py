@@ -0,0 +1,150 @@
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+
+
+# Structured diagnostics of the regression hot paths.
+#
+# `regress_model`, `neutralize_all_factors`, `neutralize_cube` and
+# `neutralize_parallel` take an optional `stats` object and add to it: the number
+# of cross-sections and factor columns processed, why columns were not regressed,
+# and the wall time of each stage. With `stats=None` (the default) they skip all of
+# it, so instrumentation costs one `is None` check per stage.
+#
+# Stats are plain counters, so they pickle, and `merge` adds them up, e.g. the
+# stats returned by worker processes or collected on different machines.
+
+SKIP_REASONS = ("invalid", "constant", "overflow", "error")
+STAGES = ("classify", "fit", "residual", "metrics")
+
+
+@dataclass
+class RegressionStats:
+    """
+    Counters and timers of regression and neutralization calls.
+
+    Skip reasons (see `neutralize_all_factors`):
+        - "invalid": the column has NaN or Inf; set to 0.
+        - "constant": the column is constant; returned unchanged.
+        - "overflow": the column exceeds 1e10 in absolute value; set to 0.
+        - "error": the regression raised; set to 0.
+
+    Stages:
+        - "classify": the per-column checks above.
+        - "fit": factorizing the exposures (or the least-squares fit).
+        - "residual": projecting the factors out of the exposures.
+        - "metrics": MSE, RMSE, MAE and R² (`regress_model` only).
+
+    Attributes:
+        calls (int): Instrumented calls.
+        cross_sections (int): Dates (cross-sections) processed.
+        columns (int): Factor columns processed, summed over cross-sections.
+        regressed (int): Columns that were regressed.
+        skips (Counter[str]): Skip reason to number of columns.
+        factor_skips (Counter[tuple[str, str]]): (reason, factor name) to number
+            of cross-sections, when factor names are given.
+        errors (Counter[str]): Exception type name to number of failed fits.
+        seconds (Counter[str]): Stage to wall time in seconds.
+    """
+
+    calls: int = 0
+    cross_sections: int = 0
+    columns: int = 0
+    regressed: int = 0
+    skips: Counter = field(default_factory=Counter)
+    factor_skips: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    seconds: Counter = field(default_factory=Counter)
+    _mark: float = field(default=0.0, repr=False, compare=False)
+
+    def start(self, count: bool = True) -> None:
+        """Start timing the first stage of a call, counting the call if `count`."""
+        self.calls += int(count)
+        self._mark = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """Book the time since the last `start` or `lap` to `stage`."""
+        now = time.perf_counter()
+        self.seconds[stage] += now - self._mark
+        self._mark = now
+
+    def count_columns(
+        self,
+        n_cross_sections: int,
+        n_columns: int,
+        skipped: dict[str, np.ndarray],
+        factor_names: list[str] | None = None,
+    ) -> None:
+        """
+        Count processed columns and the skipped ones by reason.
+
+        Args:
+            n_cross_sections (int): Cross-sections processed.
+            n_columns (int): Columns processed, summed over cross-sections.
+            skipped (dict[str, np.ndarray]): Reason to a boolean array of skipped
+                columns, shape (n_factors,) or (n_cross_sections, n_factors).
+            factor_names (list[str], optional): Names along the last axis, to
+                count skips per factor.
+        """
+        self.cross_sections += n_cross_sections
+        self.columns += n_columns
+        n_skipped = 0
+        for reason, mask in skipped.items():
+            n = int(np.count_nonzero(mask))
+            if not n:
+                continue
+            self.skips[reason] += n
+            n_skipped += n
+            if factor_names is not None:
+                per_factor = np.count_nonzero(mask.reshape(-1, mask.shape[-1]), axis=0)
+                for j in np.flatnonzero(per_factor):
+                    self.factor_skips[reason, factor_names[j]] += int(per_factor[j])
+        self.regressed += n_columns - n_skipped
+
+    def merge(self, other: "RegressionStats") -> "RegressionStats":
+        """Add `other` into these stats and return them."""
+        self.calls += other.calls
+        self.cross_sections += other.cross_sections
+        self.columns += other.columns
+        self.regressed += other.regressed
+        self.skips.update(other.skips)
+        self.factor_skips.update(other.factor_skips)
+        self.errors.update(other.errors)
+        self.seconds.update(other.seconds)
+        return self
+
+    def __add__(self, other: "RegressionStats") -> "RegressionStats":
+        return RegressionStats().merge(self).merge(other)
+
+    @classmethod
+    def combine(cls, stats: Iterable["RegressionStats"]) -> "RegressionStats":
+        """Sum of many stats, e.g. one per worker process."""
+        total = cls()
+        for s in stats:
+            total.merge(s)
+        return total
+
+    def as_dict(self) -> dict[str, float]:
+        """
+        Flat view for logs and metrics systems.
+
+        Keys are "calls", "cross_sections", "columns", "regressed",
+        "skip.<reason>" and "seconds.<stage>" for every reason and stage (zero
+        when absent), and "error.<type>" for each exception type seen.
+        """
+        out: dict[str, float] = {
+            "calls": self.calls,
+            "cross_sections": self.cross_sections,
+            "columns": self.columns,
+            "regressed": self.regressed,
+        }
+        out |= {f"skip.{r}": self.skips[r] for r in SKIP_REASONS}
+        out |= {f"seconds.{s}": self.seconds[s] for s in STAGES}
+        out |= {f"error.{e}": n for e, n in sorted(self.errors.items())}
+        return out
+
+
+__all__ = ["RegressionStats"]
@@ -1,4 +1,11 @@
 from . import gtja
 from . import worldquant
-
-# __all__ = ['gtja', 'worldquant']
+from . import operators
+from . import cross_section
+from . import registry
+from .streaming import StreamingCalculator
+from . import formula
+from .cache import FactorCache
+from .formula import Formula, compile_formula, register_formula
+from .batch import BatchEvaluator, compute_batch
+from .validation import precision_report
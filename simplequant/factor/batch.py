@@ -0,0 +1,274 @@
+from typing import Callable, Iterator, Mapping
+
+import numpy as np
+import pandas as pd
+
+from ..panel import Panel, to_panel
+from ..precision import get_storage_dtype
+from . import gtja
+from .formula import Formula, Node, evaluate_node, parse_formula, walk
+from .operators import ts_sum
+from .registry import FactorSpec, get_factor_specs, required_columns
+
+
+# Batch evaluation of many factors as one expression DAG.
+#
+# Every requested factor becomes a tree of formula `Node`s: registered formulas
+# directly, built-in panel alphas through `gtja.PANEL_FORMULAS` wrapped in the same
+# warm-up mask as `_alpha`, and any other factor as one opaque node calling its
+# panel function. Nodes are hashable by structure, so putting all trees in one
+# dict merges identical sub-expressions (e.g. MEAN(CLOSE, 10) in alpha_016 and
+# alpha_030, and alpha_006 and alpha_008 as a whole).
+#
+# Factors are evaluated in batches. Within a batch the nodes run in depth-first
+# order, larger subtrees first, and each intermediate is dropped after its last
+# consumer. Batches are cut so that the live intermediates of each stay within the
+# memory budget; a node needed by two batches is recomputed in the second.
+# Intermediates are float64; factor outputs take the storage dtype.
+
+
+def _array_nodes(node: Node) -> Iterator[Node]:
+    return (n for n in walk(node) if n.op not in ("field", "const"))
+
+
+def factor_node(spec: FactorSpec) -> Node:
+    """Expression tree of a registered factor for batch evaluation."""
+    if isinstance(spec.panel_func, Formula):
+        return spec.panel_func.root
+    text = gtja.PANEL_FORMULAS.get(spec.name)
+    if text is None or spec.panel_func is not gtja.PANEL_ALPHAS.get(spec.name):
+        return Node("factor", params=(spec.name,))
+    fields = tuple(Node("field", params=(c,)) for c in spec.columns)
+    present = Node("present", fields, (spec.lookback,))
+    return Node("mask", (parse_formula(text), present))
+
+
+def _present(lookback: int, *fields: np.ndarray) -> np.ndarray:
+    # Rows whose trailing `lookback` bars are present in every field, as in `_alpha`
+    present = np.ones(fields[0].shape)
+    for x in fields:
+        present[np.isnan(x)] = 0.0
+    return ts_sum(present, lookback) == lookback
+
+
+def _order(roots: list[Node]) -> list[Node]:
+    """Depth-first post-order of the array nodes under `roots`, heavier inputs first."""
+    weight: dict[Node, int] = {}
+    for root in roots:
+        for n in walk(root):
+            if n not in weight:
+                weight[n] = 1 + sum(weight[a] for a in set(n.args))
+
+    order, seen = [], set()
+    for root in roots:
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in seen or node.op in ("field", "const"):
+                continue
+            if expanded:
+                seen.add(node)
+                order.append(node)
+                continue
+            stack.append((node, True))
+            # Pushed lightest first so the heaviest input is evaluated first
+            for a in sorted(set(node.args), key=weight.__getitem__):
+                stack.append((a, False))
+    return order
+
+
+def _releases(order: list[Node]) -> list[list[Node]]:
+    """Nodes whose value can be dropped after each step of `order`."""
+    last_use = {n: i for i, n in enumerate(order)}
+    for i, n in enumerate(order):
+        for a in n.args:
+            if a in last_use:
+                last_use[a] = i
+    releases: list[list[Node]] = [[] for _ in order]
+    for n, i in last_use.items():
+        releases[i].append(n)
+    return releases
+
+
+def peak_intermediates(roots: list[Node], node_bytes: int) -> int:
+    """Largest number of bytes held by live nodes while evaluating `roots` in one batch."""
+    order = _order(roots)
+    live = peak = 0
+    for step in _releases(order):
+        live += node_bytes
+        peak = max(peak, live)
+        live -= node_bytes * len(step)
+    return peak
+
+
+class BatchEvaluator:
+    """
+    Evaluate many factors with shared intermediates and a memory budget.
+
+    Args:
+        names (list[str], optional): Factor names. Defaults to every registered factor.
+        memory_budget_mb (float, optional): Upper bound for the intermediate arrays
+            alive at any time (the factor outputs themselves are not counted).
+            Defaults to no bound, i.e. one batch.
+
+    Attributes:
+        roots (dict[str, Node]): Expression tree of each factor.
+        n_nodes (int): Array nodes summed over the separate factor trees.
+        n_unique (int): Distinct array nodes after merging the trees.
+        peak_bytes (int): Peak bytes of live intermediates in the last `run`.
+        n_batches (int): Number of batches in the last `run`.
+
+    Raises:
+        ValueError: If a factor name is unknown or the budget is not positive.
+    """
+
+    def __init__(
+        self, names: list[str] | None = None, memory_budget_mb: float | None = None
+    ):
+        if memory_budget_mb is not None and memory_budget_mb <= 0:
+            raise ValueError(
+                f"memory_budget_mb must be positive; got {memory_budget_mb}."
+            )
+        self.specs = get_factor_specs(names)
+        self.names = [spec.name for spec in self.specs]
+        self.memory_budget_mb = memory_budget_mb
+        self.roots = {spec.name: factor_node(spec) for spec in self.specs}
+        self.n_nodes = sum(
+            sum(1 for _ in _array_nodes(root)) for root in self.roots.values()
+        )
+        self.n_unique = len(
+            {n for root in self.roots.values() for n in _array_nodes(root)}
+        )
+        self.peak_bytes = 0
+        self.n_batches = 0
+
+    def batches(self, shape: tuple[int, int]) -> list[list[str]]:
+        """
+        Split the factors into batches whose intermediates fit the budget.
+
+        Factors keep their order; a factor that alone exceeds the budget gets a
+        batch of its own.
+        """
+        if self.memory_budget_mb is None:
+            return [self.names]
+        budget = self.memory_budget_mb * 2**20
+        node_bytes = shape[0] * shape[1] * np.dtype(float).itemsize
+        batches: list[list[str]] = []
+        current: list[str] = []
+        for name in self.names:
+            candidate = [self.roots[n] for n in [*current, name]]
+            if current and peak_intermediates(candidate, node_bytes) > budget:
+                batches.append(current)
+                current = []
+            current.append(name)
+        if current:
+            batches.append(current)
+        return batches
+
+    def run(
+        self,
+        data: Panel | Mapping[str, np.ndarray],
+        groups: Mapping[str, np.ndarray] | None = None,
+        on_result: Callable[[str, np.ndarray], None] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Evaluate every factor.
+
+        Args:
+            data (Panel | Mapping[str, np.ndarray]): Field name to (n_dates, n_symbols) array.
+            groups (Mapping[str, np.ndarray], optional): Group labels for INDNEUTRALIZE.
+            on_result (Callable[[str, np.ndarray], None], optional): Called with each
+                factor as soon as it is complete, instead of collecting the results,
+                e.g. to write them to disk.
+
+        Returns:
+            dict[str, np.ndarray]: Factor name to (n_dates, n_symbols) array, in the
+                order of `names`; empty when `on_result` is given.
+        """
+        shape = np.shape(data[required_columns(self.names)[0]])
+        node_bytes = shape[0] * shape[1] * np.dtype(float).itemsize
+        dtype = get_storage_dtype()
+
+        results: dict[str, np.ndarray] = {}
+        self.peak_bytes = 0
+        batches = self.batches(shape)
+        self.n_batches = len(batches)
+        for batch in batches:
+            roots: dict[Node, list[str]] = {}
+            for name in batch:
+                roots.setdefault(self.roots[name], []).append(name)
+            order = _order(list(roots))
+
+            values: dict[Node, np.ndarray] = {}
+            live = 0
+            for node, release in zip(order, _releases(order)):
+                values[node] = self._evaluate(node, values, data, shape, groups)
+                live += node_bytes
+                self.peak_bytes = max(self.peak_bytes, live)
+                for name in roots.get(node, []):
+                    out = np.array(np.broadcast_to(values[node], shape), dtype=dtype)
+                    if on_result is None:
+                        results[name] = out
+                    else:
+                        on_result(name, out)
+                for done in release:
+                    del values[done]
+                    live -= node_bytes
+
+        return {name: results[name] for name in self.names if name in results}
+
+    def _evaluate(
+        self,
+        node: Node,
+        values: dict[Node, np.ndarray],
+        data: Mapping[str, np.ndarray],
+        shape: tuple[int, int],
+        groups: Mapping[str, np.ndarray] | None,
+    ) -> np.ndarray:
+        def value(a: Node):
+            if a.op == "field":
+                return np.asarray(data[a.params[0]], dtype=float)
+            if a.op == "const":
+                return a.params[0]
+            return values[a]
+
+        if node.op == "factor":
+            return get_factor_specs([node.params[0]])[0].panel_func(data)
+        if node.op == "present":
+            return _present(node.params[0], *(value(a) for a in node.args))
+        if node.op == "mask":
+            expr, present = (value(a) for a in node.args)
+            return np.where(present, expr, np.nan)
+        return evaluate_node(node, [value(a) for a in node.args], shape, groups)
+
+
+def compute_batch(
+    data: Panel | pd.DataFrame,
+    names: list[str] | None = None,
+    memory_budget_mb: float | None = None,
+    groups: Mapping[str, np.ndarray] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Compute factor panels through a shared-intermediate `BatchEvaluator`.
+
+    Args:
+        data (Panel | pd.DataFrame): A `Panel`, or long-format market data which is
+            pivoted first (required columns only).
+        names (list[str], optional): Factor names. Defaults to every registered factor.
+        memory_budget_mb (float, optional): See `BatchEvaluator`.
+        groups (Mapping[str, np.ndarray], optional): Group labels for INDNEUTRALIZE.
+
+    Returns:
+        dict[str, pd.DataFrame]: Factor name to Date×Symbol matrix, equal to
+            `registry.compute_factors` up to floating-point rounding.
+    """
+    evaluator = BatchEvaluator(names, memory_budget_mb=memory_budget_mb)
+    if not isinstance(data, Panel):
+        data = to_panel(data, required_columns(evaluator.names))
+    return {
+        name: data.to_frame(values)
+        for name, values in evaluator.run(data, groups=groups).items()
+    }
+
+
+__all__ = ["BatchEvaluator", "compute_batch", "factor_node", "peak_intermediates"]
@@ -0,0 +1,390 @@
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..panel import Panel, to_panel
+from ..precision import get_storage_dtype
+from . import cross_section, operators
+from .formula import Formula
+from .registry import FactorSpec, get_factor_specs, required_columns
+
+
+@functools.lru_cache(maxsize=None)
+def _module_source_hash(module_name: str) -> str:
+    module = importlib.import_module(module_name)
+    return hashlib.blake2b(
+        inspect.getsource(module).encode(), digest_size=8
+    ).hexdigest()
+
+
+def code_version(spec: FactorSpec) -> str:
+    """
+    Hash of the source code a factor's panel function depends on.
+
+    Covers the module defining the panel function (so shared helpers count),
+    `factor.operators` and `factor.cross_section`, and for a `Formula` its parsed
+    expression. Editing any of them, or re-registering a formula with another
+    expression, changes the version and invalidates the factor's cache entries.
+    """
+    func = inspect.unwrap(spec.panel_func)
+    version = (
+        _module_source_hash(func.__module__)
+        + _module_source_hash(operators.__name__)
+        + _module_source_hash(cross_section.__name__)
+    )
+    if isinstance(func, Formula):
+        expression = str(func.root).encode()
+        version += hashlib.blake2b(expression, digest_size=8).hexdigest()
+    return version
+
+
+def _row_fingerprints(data: Panel, columns: tuple[str, ...]) -> np.ndarray:
+    # One 64-bit hash per date over the input columns of every symbol
+    block = np.ascontiguousarray(np.stack([data[c] for c in columns], axis=1))
+    return np.array(
+        [
+            int.from_bytes(hashlib.blake2b(row, digest_size=8).digest(), "little")
+            for row in block
+        ],
+        dtype=np.uint64,
+    )
+
+
+class FactorCache:
+    """
+    On-disk cache of factor matrices.
+
+    Each factor has one entry per (name, code version, symbol universe) holding a
+    contiguous run of computed dates, the values as a raw Date×Symbol file in the
+    storage dtype (see `precision`), and a fingerprint of every input row used. On
+    a request:
+
+    - cached dates whose input rows (including warm-up rows) no longer match the
+      data are treated as stale and the entry is rebuilt;
+    - dates after the cached range are computed from the last `lookback - 1`
+      cached rows onwards and appended to the values file;
+    - dates before the cached range are computed and put in front of the cached
+      values, which are kept;
+    - requests made under another storage dtype than the entry was written in
+      rebuild the entry.
+
+    Values are read back through `np.memmap`, so cached history is not copied
+    into memory until used. Windows cannot replace or delete a file while it is
+    mapped, so there the requested rows are copied instead and no mapping
+    outlives the call. When the cache grows above `max_bytes` the least recently
+    used entries are deleted. One writer per cache directory is assumed.
+
+    Args:
+        path (str): Cache directory, created if missing.
+        max_bytes (int): Size bound of the cache directory. Defaults to 1 GiB.
+        mmap (bool, optional): Return frames backed by memory maps. Defaults to
+            True except on Windows.
+
+    Attributes:
+        computed (dict[str, int]): Number of dates computed per factor by the last
+            `get`/`compute` call (0 for a full cache hit).
+    """
+
+    def __init__(self, path: str, max_bytes: int = 2**30, mmap: bool | None = None):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive; got {max_bytes}.")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.mmap = os.name != "nt" if mmap is None else mmap
+        self.computed: dict[str, int] = {}
+
+    def compute(
+        self,
+        data: Panel | pd.DataFrame,
+        names: list[str] | None = None,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Cached equivalent of `registry.compute_factors`.
+
+        Args:
+            data (Panel | pd.DataFrame): A `Panel`, or long-format market data which
+                is pivoted first (required columns only).
+            names (list[str], optional): Factor names. Defaults to every registered factor.
+            start (str | pd.Timestamp, optional): First output date.
+            end (str | pd.Timestamp, optional): Last output date.
+
+        Returns:
+            dict[str, pd.DataFrame]: Factor name to Date×Symbol matrix over the
+                dates of `data` in [start, end]. Frames are backed by read-only
+                memory maps unless `mmap` is off.
+        """
+        specs = get_factor_specs(names)
+        if not isinstance(data, Panel):
+            data = to_panel(data, required_columns([s.name for s in specs]))
+        fingerprints: dict[tuple[str, ...], np.ndarray] = {}
+        self.computed = {}
+        out = {}
+        for spec in specs:
+            if spec.columns not in fingerprints:
+                fingerprints[spec.columns] = _row_fingerprints(data, spec.columns)
+            out[spec.name] = self._get(
+                spec, data, fingerprints[spec.columns], start, end
+            )
+        self._evict(keep={self._entry_path(spec, data.symbols) for spec in specs})
+        return out
+
+    def get(
+        self,
+        data: Panel | pd.DataFrame,
+        name: str,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+    ) -> pd.DataFrame:
+        """Cached value of one factor; see `compute`."""
+        return self.compute(data, [name], start=start, end=end)[name]
+
+    def size_bytes(self) -> int:
+        """Total size of all entries on disk."""
+        return sum(self._entry_size(e) for e in self._entries())
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for entry in self._entries():
+            shutil.rmtree(entry)
+
+    def _get(
+        self,
+        spec: FactorSpec,
+        data: Panel,
+        fingerprints: np.ndarray,
+        start: str | pd.Timestamp | None,
+        end: str | pd.Timestamp | None,
+    ) -> pd.DataFrame:
+        dates = data.dates.to_numpy()
+        first = 0 if start is None else data.dates.searchsorted(pd.Timestamp(start))
+        last = (
+            len(dates)
+            if end is None
+            else data.dates.searchsorted(pd.Timestamp(end), side="right")
+        )
+        self.computed[spec.name] = 0
+        if first >= last:
+            return pd.DataFrame(
+                np.empty((0, len(data.symbols))),
+                index=pd.DatetimeIndex([], name="Date"),
+                columns=data.symbols,
+            )
+
+        entry = self._entry_path(spec, data.symbols)
+        meta = self._load_meta(entry, data, fingerprints)
+        if (
+            meta is None
+            or meta["dtype"] != get_storage_dtype().str
+            or np.datetime64(meta["last"]) not in dates
+        ):
+            self._write(entry, spec, data, fingerprints, first, last)
+            meta = self._load_meta(entry, data, fingerprints)
+        if dates[first] < np.datetime64(meta["first"]):
+            self._prepend(entry, meta, spec, data, fingerprints, first)
+            meta = self._load_meta(entry, data, fingerprints)
+        if dates[last - 1] > np.datetime64(meta["last"]):
+            self._append(entry, meta, spec, data, fingerprints, last)
+            meta = self._load_meta(entry, data, fingerprints)
+
+        meta["last_used"] = time.time()
+        self._save_meta(entry, meta)
+        values, cached_dates = self._read(entry, meta)
+        rows = slice(
+            np.searchsorted(cached_dates, dates[first]),
+            np.searchsorted(cached_dates, dates[last - 1], side="right"),
+        )
+        return pd.DataFrame(
+            values[rows] if self.mmap else np.array(values[rows]),
+            index=pd.DatetimeIndex(cached_dates[rows], name="Date"),
+            columns=data.symbols,
+        )
+
+    def _entry_path(self, spec: FactorSpec, symbols: pd.Index) -> str:
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(code_version(spec).encode())
+        digest.update(np.asarray(symbols.astype(str)).astype("U").tobytes())
+        return os.path.join(self.path, f"{spec.name}-{digest.hexdigest()}")
+
+    def _load_meta(
+        self, entry: str, data: Panel, fingerprints: np.ndarray
+    ) -> dict | None:
+        # Entry metadata if every cached input row still matches the data
+        try:
+            with open(os.path.join(entry, "meta.json")) as f:
+                meta = json.load(f)
+            inputs = np.load(os.path.join(entry, "inputs.npz"))
+            input_dates, input_fps = inputs["dates"], inputs["fingerprints"]
+        except (OSError, ValueError, KeyError):
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        dates = data.dates.to_numpy()
+        lo, hi = max(dates[0], input_dates[0]), min(dates[-1], input_dates[-1])
+        ours = (dates >= lo) & (dates <= hi)
+        theirs = (input_dates >= lo) & (input_dates <= hi)
+        if not (
+            np.array_equal(dates[ours], input_dates[theirs])
+            and np.array_equal(fingerprints[ours], input_fps[theirs])
+        ):
+            shutil.rmtree(entry)
+            return None
+        # Entries written before the dtype was recorded hold float64
+        meta.setdefault("dtype", np.dtype(float).str)
+        meta["input_dates"], meta["input_fps"] = input_dates, input_fps
+        return meta
+
+    def _save_meta(self, entry: str, meta: dict) -> None:
+        public = {k: v for k, v in meta.items() if not k.startswith("input_")}
+        with open(os.path.join(entry, "meta.json"), "w") as f:
+            json.dump(public, f)
+
+    def _compute_rows(
+        self, spec: FactorSpec, data: Panel, first: int, last: int
+    ) -> tuple[int, np.ndarray]:
+        # Rows [first, last) of the factor in the storage dtype, plus the index of
+        # the first input row
+        begin = max(first - spec.lookback + 1, 0)
+        block = {c: data[c][begin:last] for c in spec.columns}
+        values = np.ascontiguousarray(
+            spec.panel_func(block)[first - begin :], dtype=get_storage_dtype()
+        )
+        self.computed[spec.name] += last - first
+        return begin, values
+
+    def _write(
+        self,
+        entry: str,
+        spec: FactorSpec,
+        data: Panel,
+        fingerprints: np.ndarray,
+        first: int,
+        last: int,
+    ) -> None:
+        shutil.rmtree(entry, ignore_errors=True)
+        os.makedirs(entry)
+        begin, values = self._compute_rows(spec, data, first, last)
+        values.tofile(os.path.join(entry, "values.bin"))
+        dates = data.dates.to_numpy()
+        np.savez(
+            os.path.join(entry, "inputs.npz"),
+            dates=dates[begin:last],
+            fingerprints=fingerprints[begin:last],
+        )
+        meta = {
+            "name": spec.name,
+            "n_symbols": len(data.symbols),
+            "dtype": values.dtype.str,
+            "first": str(dates[first]),
+            "last": str(dates[last - 1]),
+        }
+        self._save_meta(entry, meta)
+
+    def _prepend(
+        self,
+        entry: str,
+        meta: dict,
+        spec: FactorSpec,
+        data: Panel,
+        fingerprints: np.ndarray,
+        first: int,
+    ) -> None:
+        # Extend back to row `first`, in front of the cached values
+        dates = data.dates.to_numpy()
+        stop = int(np.searchsorted(dates, np.datetime64(meta["first"])))
+        begin, values = self._compute_rows(spec, data, first, stop)
+        path = os.path.join(entry, "values.bin")
+        with open(f"{path}.tmp", "wb") as out, open(path, "rb") as cached:
+            values.astype(meta["dtype"], copy=False).tofile(out)
+            shutil.copyfileobj(cached, out)
+        os.replace(f"{path}.tmp", path)
+
+        # Input rows not already cached, up to the first cached one
+        cached_from = int(np.searchsorted(dates, meta["input_dates"][0]))
+        new = slice(begin, max(begin, cached_from))
+        np.savez(
+            os.path.join(entry, "inputs.npz"),
+            dates=np.concatenate([dates[new], meta["input_dates"]]),
+            fingerprints=np.concatenate([fingerprints[new], meta["input_fps"]]),
+        )
+        meta["first"] = str(dates[first])
+        self._save_meta(entry, meta)
+
+    def _append(
+        self,
+        entry: str,
+        meta: dict,
+        spec: FactorSpec,
+        data: Panel,
+        fingerprints: np.ndarray,
+        last: int,
+    ) -> None:
+        # Extend contiguously from the first data date after the cached range
+        dates = data.dates.to_numpy()
+        first = int(np.searchsorted(dates, np.datetime64(meta["last"]), side="right"))
+        _, values = self._compute_rows(spec, data, first, last)
+        with open(os.path.join(entry, "values.bin"), "ab") as f:
+            values.astype(meta["dtype"], copy=False).tofile(f)
+
+        # Warm-up rows of the new dates are already among the cached input rows
+        np.savez(
+            os.path.join(entry, "inputs.npz"),
+            dates=np.concatenate([meta["input_dates"], dates[first:last]]),
+            fingerprints=np.concatenate([meta["input_fps"], fingerprints[first:last]]),
+        )
+        meta["last"] = str(dates[last - 1])
+        self._save_meta(entry, meta)
+
+    def _read(self, entry: str, meta: dict) -> tuple[np.ndarray, np.ndarray]:
+        input_dates = meta["input_dates"]
+        cached = input_dates[
+            (input_dates >= np.datetime64(meta["first"]))
+            & (input_dates <= np.datetime64(meta["last"]))
+        ]
+        values = np.memmap(
+            os.path.join(entry, "values.bin"),
+            dtype=np.dtype(meta["dtype"]),
+            mode="r",
+            shape=(len(cached), meta["n_symbols"]),
+        )
+        return values, cached
+
+    def _entries(self) -> list[str]:
+        return [
+            os.path.join(self.path, d)
+            for d in os.listdir(self.path)
+            if os.path.isfile(os.path.join(self.path, d, "meta.json"))
+        ]
+
+    @staticmethod
+    def _entry_size(entry: str) -> int:
+        return sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+
+    def _evict(self, keep: set[str]) -> None:
+        # Delete least recently used entries, other than `keep`, until under the bound
+        entries = []
+        for entry in self._entries():
+            if entry in keep:
+                continue
+            with open(os.path.join(entry, "meta.json")) as f:
+                entries.append((json.load(f).get("last_used", 0.0), entry))
+        sizes = {entry: self._entry_size(entry) for _, entry in entries}
+        total = self.size_bytes()
+        for _, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry)
+            total -= sizes[entry]
+
+
+__all__ = ["FactorCache", "code_version"]
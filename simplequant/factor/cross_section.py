@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+
+# Cross-sectional operators on (n_dates, n_symbols) arrays.
+#
+# Every operator treats each row (date) as one cross-section and processes all
+# dates in one batch of array operations, without a per-date loop or groupby.
+# NaN cells, and cells outside the optional boolean `mask` (e.g. the tradable
+# universe of each date), are excluded from the statistics and are NaN in the
+# output.
+
+
+def cs_rank(x: np.ndarray, mask: np.ndarray | None = None) -> np.ndarray:
+    """
+    RANK(x): percentile rank of every value within its date, in (0, 1].
+
+    Ties get the average rank, and ranks are divided by the number of valid
+    values of the date, as in `DataFrame.rank(axis=1, pct=True)`.
+    """
+    x = _apply_mask(x, mask)
+    valid = ~np.isnan(x)
+    n_valid = valid.sum(axis=1, keepdims=True)
+
+    order = np.argsort(x, axis=1)  # NaN sorts last
+    s = np.take_along_axis(x, order, axis=1)
+    positions = np.broadcast_to(np.arange(x.shape[1]), x.shape)
+
+    # First and last sorted position of each run of equal values
+    new_run = np.ones(x.shape, dtype=bool)
+    new_run[:, 1:] = s[:, 1:] != s[:, :-1]
+    run_start = np.maximum.accumulate(np.where(new_run, positions, 0), axis=1)
+    run_end = np.empty_like(new_run)
+    run_end[:, :-1] = new_run[:, 1:]
+    run_end[:, -1] = True
+    last = np.where(run_end, positions, x.shape[1] - 1)
+    run_last = np.minimum.accumulate(last[:, ::-1], axis=1)[:, ::-1]
+
+    ranks = np.empty(x.shape)
+    np.put_along_axis(ranks, order, (run_start + run_last) / 2.0 + 1.0, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ranks /= n_valid
+    ranks[~valid] = np.nan
+    return ranks
+
+
+def cs_zscore(
+    x: np.ndarray, mask: np.ndarray | None = None, ddof: int = 0
+) -> np.ndarray:
+    """
+    ZSCORE(x): (x - mean) / std within each date.
+
+    Dates whose valid values are all equal get 0; dates with fewer than
+    `ddof + 1` valid values are NaN.
+    """
+    x = _apply_mask(x, mask)
+    valid = ~np.isnan(x)
+    n = valid.sum(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(valid, x, 0.0).sum(axis=1, keepdims=True) / n
+        dev = x - mean
+        var = np.where(valid, dev * dev, 0.0).sum(axis=1, keepdims=True) / (n - ddof)
+        out = dev / np.sqrt(var)
+    out[valid & (var == 0)] = 0.0
+    out[np.broadcast_to(n <= ddof, x.shape)] = np.nan
+    return out
+
+
+def cs_winsorize(
+    x: np.ndarray, n_mad: float = 3.0, mask: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Clip every date to median ± `n_mad` robust standard deviations.
+
+    The robust standard deviation is 1.4826 × MAD (median absolute deviation from
+    the median), which equals the standard deviation for normal data.
+    """
+    if n_mad <= 0:
+        raise ValueError(f"n_mad must be positive; got {n_mad}.")
+    x = _apply_mask(x, mask)
+    out = np.full(x.shape, np.nan)
+    rows = ~np.isnan(x).all(axis=1)
+    if rows.any():
+        xr = x[rows]
+        median = np.nanmedian(xr, axis=1, keepdims=True)
+        bound = (
+            n_mad * 1.4826 * np.nanmedian(np.abs(xr - median), axis=1, keepdims=True)
+        )
+        out[rows] = np.clip(xr, median - bound, median + bound)
+    return out
+
+
+def cs_group_demean(
+    x: np.ndarray, groups: np.ndarray, mask: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    INDNEUTRALIZE(x, groups): subtract the mean of each group within each date.
+
+    Args:
+        x (np.ndarray): Values, shape (n_dates, n_symbols).
+        groups (np.ndarray): Group labels (e.g. industry codes), either one per
+            symbol, shape (n_symbols,), or one per cell, shape (n_dates, n_symbols).
+            Missing labels (NaN/None) give NaN.
+        mask (np.ndarray, optional): Boolean mask of cells to include.
+
+    Returns:
+        np.ndarray: Demeaned values, shape (n_dates, n_symbols).
+
+    Raises:
+        ValueError: If `groups` does not match the shape of `x`.
+    """
+    groups = np.asarray(groups)
+    if groups.shape not in (x.shape, x.shape[1:]):
+        raise ValueError(
+            f"groups must have shape (n_symbols,) or (n_dates, n_symbols); got groups.shape={groups.shape}, x.shape={x.shape}."
+        )
+    x = _apply_mask(x, mask)
+    codes, labels = pd.factorize(np.broadcast_to(groups, x.shape).ravel())
+    codes = codes.reshape(x.shape)
+    n_groups = max(len(labels), 1)
+
+    valid = ~np.isnan(x) & (codes >= 0)
+    # One bin per (date, group)
+    bins = np.arange(x.shape[0])[:, None] * n_groups + codes
+    sums = np.bincount(bins[valid], weights=x[valid], minlength=x.shape[0] * n_groups)
+    counts = np.bincount(bins[valid], minlength=x.shape[0] * n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+
+    out = np.full(x.shape, np.nan)
+    out[valid] = x[valid] - means[bins[valid]]
+    return out
+
+
+def _apply_mask(x: np.ndarray, mask: np.ndarray | None) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    if x.ndim != 2:
+        raise ValueError(
+            f"x must be 2-D (n_dates, n_symbols); got ndim={x.ndim}, shape={x.shape}."
+        )
+    if mask is None:
+        return x
+    if mask.shape != x.shape:
+        raise ValueError(
+            f"mask must have the shape of x; got mask.shape={mask.shape}, x.shape={x.shape}."
+        )
+    return np.where(mask, x, np.nan)
+
+
+__all__ = ["cs_rank", "cs_zscore", "cs_winsorize", "cs_group_demean"]
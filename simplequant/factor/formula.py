@@ -0,0 +1,750 @@
+import re
+from dataclasses import dataclass
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from ..panel import OHLCV_COLUMNS
+from ..precision import get_storage_dtype
+from . import cross_section as cs
+from . import operators as ops
+from .registry import FactorSpec, OutputType, register_factor
+
+
+# Expression language for alpha formulas in the notation of the GTJA 191 and
+# WorldQuant 101 papers, e.g.
+#
+#     (-1 * CORR(RANK(DELTA(LOG(VOLUME),1)),RANK(((CLOSE-OPEN)/OPEN)),6))
+#
+# A formula is parsed into a tree of `Node`s and evaluated on (n_dates, n_symbols)
+# arrays with the vectorized operators of `factor.operators` (time series) and
+# `factor.cross_section` (RANK, ZSCORE, SCALE, INDNEUTRALIZE). Function names are
+# case-insensitive and aliases (MA/MEAN, CORR/CORRELATION, STD/STDDEV, ...) map to
+# one canonical node, so equal sub-expressions are equal `Node`s.
+#
+# Operators, loosest first: `c ? a : b`, `||`, `&&`, comparisons (< <= > >= == !=),
+# `+ -`, `* /`, unary `-`, `^`. Comparisons and logic give 1.0/0.0, and NaN where an
+# input is NaN. Division by zero gives NaN. Window arguments may be expressions of
+# constants and are floored to integers, as in the WorldQuant paper.
+#
+# Fields: OPEN, HIGH, LOW, CLOSE, VOLUME, AMOUNT; VWAP = AMOUNT / VOLUME;
+# RET / RETURNS = CLOSE / DELAY(CLOSE, 1) - 1; ADV<d> = MEAN(AMOUNT, d). Any other
+# name is looked up in the data as is (e.g. "MarketCap").
+#
+# GTJA helpers: DELAY(x) is DELAY(x, 1); REGBETA(y, x, n) and REGRESI(y, x, n) are
+# the slope and latest residual of a rolling regression with intercept, and accept
+# SEQUENCE(n) (or SEQUENCE with n as third argument) as the regressor 1..n;
+# FILTER(x, cond) is x where cond holds and 0 elsewhere, its meaning inside SUM
+# and COUNT; SUMAC(x, n) is SUM(x, n). Not supported: SELF (recursive formulas,
+# e.g. GTJA #143), SEQUENCE anywhere else, and the one-argument SUMAC and MAX /
+# MIN of vectors in GTJA #165, which have no windowed meaning.
+
+
+@dataclass(frozen=True)
+class Node:
+    """
+    One operation of a parsed formula.
+
+    Attributes:
+        op (str): Canonical operation, e.g. "ts_mean", "rank", "add", "field", "const".
+        args (tuple[Node, ...]): Array inputs.
+        params (tuple): Literal parameters: window lengths, the field name of a
+            "field" node, the value of a "const" node, or the group name of
+            "group_demean".
+    """
+
+    op: str
+    args: tuple["Node", ...] = ()
+    params: tuple = ()
+
+    def __str__(self) -> str:
+        if self.op == "field":
+            return self.params[0]
+        if self.op == "const":
+            return repr(self.params[0])
+        inner = [str(a) for a in self.args] + [repr(p) for p in self.params]
+        return f"{self.op}({', '.join(inner)})"
+
+
+def _field(name: str) -> Node:
+    return Node("field", params=(name,))
+
+
+def _const(value: float) -> Node:
+    return Node("const", params=(float(value),))
+
+
+_FIELDS = {
+    "OPEN": "OpenPrice",
+    "HIGH": "HighPrice",
+    "LOW": "LowPrice",
+    "CLOSE": "ClosePrice",
+    "VOLUME": "Volume",
+    "AMOUNT": "Amount",
+}
+
+# Time-series operators: canonical op -> (kernel, number of array inputs, number of
+# integer parameters)
+_TS_KERNELS: dict[str, tuple[Callable, int, int]] = {
+    "delay": (ops.delay, 1, 1),
+    "delta": (ops.delta, 1, 1),
+    "ts_sum": (ops.ts_sum, 1, 1),
+    "ts_mean": (ops.ts_mean, 1, 1),
+    "ts_std": (ops.ts_std, 1, 1),
+    "ts_max": (ops.ts_max, 1, 1),
+    "ts_min": (ops.ts_min, 1, 1),
+    "ts_rank": (ops.ts_rank, 1, 1),
+    "ts_prod": (ops.ts_prod, 1, 1),
+    "ts_argmax": (ops.ts_argmax, 1, 1),
+    "ts_argmin": (ops.ts_argmin, 1, 1),
+    "ts_corr": (ops.ts_corr, 2, 1),
+    "ts_cov": (ops.ts_cov, 2, 1),
+    "ts_regbeta": (ops.ts_regbeta, 2, 1),
+    "ts_regresi": (ops.ts_regresi, 2, 1),
+    "ts_trend": (ops.ts_trend, 1, 1),
+    "ts_trend_resid": (ops.ts_trend_resid, 1, 1),
+    "decay_linear": (ops.decay_linear, 1, 1),
+    "wma": (ops.wma, 1, 1),
+    "sma": (ops.sma, 1, 2),
+}
+
+_CROSS_SECTIONAL = {"rank", "zscore", "scale", "group_demean"}
+
+# Weight left on the history before a recursive SMA's window; see `sma_burn_in`
+SMA_TOLERANCE = 1e-6
+
+# Formula function name -> canonical op
+_ALIASES = {
+    "DELAY": "delay",
+    "DELTA": "delta",
+    "SUM": "ts_sum",
+    "SUMAC": "ts_sum",
+    "MEAN": "ts_mean",
+    "MA": "ts_mean",
+    "STD": "ts_std",
+    "STDDEV": "ts_std",
+    "TSMAX": "ts_max",
+    "TS_MAX": "ts_max",
+    "TSMIN": "ts_min",
+    "TS_MIN": "ts_min",
+    "TSRANK": "ts_rank",
+    "TS_RANK": "ts_rank",
+    "PROD": "ts_prod",
+    "PRODUCT": "ts_prod",
+    "TS_ARGMAX": "ts_argmax",
+    "TS_ARGMIN": "ts_argmin",
+    "CORR": "ts_corr",
+    "CORRELATION": "ts_corr",
+    "COV": "ts_cov",
+    "COVARIANCE": "ts_cov",
+    "COVIANCE": "ts_cov",  # spelling used in the GTJA report
+    "DECAYLINEAR": "decay_linear",
+    "DECAY_LINEAR": "decay_linear",
+    "WMA": "wma",
+    "SMA": "sma",
+    "RANK": "rank",
+    "ZSCORE": "zscore",
+    "SCALE": "scale",
+    "INDNEUTRALIZE": "group_demean",
+    "LOG": "log",
+    "ABS": "abs",
+    "SIGN": "sign",
+    "EXP": "exp",
+    "SQRT": "sqrt",
+    "MAX": "max",
+    "MIN": "min",
+    "SIGNEDPOWER": "signedpower",
+}
+
+
+def _build(op: str, args: list[Node], text: str) -> Node:
+    """Create the node for function `op`, splitting window arguments into params."""
+    if op in _TS_KERNELS:
+        _, n_inputs, n_params = _TS_KERNELS[op]
+        if op == "delay" and len(args) == 1:
+            args = [*args, _const(1.0)]
+        _check_arity(op, args, n_inputs + n_params, text)
+        # Periods of DELAY and DELTA may be 0; windows hold at least one row
+        least = 0 if op in ("delay", "delta") else 1
+        params = tuple(_window(a, op, text, least) for a in args[n_inputs:])
+        if op == "sma" and not params[1] <= params[0]:
+            raise ValueError(
+                f"SMA requires 0 < m <= n; got n={params[0]}, m={params[1]} in {text!r}"
+            )
+        return Node(op, tuple(args[:n_inputs]), params)
+    if op == "group_demean":
+        _check_arity(op, args, 2, text)
+        group = args[1]
+        if group.op != "field":
+            raise ValueError(
+                f"INDNEUTRALIZE expects a group name; got {group} in {text!r}"
+            )
+        return Node(op, (args[0],), (group.params[0].split(".")[-1],))
+    if op == "scale":
+        if len(args) == 1:
+            args = [*args, _const(1.0)]
+        _check_arity(op, args, 2, text)
+        return Node(op, (args[0],), (_constant(args[1], op, text),))
+    arity = {"max": 2, "min": 2, "signedpower": 2}.get(op, 1)
+    _check_arity(op, args, arity, text)
+    return _fold(Node(op, tuple(args)))
+
+
+def _expand(name: str, args: list[Node], text: str) -> Node | None:
+    """Functions defined in terms of other nodes."""
+    if name == "COUNT":  # COUNT(cond, n)
+        _check_arity(name, args, 2, text)
+        return _build("ts_sum", args, text)
+    if name == "SUMIF":  # SUMIF(x, n, cond)
+        _check_arity(name, args, 3, text)
+        return _build("ts_sum", [_fold(Node("mul", (args[0], args[2]))), args[1]], text)
+    if name in ("HIGHDAY", "LOWDAY"):  # rows since the window max / min
+        _check_arity(name, args, 2, text)
+        op = "ts_argmax" if name == "HIGHDAY" else "ts_argmin"
+        position = _build(op, args, text)
+        return Node("sub", (_const(position.params[0]), position))
+    if name == "FILTER":  # FILTER(x, cond): x where cond holds, 0 (no term) elsewhere
+        _check_arity(name, args, 2, text)
+        return Node("where", (args[1], args[0], _const(0.0)))
+    if name == "SEQUENCE":  # only as the regressor of REGBETA / REGRESI
+        _check_arity(name, args, 1, text)
+        return Node("sequence", params=(_window(args[0], name, text, 1),))
+    if name in ("REGBETA", "REGRESI"):
+        # REGBETA(y, x, n), REGBETA(y, SEQUENCE(n)) or REGBETA(y, SEQUENCE, n)
+        if len(args) in (2, 3) and args[1].op == "sequence":
+            window = [_const(args[1].params[0])] if args[1].params else args[2:]
+            if len(args) != (2 if args[1].params else 3):
+                raise ValueError(
+                    f"{name} takes SEQUENCE(n) or SEQUENCE and n in {text!r}"
+                )
+            op = "ts_trend" if name == "REGBETA" else "ts_trend_resid"
+            return _build(op, [args[0], *window], text)
+        op = "ts_regbeta" if name == "REGBETA" else "ts_regresi"
+        return _build(op, args, text)
+    return None
+
+
+def _check_arity(name: str, args: list[Node], n: int, text: str) -> None:
+    if len(args) != n:
+        raise ValueError(
+            f"{name.upper()} takes {n} arguments; got {len(args)} in {text!r}"
+        )
+
+
+def _constant(node: Node, name: str, text: str) -> float:
+    if node.op != "const":
+        raise ValueError(
+            f"{name.upper()} expects a constant argument; got {node} in {text!r}"
+        )
+    return node.params[0]
+
+
+def _window(node: Node, name: str, text: str, least: int = 1) -> int:
+    value = int(np.floor(_constant(node, name, text)))
+    if value < least:
+        raise ValueError(
+            f"{name.upper()} expects a window of at least {least}; got {value} in {text!r}"
+        )
+    return value
+
+
+_FOLDABLE = {
+    "neg": np.negative,
+    "add": np.add,
+    "sub": np.subtract,
+    "mul": np.multiply,
+    "div": np.divide,
+    "pow": np.power,
+    "abs": np.abs,
+    "log": np.log,
+    "exp": np.exp,
+    "sqrt": np.sqrt,
+}
+
+
+def _fold(node: Node) -> Node:
+    """Evaluate arithmetic on constants at parse time, e.g. the window in `SUM(x, 20/2)`."""
+    if node.op in _FOLDABLE and all(a.op == "const" for a in node.args):
+        return _const(_FOLDABLE[node.op](*(a.params[0] for a in node.args)))
+    return node
+
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<number>\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)"
+    r"|(?P<op>&&|\|\||<=|>=|==|!=|[-+*/^<>?:(),=]))"
+)
+
+_BINARY = {
+    "||": "or",
+    "&&": "and",
+    "<": "lt",
+    "<=": "le",
+    ">": "gt",
+    ">=": "ge",
+    "==": "eq",
+    "=": "eq",
+    "!=": "ne",
+    "+": "add",
+    "-": "sub",
+    "*": "mul",
+    "/": "div",
+}
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: list[tuple[str, str, int]] = []
+        pos = 0
+        while pos < len(text):
+            if text[pos:].isspace():
+                break
+            match = _TOKEN.match(text, pos)
+            if match is None:
+                raise ValueError(
+                    f"Unexpected character {text[pos:].strip()[0]!r} at position {pos} in {text!r}"
+                )
+            kind = match.lastgroup
+            self.tokens.append((kind, match.group(kind), match.start(kind)))
+            pos = match.end()
+        self.i = 0
+
+    def parse(self) -> Node:
+        node = self.ternary()
+        if self.i < len(self.tokens):
+            self.fail()
+        return node
+
+    def peek(self) -> str | None:
+        return self.tokens[self.i][1] if self.i < len(self.tokens) else None
+
+    def take(self, expected: str | None = None) -> tuple[str, str, int]:
+        if self.i >= len(self.tokens) or (
+            expected is not None and self.tokens[self.i][1] != expected
+        ):
+            self.fail(expected)
+        token = self.tokens[self.i]
+        self.i += 1
+        return token
+
+    def fail(self, expected: str | None = None):
+        hint = f"; expected {expected!r}" if expected else ""
+        if self.i >= len(self.tokens):
+            raise ValueError(f"Unexpected end of formula{hint} in {self.text!r}")
+        _, value, pos = self.tokens[self.i]
+        raise ValueError(
+            f"Unexpected token {value!r} at position {pos}{hint} in {self.text!r}"
+        )
+
+    def binary(self, operand, symbols: tuple[str, ...]) -> Node:
+        node = operand()
+        while self.peek() in symbols:
+            op = _BINARY[self.take()[1]]
+            node = _fold(Node(op, (node, operand())))
+        return node
+
+    def ternary(self) -> Node:
+        cond = self.logical_or()
+        if self.peek() != "?":
+            return cond
+        self.take("?")
+        a = self.ternary()
+        self.take(":")
+        b = self.ternary()
+        return Node("where", (cond, a, b))
+
+    def logical_or(self) -> Node:
+        return self.binary(self.logical_and, ("||",))
+
+    def logical_and(self) -> Node:
+        return self.binary(self.comparison, ("&&",))
+
+    def comparison(self) -> Node:
+        return self.binary(self.additive, ("<", "<=", ">", ">=", "==", "=", "!="))
+
+    def additive(self) -> Node:
+        return self.binary(self.multiplicative, ("+", "-"))
+
+    def multiplicative(self) -> Node:
+        return self.binary(self.unary, ("*", "/"))
+
+    def unary(self) -> Node:
+        if self.peek() == "-":
+            self.take()
+            return _fold(Node("neg", (self.unary(),)))
+        if self.peek() == "+":
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self) -> Node:
+        base = self.primary()
+        if self.peek() == "^":
+            self.take()
+            return _fold(Node("pow", (base, self.unary())))
+        return base
+
+    def primary(self) -> Node:
+        if self.i >= len(self.tokens):
+            self.fail()
+        kind, value, _ = self.tokens[self.i]
+        if kind == "number":
+            self.i += 1
+            return _const(float(value))
+        if value == "(":
+            self.i += 1
+            node = self.ternary()
+            self.take(")")
+            return node
+        if kind != "name":
+            self.fail()
+        self.i += 1
+        if self.peek() == "(":
+            return self.call(value)
+        return self.identifier(value)
+
+    def call(self, name: str) -> Node:
+        self.take("(")
+        args = []
+        if self.peek() != ")":
+            args.append(self.ternary())
+            while self.peek() == ",":
+                self.take()
+                args.append(self.ternary())
+        self.take(")")
+        upper = name.upper()
+        expanded = _expand(upper, args, self.text)
+        if expanded is not None:
+            return expanded
+        if upper not in _ALIASES:
+            raise ValueError(f"Unknown function {name!r} in {self.text!r}")
+        return _build(_ALIASES[upper], args, self.text)
+
+    def identifier(self, name: str) -> Node:
+        upper = name.upper()
+        if upper in _FIELDS:
+            return _field(_FIELDS[upper])
+        if upper == "VWAP":
+            return Node("div", (_field("Amount"), _field("Volume")))
+        if upper in ("RET", "RETURNS"):
+            close = _field("ClosePrice")
+            ratio = Node("div", (close, Node("delay", (close,), (1,))))
+            return Node("sub", (ratio, _const(1.0)))
+        if upper == "SEQUENCE":
+            return Node("sequence")
+        if upper == "SELF":
+            raise ValueError(
+                f"SELF (a formula's own previous value) is not supported in {self.text!r}"
+            )
+        adv = re.fullmatch(r"ADV(\d+)", upper)
+        if adv:
+            return Node("ts_mean", (_field("Amount"),), (int(adv.group(1)),))
+        return _field(name)
+
+
+def parse_formula(text: str) -> Node:
+    """
+    Parse a formula string into its expression tree.
+
+    Raises:
+        ValueError: On a syntax error, an unknown function, a bad argument count or
+            window, or SEQUENCE outside REGBETA / REGRESI.
+    """
+    root = _Parser(text).parse()
+    if any(n.op == "sequence" for n in walk(root)):
+        raise ValueError(
+            f"SEQUENCE is only supported as the regressor of REGBETA or REGRESI in {text!r}"
+        )
+    return root
+
+
+def _nan_where(mask, values):
+    return np.where(mask, np.nan, values)
+
+
+def _compare(func):
+    def kernel(a, b):
+        return _nan_where(np.isnan(a) | np.isnan(b), func(a, b))
+
+    return kernel
+
+
+def _divide(a, b):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _nan_where(b == 0, a / b)
+
+
+def _power(a, b):
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        return np.power(a, b)
+
+
+def _unsafe(func):
+    def kernel(*args):
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            return func(*args)
+
+    return kernel
+
+
+_ELEMENTWISE: dict[str, Callable] = {
+    "neg": np.negative,
+    "add": np.add,
+    "sub": np.subtract,
+    "mul": np.multiply,
+    "div": _divide,
+    "pow": _power,
+    "lt": _compare(np.less),
+    "le": _compare(np.less_equal),
+    "gt": _compare(np.greater),
+    "ge": _compare(np.greater_equal),
+    "eq": _compare(np.equal),
+    "ne": _compare(np.not_equal),
+    "and": _compare(lambda a, b: (a != 0) & (b != 0)),
+    "or": _compare(lambda a, b: (a != 0) | (b != 0)),
+    "where": lambda c, a, b: _nan_where(np.isnan(c), np.where(c != 0, a, b)),
+    "log": _unsafe(np.log),
+    "abs": np.abs,
+    "sign": np.sign,
+    "exp": _unsafe(np.exp),
+    "sqrt": _unsafe(np.sqrt),
+    "max": np.maximum,
+    "min": np.minimum,
+    "signedpower": lambda x, a: np.sign(x) * _power(np.abs(x), a),
+}
+
+
+def _scale(x: np.ndarray, a: float) -> np.ndarray:
+    total = np.nansum(np.abs(x), axis=1, keepdims=True)
+    return _divide(a * x, total)
+
+
+def evaluate_node(
+    node: Node,
+    values: list,
+    shape: tuple[int, int],
+    groups: Mapping[str, np.ndarray] | None = None,
+) -> np.ndarray:
+    """
+    Run the kernel of an operator node on the computed values of its inputs.
+
+    Args:
+        node (Node): Node other than "field" and "const".
+        values (list): Values of `node.args`, arrays of `shape` or floats.
+        shape (tuple[int, int]): (n_dates, n_symbols) of the data.
+        groups (Mapping[str, np.ndarray], optional): Group labels for INDNEUTRALIZE.
+
+    Returns:
+        np.ndarray: Result, broadcastable to `shape`.
+    """
+    if node.op in _TS_KERNELS:
+        kernel = _TS_KERNELS[node.op][0]
+        arrays = [np.broadcast_to(np.asarray(v, dtype=float), shape) for v in values]
+        return kernel(*arrays, *node.params)
+    if node.op in _CROSS_SECTIONAL:
+        x = np.broadcast_to(np.asarray(values[0], dtype=float), shape)
+        if node.op == "rank":
+            return cs.cs_rank(x)
+        if node.op == "zscore":
+            return cs.cs_zscore(x)
+        if node.op == "scale":
+            return _scale(x, node.params[0])
+        name = node.params[0]
+        if groups is None or name not in groups:
+            raise ValueError(f"Group labels {name!r} are required by INDNEUTRALIZE.")
+        return cs.cs_group_demean(x, groups[name])
+    return _ELEMENTWISE[node.op](*values)
+
+
+def walk(node: Node):
+    """Yield every distinct node of the tree once, inputs before consumers."""
+    seen = set()
+    stack = [(node, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if current in seen:
+            continue
+        if expanded:
+            seen.add(current)
+            yield current
+            continue
+        stack.append((current, True))
+        stack.extend((a, False) for a in reversed(current.args) if a not in seen)
+
+
+def sma_burn_in(n: int, m: int, tolerance: float = SMA_TOLERANCE) -> int:
+    """
+    Rows after which a recursive SMA(x, n, m) has forgotten its starting value.
+
+    SMA started `k` rows back weighs the history it did not see with
+    (1 - m / n) ** (k - 1), as its first output stands in for it. The burn-in is
+    the smallest `k` that brings this weight to `tolerance`; for m == n it is 1.
+    """
+    if not 0 < m <= n:
+        raise ValueError(f"SMA requires 0 < m <= n; got n={n}, m={m}.")
+    decay = 1 - m / n
+    if decay == 0:
+        return 1
+    return 1 + max(int(np.ceil(np.log(tolerance) / np.log(decay))), 0)
+
+
+def lookback(node: Node) -> int:
+    """
+    Number of trailing rows one output row depends on.
+
+    Recursive SMA depends on all earlier history; it is counted with its
+    `sma_burn_in` rows, so a value computed from `lookback` rows (trimmed
+    history, streaming, the factor cache) differs from the full-history value by
+    at most `SMA_TOLERANCE` times the range of the SMA input.
+    """
+    result: dict[Node, int] = {}
+    for n in walk(node):
+        inner = max((result[a] for a in n.args), default=1 if n.op == "field" else 0)
+        if n.op in ("delay", "delta"):
+            inner += n.params[0]
+        elif n.op == "sma":
+            inner += sma_burn_in(*n.params) - 1
+        elif n.op in _TS_KERNELS:
+            inner += n.params[0] - 1
+        result[n] = inner
+    return max(result[node], 1)
+
+
+class Formula:
+    """
+    A compiled alpha formula.
+
+    Calling it with a mapping of field name to (n_dates, n_symbols) array (such as
+    a `Panel`) evaluates the whole expression on every date and symbol at once.
+    Equal sub-expressions are computed once.
+
+    Args:
+        text (str): Formula, e.g. "-1 * CORR(OPEN, VOLUME, 10)".
+
+    Attributes:
+        text (str): The formula.
+        root (Node): Parsed expression tree.
+        columns (tuple[str, ...]): Input fields, in OHLCV order.
+        lookback (int): See `lookback`.
+        cross_sectional (bool): Whether any operator mixes symbols (RANK, ...).
+
+    Raises:
+        ValueError: If the formula cannot be parsed or references no field.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.root = parse_formula(text)
+        nodes = list(walk(self.root))
+        used = {n.params[0] for n in nodes if n.op == "field"}
+        if not used:
+            raise ValueError(f"Formula must reference at least one field: {text!r}")
+        self.columns = tuple(
+            [c for c in OHLCV_COLUMNS if c in used]
+            + sorted(used.difference(OHLCV_COLUMNS))
+        )
+        self.lookback = lookback(self.root)
+        self.cross_sectional = any(n.op in _CROSS_SECTIONAL for n in nodes)
+
+    def __repr__(self) -> str:
+        return f"Formula({self.text!r})"
+
+    def __call__(
+        self,
+        data: Mapping[str, np.ndarray],
+        groups: Mapping[str, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """
+        Evaluate the formula.
+
+        Args:
+            data (Mapping[str, np.ndarray]): Field name to (n_dates, n_symbols) array,
+                e.g. a `Panel`.
+            groups (Mapping[str, np.ndarray], optional): Group labels by name for
+                INDNEUTRALIZE, e.g. {"industry": codes}; see `cs_group_demean`.
+
+        Returns:
+            np.ndarray: Factor values, shape (n_dates, n_symbols), in the storage
+                dtype. Inputs are upcast and intermediates are float64.
+        """
+        shape = np.shape(data[self.columns[0]])
+        values: dict[Node, np.ndarray | float] = {}
+        for node in walk(self.root):
+            if node.op == "field":
+                values[node] = np.asarray(data[node.params[0]], dtype=float)
+            elif node.op == "const":
+                values[node] = node.params[0]
+            else:
+                values[node] = evaluate_node(
+                    node, [values[a] for a in node.args], shape, groups
+                )
+        return np.array(
+            np.broadcast_to(values[self.root], shape), dtype=get_storage_dtype()
+        )
+
+    def window_func(self, sub_df: pd.DataFrame) -> float:
+        """
+        Per-window evaluation on one symbol's history, as the gtja functions do.
+
+        Raises:
+            ValueError: If the formula is cross-sectional, which needs all symbols.
+        """
+        if self.cross_sectional:
+            raise ValueError(
+                f"Cross-sectional formula cannot be evaluated on one symbol: {self.text!r}"
+            )
+        if len(sub_df) < self.lookback:
+            return np.nan
+        window = sub_df.iloc[-self.lookback :]
+        data = {c: window[c].to_numpy(dtype=float)[:, None] for c in self.columns}
+        return float(self(data)[-1, 0])
+
+
+def compile_formula(text: str) -> Formula:
+    """Parse `text` and return a callable `Formula`."""
+    return Formula(text)
+
+
+def register_formula(name: str, text: str, output: OutputType = "float") -> FactorSpec:
+    """
+    Compile a formula and add it to the factor registry.
+
+    The factor then works everywhere registered factors do (`compute_factors`,
+    `StreamingCalculator`, `FactorCache`, `compute_factors_parallel`). Its
+    per-window `func` raises for cross-sectional formulas.
+
+    Args:
+        name (str): Factor name, e.g. "gtja_191_001".
+        text (str): Formula text.
+        output (OutputType): Output type. Defaults to "float".
+
+    Returns:
+        FactorSpec: The registered spec.
+    """
+    formula = compile_formula(text)
+    return register_factor(
+        FactorSpec(
+            name=name,
+            lookback=formula.lookback,
+            columns=formula.columns,
+            output=output,
+            func=formula.window_func,
+            panel_func=formula,
+        )
+    )
+
+
+__all__ = [
+    "Node",
+    "Formula",
+    "parse_formula",
+    "compile_formula",
+    "register_formula",
+    "evaluate_node",
+    "walk",
+    "lookback",
+    "sma_burn_in",
+    "SMA_TOLERANCE",
+]
@@ -1,16 +1,5 @@
 from ._gtja_A import *
 from ._gtja_B import *
 from ._gtja_C import *
-from ._gtja_D import *
-from ._gtja_E import *
-from ._gtja_F import *
-from ._gtja_G import *
-from ._gtja_H import *
-from ._gtja_I import *
-from ._gtja_J import *
-from ._gtja_K import *
-from ._gtja_L import *
-from ._gtja_M import *
-from ._gtja_N import *
-from ._gtja_O import *
-from ._gtja_P import *
+from ._gtja_panel import PANEL_ALPHAS, compute_panel
+from ._gtja_formulas import PANEL_FORMULAS
@@ -1,6 +1,10 @@
 import pandas as _pd
 import numpy as _np
-from scipy.stats import rankdata as _rankdata
+
+from ..._lazy import lazy_function as _lazy_function
+from ..operators import ts_corr as _ts_corr
+
+_rankdata = _lazy_function("scipy.stats", "rankdata")
 
 
 # Alpha001 to Alpha012: each function assumes sub_df is already filtered by symbol and date window
@@ -91,12 +95,11 @@ def alpha_004(sub_df: _pd.DataFrame) -> float:
 def alpha_005(sub_df: _pd.DataFrame) -> float:
     if len(sub_df) < 7:
         return _np.nan
-    ts_high = _pd.Series(sub_df["HighPrice"].to_numpy()[-7:]).rank(pct=True)
-    ts_volume = _pd.Series(sub_df["Volume"].to_numpy()[-7:]).rank(pct=True)
-    ts_df = _pd.DataFrame({"high": ts_high, "volume": ts_volume})
-    corr_series = ts_df["high"].rolling(window=5).corr(ts_df["volume"])
-    corr_clean = corr_series.replace([_np.inf, -_np.inf], _np.nan).dropna()
-    return -1 * corr_clean.max() if not corr_clean.empty else _np.nan
+    ts_high = _rankdata(sub_df["HighPrice"].to_numpy()[-7:]) / 7
+    ts_volume = _rankdata(sub_df["Volume"].to_numpy()[-7:]) / 7
+    corr_series = _ts_corr(ts_high[:, None], ts_volume[:, None], 5)[-3:, 0]
+    corr_clean = corr_series[_np.isfinite(corr_series)]
+    return -1 * corr_clean.max() if corr_clean.size else _np.nan
 
 
 def alpha_006(sub_df: _pd.DataFrame) -> float:
@@ -1,6 +1,9 @@
 import pandas as _pd
 import numpy as _np
-from scipy.stats import rankdata as _rankdata
+
+from ..._lazy import lazy_function as _lazy_function
+
+_rankdata = _lazy_function("scipy.stats", "rankdata")
 
 
 def alpha_025(sub_df: _pd.DataFrame) -> float:
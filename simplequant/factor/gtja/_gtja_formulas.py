@@ -0,0 +1,34 @@
+# Formula text (see `factor.formula`) of the panel alphas whose computation the
+# expression language reproduces. Evaluated with the alpha's lookback and input
+# columns as warm-up, each gives the same values as `PANEL_ALPHAS[name]`, which
+# lets the batch evaluator share their intermediates. Alphas built from
+# within-window ranks or correlations (001, 005), band rules (004), tick-level
+# special cases (002, 003), a time index (024) or quantiles (025, 026) are absent
+# and run as whole panel functions.
+
+PANEL_FORMULAS = {
+    "alpha_006": "-1 * CORR(OPEN, VOLUME, 10)",
+    "alpha_007": "-1 * SIGNEDPOWER(CLOSE - MEAN(VOLUME, 20), 2 / 3)",
+    "alpha_008": "-1 * CORR(OPEN, VOLUME, 10)",
+    "alpha_009": "TSMAX(VOLUME, 5) / (MEAN(VOLUME, 5) + 1e-9)",
+    "alpha_010": "-1 * TSRANK(CLOSE, 6)",
+    "alpha_011": "CLOSE - MEAN(CLOSE, 9)",
+    "alpha_012": "TSRANK(VOLUME, 7) / 7",
+    "alpha_013": "STD(CLOSE, 12) / (MEAN(CLOSE, 12) + 1e-9)",
+    "alpha_014": "(TSMAX(HIGH, 6) - TSMIN(LOW, 6)) / (MEAN(HIGH, 6) + 1e-9)",
+    "alpha_015": "-1 * (CLOSE - DELAY(CLOSE, 4))",
+    "alpha_016": "MEAN(CLOSE, 10)",
+    "alpha_017": "STD(CLOSE, 5)",
+    "alpha_018": "TSRANK(HIGH, 9)",
+    "alpha_019": "TSMIN(LOW, 12)",
+    "alpha_020": "TSMAX(CLOSE, 20)",
+    "alpha_021": "MEAN(OPEN, 5)",
+    "alpha_022": "STD(HIGH, 10)",
+    "alpha_023": "MEAN(CLOSE, 3) - DELAY(MEAN(CLOSE, 3), 3)",
+    "alpha_027": "VOLUME / (MEAN(VOLUME, 15) + 1e-9)",
+    "alpha_028": "TSRANK(CLOSE, 9)",
+    "alpha_029": "CLOSE - DELAY(CLOSE, 14)",
+    "alpha_030": "STD(CLOSE, 10) / (MEAN(CLOSE, 10) + 1e-9)",
+}
+
+__all__ = ["PANEL_FORMULAS"]
@@ -0,0 +1,377 @@
+import functools as _functools
+
+import numpy as _np
+import pandas as _pd
+
+from ...panel import Panel as _Panel, to_panel as _to_panel
+from ...precision import get_storage_dtype as _get_storage_dtype
+from ..operators import (
+    delay as _delay,
+    rolling_window as _rolling_window,
+    ts_corr as _ts_corr,
+    ts_max as _ts_max,
+    ts_mean as _ts_mean,
+    ts_min as _ts_min,
+    ts_quantile as _ts_quantile,
+    ts_rank as _ts_rank,
+    ts_std as _ts_std,
+    ts_sum as _ts_sum,
+)
+
+
+# Panel versions of the GTJA alphas. Each function takes a mapping of field name to
+# a (n_dates, n_symbols) array and returns the factor for every date and symbol at
+# once. Row t holds the value the per-window function returns for a sub_df ending
+# on date t, and NaN where fewer than `lookback` consecutive bars are available.
+# `lookback` and the input columns are declared once with `_alpha` and exposed as
+# attributes of each function. Intermediates are float64; the result is cast to
+# the storage dtype.
+
+
+def _warmup(out: _np.ndarray, lookback: int, *inputs: _np.ndarray) -> _np.ndarray:
+    """Set `out` to NaN wherever the trailing `lookback` bars are not all present."""
+    present = _np.ones(out.shape)
+    for x in inputs:
+        present[_np.isnan(x)] = 0.0
+    out[~(_ts_sum(present, lookback) == lookback)] = _np.nan
+    return out
+
+
+def _alpha(lookback: int, *columns: str):
+    """Declare an alpha's lookback and input columns and apply its warm-up."""
+
+    def decorate(func):
+        @_functools.wraps(func)
+        def wrapper(p) -> _np.ndarray:
+            out = _warmup(func(p), lookback, *(p[c] for c in columns))
+            return out.astype(_get_storage_dtype(), copy=False)
+
+        wrapper.lookback = lookback
+        wrapper.columns = columns
+        return wrapper
+
+    return decorate
+
+
+def _rank(win: _np.ndarray) -> _np.ndarray:
+    """Average-tie ranks (1-based) within each window, like `scipy.stats.rankdata`."""
+    a = win[..., :, None]
+    b = win[..., None, :]
+    less = (b < a).sum(axis=-1)
+    equal = (b == a).sum(axis=-1)
+    ranks = less + (equal + 1) / 2.0
+    ranks[_np.isnan(win).any(axis=-1)] = _np.nan
+    return ranks
+
+
+def _corr(a: _np.ndarray, b: _np.ndarray) -> _np.ndarray:
+    """Pearson correlation along the last axis, NaN where either side is constant."""
+    da = a - a.mean(axis=-1, keepdims=True)
+    db = b - b.mean(axis=-1, keepdims=True)
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        corr = (da * db).sum(axis=-1) / _np.sqrt(
+            (da * da).sum(axis=-1) * (db * db).sum(axis=-1)
+        )
+    return _np.clip(corr, -1.0, 1.0)
+
+
+@_alpha(7, "OpenPrice", "ClosePrice", "Volume")
+def alpha_001(p) -> _np.ndarray:
+    open_price, close, volume = p["OpenPrice"], p["ClosePrice"], p["Volume"]
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        log_volume = _np.log(volume)
+        delta_log_volume = log_volume - _delay(log_volume, 1)
+    daily_change = (close - open_price) / open_price
+    # RANK here is taken within each 6-day window, so the correlation is per window
+    out = -1 * _corr(
+        _rank(_rolling_window(delta_log_volume, 6)),
+        _rank(_rolling_window(daily_change, 6)),
+    )
+    return out
+
+
+@_alpha(2, "HighPrice", "LowPrice", "ClosePrice")
+def alpha_002(p) -> _np.ndarray:
+    high, low, close = p["HighPrice"], p["LowPrice"], p["ClosePrice"]
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        x = (2 * close - low - high) / (high - low)
+    x[high == low] = _np.nan
+    out = -1 * (x - _delay(x, 1))
+    return out
+
+
+@_alpha(7, "HighPrice", "LowPrice", "ClosePrice")
+def alpha_003(p) -> _np.ndarray:
+    high, low, close = p["HighPrice"], p["LowPrice"], p["ClosePrice"]
+    prev = _delay(close, 1)
+    term = _np.where(
+        close < prev,
+        close - _np.maximum(high, prev),
+        close - _np.minimum(low, prev),
+    )
+    term[close == prev] = 0.0
+    out = _ts_sum(term, 6)
+    return out
+
+
+@_alpha(20, "ClosePrice", "Volume")
+def alpha_004(p) -> _np.ndarray:
+    close, volume = p["ClosePrice"], p["Volume"]
+    avg_8 = _ts_mean(close, 8)
+    std_8 = _ts_std(close, 8)
+    avg_2 = _ts_mean(close, 2)
+    mean_volume_20 = _ts_mean(volume, 20)
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        volume_ratio = volume / mean_volume_20
+
+    # Tick-sized prices often put avg_2 exactly on a band edge, where the outcome
+    # depends on rounding. Settle those cells with the per-window statistics.
+    tol = 1e-9 * _np.abs(avg_2)
+    near = (_np.abs(avg_8 + std_8 - avg_2) <= tol) | (
+        _np.abs(avg_8 - std_8 - avg_2) <= tol
+    )
+    if near.any():
+        rows, cols = _np.nonzero(near)
+        win_8 = _rolling_window(close, 8)[rows, cols]
+        avg_8[rows, cols] = win_8.mean(axis=-1)
+        std_8[rows, cols] = win_8.std(axis=-1)
+        avg_2[rows, cols] = win_8[:, -2:].mean(axis=-1)
+
+    out = _np.where(
+        avg_8 + std_8 < avg_2,
+        -1.0,
+        _np.where(avg_2 < avg_8 - std_8, 1.0, _np.where(volume_ratio >= 1, 1.0, -1.0)),
+    )
+    return out
+
+
+@_alpha(7, "HighPrice", "Volume")
+def alpha_005(p) -> _np.ndarray:
+    high, volume = p["HighPrice"], p["Volume"]
+    ts_high = _rank(_rolling_window(high, 7))
+    ts_volume = _rank(_rolling_window(volume, 7))
+    # Rolling 5-day correlations inside each 7-day window: sub-windows 0..4, 1..5, 2..6
+    corrs = _np.stack(
+        [_corr(ts_high[..., i : i + 5], ts_volume[..., i : i + 5]) for i in range(3)],
+        axis=-1,
+    )
+    corrs[~_np.isfinite(corrs)] = _np.nan
+    all_nan = _np.isnan(corrs).all(axis=-1)
+    corrs[all_nan] = 0.0
+    out = -1 * _np.nanmax(corrs, axis=-1)
+    out[all_nan] = _np.nan
+    return out
+
+
+@_alpha(10, "OpenPrice", "Volume")
+def alpha_006(p) -> _np.ndarray:
+    open_price, volume = p["OpenPrice"], p["Volume"]
+    out = -1 * _ts_corr(open_price, volume, 10)
+    return out
+
+
+@_alpha(20, "ClosePrice", "Volume")
+def alpha_007(p) -> _np.ndarray:
+    close, volume = p["ClosePrice"], p["Volume"]
+    diff = close - _ts_mean(volume, 20)
+    out = -1 * _np.cbrt(diff * _np.abs(diff))
+    return out
+
+
+@_alpha(10, "OpenPrice", "Volume")
+def alpha_008(p) -> _np.ndarray:
+    return -1 * _ts_corr(p["OpenPrice"], p["Volume"], 10)
+
+
+@_alpha(5, "Volume")
+def alpha_009(p) -> _np.ndarray:
+    volume = p["Volume"]
+    out = _ts_max(volume, 5) / (_ts_mean(volume, 5) + 1e-9)
+    return out
+
+
+@_alpha(6, "ClosePrice")
+def alpha_010(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = -1 * _ts_rank(close, 6)
+    return out
+
+
+@_alpha(9, "ClosePrice")
+def alpha_011(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = close - _ts_mean(close, 9)
+    return out
+
+
+@_alpha(7, "Volume")
+def alpha_012(p) -> _np.ndarray:
+    volume = p["Volume"]
+    out = _ts_rank(volume, 7) / 7.0
+    return out
+
+
+@_alpha(12, "ClosePrice")
+def alpha_013(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = _ts_std(close, 12) / (_ts_mean(close, 12) + 1e-9)
+    return out
+
+
+@_alpha(6, "HighPrice", "LowPrice")
+def alpha_014(p) -> _np.ndarray:
+    high, low = p["HighPrice"], p["LowPrice"]
+    out = (_ts_max(high, 6) - _ts_min(low, 6)) / (_ts_mean(high, 6) + 1e-9)
+    return out
+
+
+@_alpha(5, "ClosePrice")
+def alpha_015(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = -1 * (close - _delay(close, 4))
+    return out
+
+
+@_alpha(10, "ClosePrice")
+def alpha_016(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = _ts_mean(close, 10)
+    return out
+
+
+@_alpha(5, "ClosePrice")
+def alpha_017(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = _ts_std(close, 5)
+    return out
+
+
+@_alpha(9, "HighPrice")
+def alpha_018(p) -> _np.ndarray:
+    high = p["HighPrice"]
+    out = _ts_rank(high, 9)
+    return out
+
+
+@_alpha(12, "LowPrice")
+def alpha_019(p) -> _np.ndarray:
+    low = p["LowPrice"]
+    out = _ts_min(low, 12)
+    return out
+
+
+@_alpha(20, "ClosePrice")
+def alpha_020(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = _ts_max(close, 20)
+    return out
+
+
+@_alpha(5, "OpenPrice")
+def alpha_021(p) -> _np.ndarray:
+    open_price = p["OpenPrice"]
+    out = _ts_mean(open_price, 5)
+    return out
+
+
+@_alpha(10, "HighPrice")
+def alpha_022(p) -> _np.ndarray:
+    high = p["HighPrice"]
+    out = _ts_std(high, 10)
+    return out
+
+
+@_alpha(6, "ClosePrice")
+def alpha_023(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    mean_3 = _ts_mean(close, 3)
+    out = mean_3 - _delay(mean_3, 3)
+    return out
+
+
+@_alpha(8, "Volume")
+def alpha_024(p) -> _np.ndarray:
+    volume = p["Volume"]
+    time_index = _np.broadcast_to(
+        _np.arange(len(volume), dtype=float)[:, None], volume.shape
+    )
+    out = _ts_corr(time_index, volume, 8)
+    return out
+
+
+@_alpha(20, "ClosePrice")
+def alpha_025(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = _ts_quantile(close, 20, 75)
+    return out
+
+
+@_alpha(20, "ClosePrice")
+def alpha_026(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = _ts_quantile(close, 20, 25)
+    return out
+
+
+@_alpha(15, "Volume")
+def alpha_027(p) -> _np.ndarray:
+    volume = p["Volume"]
+    out = volume / (_ts_mean(volume, 15) + 1e-9)
+    return out
+
+
+@_alpha(9, "ClosePrice")
+def alpha_028(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = _ts_rank(close, 9)
+    return out
+
+
+@_alpha(15, "ClosePrice")
+def alpha_029(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = close - _delay(close, 14)
+    return out
+
+
+@_alpha(10, "ClosePrice")
+def alpha_030(p) -> _np.ndarray:
+    close = p["ClosePrice"]
+    out = _ts_std(close, 10) / (_ts_mean(close, 10) + 1e-9)
+    return out
+
+
+PANEL_ALPHAS = {
+    name: func
+    for name, func in globals().items()
+    if name.startswith("alpha_") and callable(func)
+}
+
+
+def compute_panel(data: _Panel | _pd.DataFrame, name: str) -> _pd.DataFrame:
+    """
+    Compute a GTJA alpha for every date and symbol in one vectorized pass.
+
+    The result at (date, symbol) equals the per-window function (e.g.
+    `gtja.alpha_001`) applied to that symbol's history ending on that date.
+    Symbols need `lookback` consecutive bars before a value is produced; a
+    missing bar restarts the warm-up.
+
+    Args:
+        data (Panel | pd.DataFrame): A `Panel`, or long-format market data in the
+            layout of `data/sample_data.csv` which is pivoted first.
+        name (str): Alpha name, e.g. "alpha_001".
+
+    Returns:
+        pd.DataFrame: Date×Symbol factor matrix.
+
+    Raises:
+        ValueError: If `name` has no panel implementation.
+    """
+    if name not in PANEL_ALPHAS:
+        raise ValueError(
+            f"Unknown alpha '{name}'. Must be one of: {', '.join(PANEL_ALPHAS)}."
+        )
+    func = PANEL_ALPHAS[name]
+    panel = data if isinstance(data, _Panel) else _to_panel(data, list(func.columns))
+    return panel.to_frame(func(panel))
@@ -0,0 +1,303 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# Rolling time-series operators on (n_dates, n_symbols) arrays.
+#
+# Every operator works on all symbols at once and returns an array of the input's
+# shape. Row t covers the trailing window ending at row t; rows without a full
+# window, and windows containing a NaN, are NaN.
+#
+# Window reductions (sum, max, min) use block prefix/suffix scans (van Herk /
+# Gil-Werman): the dates are cut into blocks of `window` rows, each block is
+# scanned forwards and backwards once, and every window is the combination of one
+# suffix and one prefix. That is O(1) work per element regardless of the window,
+# like a running sum or a monotonic deque, but vectorized across dates and symbols.
+# Partial sums never span more than two blocks, so there is no drift from a
+# history-long cumulative sum.
+#
+# float32 inputs are upcast before any sum, product or square is formed, so the
+# running moments behind ts_var, ts_cov and ts_corr are accumulated in float64.
+
+
+def rolling_window(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Strided view of the trailing windows of `x`.
+
+    Args:
+        x (np.ndarray): Array of shape (n_dates, n_symbols).
+        window (int): Window length.
+
+    Returns:
+        np.ndarray: Read-only view of shape (n_dates, n_symbols, window). The
+            first `window - 1` rows are padded with NaN.
+    """
+    _check_window(window)
+    pad = np.full((window - 1, x.shape[1]), np.nan)
+    return sliding_window_view(np.vstack([pad, x]), window, axis=0)
+
+
+def delay(x: np.ndarray, periods: int) -> np.ndarray:
+    """DELAY(x, periods): value `periods` rows earlier."""
+    out = np.full(x.shape, np.nan)
+    if periods == 0:
+        out[:] = x
+    elif periods < len(x):
+        out[periods:] = x[:-periods]
+    return out
+
+
+def delta(x: np.ndarray, periods: int) -> np.ndarray:
+    """DELTA(x, periods): x - DELAY(x, periods)."""
+    return x - delay(x, periods)
+
+
+def ts_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """SUM(x, window)."""
+    return _block_reduce(x, window, np.add)
+
+
+def ts_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """MEAN(x, window)."""
+    return ts_sum(x, window) / window
+
+
+def ts_max(x: np.ndarray, window: int) -> np.ndarray:
+    """TSMAX(x, window)."""
+    return _block_reduce(x, window, np.maximum)
+
+
+def ts_min(x: np.ndarray, window: int) -> np.ndarray:
+    """TSMIN(x, window)."""
+    return _block_reduce(x, window, np.minimum)
+
+
+def ts_std(x: np.ndarray, window: int, ddof: int = 0) -> np.ndarray:
+    """
+    STD(x, window), computed from running sums and sums of squares.
+
+    Constant windows return exactly 0.
+
+    Args:
+        x (np.ndarray): Array of shape (n_dates, n_symbols).
+        window (int): Window length.
+        ddof (int): Delta degrees of freedom, as in `np.std`. Defaults to 0.
+
+    Returns:
+        np.ndarray: Rolling standard deviation.
+    """
+    return np.sqrt(ts_var(x, window, ddof=ddof))
+
+
+def ts_var(x: np.ndarray, window: int, ddof: int = 0) -> np.ndarray:
+    """Rolling variance; see `ts_std`."""
+    x = np.asarray(x, dtype=float)
+    mean = ts_mean(x, window)
+    var = np.maximum(ts_mean(x * x, window) - mean * mean, 0.0)
+    var[ts_max(x, window) == ts_min(x, window)] = 0.0
+    return var * (window / (window - ddof))
+
+
+def ts_cov(x: np.ndarray, y: np.ndarray, window: int, ddof: int = 0) -> np.ndarray:
+    """COV(x, y, window), computed from running sums of x, y and x*y."""
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    cov = ts_mean(x * y, window) - ts_mean(x, window) * ts_mean(y, window)
+    return cov * (window / (window - ddof))
+
+
+def ts_corr(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """
+    CORR(x, y, window): rolling Pearson correlation.
+
+    Windows where either input is constant are NaN, matching `np.corrcoef`.
+    Results are clipped to [-1, 1].
+    """
+    denominator = np.sqrt(ts_var(x, window) * ts_var(y, window))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = ts_cov(x, y, window) / denominator
+    corr[denominator == 0] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def ts_regbeta(y: np.ndarray, x: np.ndarray, window: int) -> np.ndarray:
+    """
+    REGBETA(y, x, window): least-squares slope of y on x (with intercept) in the window.
+
+    Windows where x is constant are NaN.
+    """
+    var = ts_var(x, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = ts_cov(x, y, window) / var
+    beta[var == 0] = np.nan
+    return beta
+
+
+def ts_regresi(y: np.ndarray, x: np.ndarray, window: int) -> np.ndarray:
+    """REGRESI(y, x, window): residual of the latest row of the fit in `ts_regbeta`."""
+    y, x = np.asarray(y, dtype=float), np.asarray(x, dtype=float)
+    beta = ts_regbeta(y, x, window)
+    return y - ts_mean(y, window) - beta * (x - ts_mean(x, window))
+
+
+def ts_trend(y: np.ndarray, window: int) -> np.ndarray:
+    """
+    REGBETA(y, SEQUENCE(window)): slope of y on the row numbers 1..window.
+
+    A fixed weighted window sum, since the regressor is the same in every window.
+    """
+    centered = np.arange(window, dtype=float) - (window - 1) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = centered / (centered @ centered)
+    return rolling_window(y, window) @ weights
+
+
+def ts_trend_resid(y: np.ndarray, window: int) -> np.ndarray:
+    """REGRESI(y, SEQUENCE(window)): residual of the latest row of `ts_trend`."""
+    y = np.asarray(y, dtype=float)
+    return y - ts_mean(y, window) - ts_trend(y, window) * (window - 1) / 2
+
+
+def ts_rank(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    TSRANK(x, window): 1-based rank of the latest value within its window.
+
+    Ties get the average rank, as in `scipy.stats.rankdata`. Each window is
+    compared against its last element once, so the cost is one vectorized
+    comparison per element and window slot.
+    """
+    win = rolling_window(x, window)
+    last = x[:, :, None]
+    ranks = (win < last).sum(axis=-1) + ((win == last).sum(axis=-1) + 1) / 2.0
+    ranks[np.isnan(win).any(axis=-1)] = np.nan
+    return ranks
+
+
+def ts_quantile(x: np.ndarray, window: int, q: float) -> np.ndarray:
+    """
+    Rolling percentile `q` (0-100) with linear interpolation, as in `np.percentile`.
+
+    Uses a partial sort (selection) of every window rather than a full sort.
+    """
+    return np.percentile(rolling_window(x, window), q, axis=-1)
+
+
+def sma(x: np.ndarray, n: int, m: int) -> np.ndarray:
+    """
+    GTJA SMA(x, n, m): Y[t] = (m * x[t] + (n - m) * Y[t-1]) / n.
+
+    The recursion starts from the first value and restarts after a NaN.
+    """
+    if not 0 < m <= n:
+        raise ValueError(f"SMA requires 0 < m <= n; got n={n}, m={m}.")
+    alpha = m / n
+    out = np.empty(x.shape)
+    prev = np.full(x.shape[1], np.nan)
+    for t in range(len(x)):
+        prev = np.where(np.isnan(prev), x[t], alpha * x[t] + (1 - alpha) * prev)
+        out[t] = prev
+    return out
+
+
+def decay_linear(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    DECAYLINEAR(x, window): weighted mean with weights 1..window, latest heaviest.
+
+    Uses sum(w_j * x_j) = sum(j * x_j) - (t - window) * sum(x_j) over the window,
+    so only two running sums are needed.
+    """
+    t = np.arange(len(x), dtype=float)[:, None]
+    weighted = ts_sum(t * x, window) - (t - window) * ts_sum(x, window)
+    return weighted / (window * (window + 1) / 2)
+
+
+def ts_prod(x: np.ndarray, window: int) -> np.ndarray:
+    """PROD(x, window)."""
+    return _block_reduce(x, window, np.multiply)
+
+
+def ts_argmax(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    TS_ARGMAX(x, window): 1-based position of the window maximum, oldest row first.
+
+    Ties resolve to the earliest row. `window - ts_argmax` is GTJA's HIGHDAY.
+    """
+    return _window_argext(x, window, np.argmax)
+
+
+def ts_argmin(x: np.ndarray, window: int) -> np.ndarray:
+    """TS_ARGMIN(x, window): 1-based position of the window minimum; see `ts_argmax`."""
+    return _window_argext(x, window, np.argmin)
+
+
+def wma(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    GTJA WMA(x, window): weighted mean with weight 0.9**i for the value i rows ago.
+    """
+    weights = 0.9 ** np.arange(window - 1, -1, -1, dtype=float)
+    return rolling_window(x, window) @ (weights / weights.sum())
+
+
+def _window_argext(x: np.ndarray, window: int, func) -> np.ndarray:
+    win = rolling_window(x, window)
+    out = func(win, axis=-1) + 1.0
+    out[np.isnan(win).any(axis=-1)] = np.nan
+    return out
+
+
+def _check_window(window: int) -> None:
+    if window < 1:
+        raise ValueError(f"window must be a positive integer; got window={window}.")
+
+
+def _block_reduce(x: np.ndarray, window: int, op: np.ufunc) -> np.ndarray:
+    _check_window(window)
+    x = np.asarray(x, dtype=float)
+    n_dates, n_symbols = x.shape
+    if window == 1:
+        return x.copy()
+
+    # Pad so that row t of the output is the window ending at padded row t + window - 1
+    n_padded = -(-(n_dates + window - 1) // window) * window
+    padded = np.full((n_padded, n_symbols), np.nan)
+    padded[window - 1 : window - 1 + n_dates] = x
+
+    blocks = padded.reshape(-1, window, n_symbols)
+    prefix = op.accumulate(blocks, axis=1).reshape(n_padded, n_symbols)
+    suffix = op.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(
+        n_padded, n_symbols
+    )
+
+    start = np.arange(n_dates)
+    end = start + window - 1
+    out = op(suffix[start], prefix[end])
+    # Windows aligned with a block are the block prefix alone
+    aligned = start % window == 0
+    out[aligned] = prefix[end[aligned]]
+    return out
+
+
+__all__ = [
+    "rolling_window",
+    "delay",
+    "delta",
+    "ts_sum",
+    "ts_mean",
+    "ts_max",
+    "ts_min",
+    "ts_std",
+    "ts_var",
+    "ts_cov",
+    "ts_corr",
+    "ts_regbeta",
+    "ts_regresi",
+    "ts_trend",
+    "ts_trend_resid",
+    "ts_rank",
+    "ts_quantile",
+    "sma",
+    "decay_linear",
+    "ts_prod",
+    "ts_argmax",
+    "ts_argmin",
+    "wma",
+]
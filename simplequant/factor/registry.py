@@ -0,0 +1,251 @@
+from dataclasses import dataclass
+from typing import Callable, Literal, Mapping
+
+import numpy as np
+import pandas as pd
+
+from ..panel import OHLCV_COLUMNS, Panel, to_panel
+from . import gtja
+
+OutputType = Literal["float", "rank", "sign"]
+
+
+@dataclass(frozen=True)
+class FactorSpec:
+    """
+    Declared metadata of one factor.
+
+    Attributes:
+        name (str): Factor name, e.g. "alpha_001".
+        lookback (int): Number of trailing bars the factor needs for one value.
+        columns (tuple[str, ...]): Input columns, e.g. ("ClosePrice", "Volume").
+        output (OutputType): "float" for continuous values, "rank" for time-series
+            ranks, "sign" for values in {-1, 1}.
+        func (Callable): Per-window function taking a single-symbol `sub_df`.
+        panel_func (Callable): Panel function taking a mapping of field name to
+            (n_dates, n_symbols) array.
+    """
+
+    name: str
+    lookback: int
+    columns: tuple[str, ...]
+    output: OutputType
+    func: Callable[[pd.DataFrame], float]
+    panel_func: Callable[[Mapping[str, np.ndarray]], np.ndarray]
+
+
+REGISTRY: dict[str, FactorSpec] = {}
+
+
+def register_factor(spec: FactorSpec) -> FactorSpec:
+    """
+    Add a factor to the registry.
+
+    Raises:
+        ValueError: If a factor with the same name is already registered.
+    """
+    if spec.name in REGISTRY:
+        raise ValueError(f"Factor '{spec.name}' is already registered.")
+    REGISTRY[spec.name] = spec
+    return spec
+
+
+def get_factor_specs(names: list[str] | None = None) -> list[FactorSpec]:
+    """
+    Look up registered factors.
+
+    Args:
+        names (list[str], optional): Factor names. Defaults to every registered factor.
+
+    Returns:
+        list[FactorSpec]: Specs in the order of `names`.
+
+    Raises:
+        ValueError: If a name is not registered.
+    """
+    if names is None:
+        return list(REGISTRY.values())
+    unknown = [n for n in names if n not in REGISTRY]
+    if unknown:
+        raise ValueError(f"Unknown factors: {unknown}")
+    return [REGISTRY[n] for n in names]
+
+
+def required_columns(names: list[str] | None = None) -> list[str]:
+    """Union of the input columns of `names`, in OHLCV order."""
+    used = {c for spec in get_factor_specs(names) for c in spec.columns}
+    return [c for c in OHLCV_COLUMNS if c in used] + sorted(
+        used.difference(OHLCV_COLUMNS)
+    )
+
+
+def required_lookback(names: list[str] | None = None) -> int:
+    """Largest lookback among `names`."""
+    return max(spec.lookback for spec in get_factor_specs(names))
+
+
+def group_by_lookback(names: list[str] | None = None) -> dict[int, list[str]]:
+    """Group factor names by shared lookback, longest first."""
+    groups: dict[int, list[str]] = {}
+    for spec in get_factor_specs(names):
+        groups.setdefault(spec.lookback, []).append(spec.name)
+    return dict(sorted(groups.items(), reverse=True))
+
+
+def trim_history(
+    df: pd.DataFrame,
+    names: list[str] | None = None,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """
+    Keep only the columns and history rows needed to compute `names` on [start, end].
+
+    Args:
+        df (pd.DataFrame): Long-format market data with "Symbol" and "Date" columns.
+        names (list[str], optional): Factor names. Defaults to every registered factor.
+        start (str | pd.Timestamp, optional): First output date. Defaults to the
+            first date in `df`.
+        end (str | pd.Timestamp, optional): Last output date. Defaults to the last
+            date in `df`.
+
+    Returns:
+        pd.DataFrame: Rows from `lookback - 1` trading dates before `start` up to
+            `end`, with "Symbol", "Date" and the required columns. "Date" is parsed.
+    """
+    columns = required_columns(names)
+    lookback = required_lookback(names)
+    dates = pd.to_datetime(df["Date"])
+
+    keep = np.ones(len(df), dtype=bool)
+    if start is not None:
+        trading_dates = np.sort(dates.unique())
+        first = np.searchsorted(trading_dates, pd.Timestamp(start).to_datetime64())
+        first -= lookback - 1
+        if first >= len(trading_dates):
+            keep[:] = False
+        elif first > 0:
+            keep &= dates >= trading_dates[first]
+    if end is not None:
+        keep &= dates <= pd.Timestamp(end)
+
+    out = df.loc[keep, ["Symbol", "Date", *columns]]
+    return out.assign(Date=dates[keep])
+
+
+def load_csv(
+    path: str,
+    names: list[str] | None = None,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """
+    Read a CSV in the layout of `data/sample_data.csv`, loading only what `names` need.
+
+    See `trim_history` for the returned rows and columns.
+    """
+    df = pd.read_csv(path, usecols=["Symbol", "Date", *required_columns(names)])
+    return trim_history(df, names, start=start, end=end)
+
+
+def compute_factors(
+    data: Panel | pd.DataFrame,
+    names: list[str] | None = None,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Compute factor panels for `names`, limited to the dates in [start, end].
+
+    Long-format input is trimmed with `trim_history` first, so only the required
+    columns and history rows are pivoted.
+
+    Returns:
+        dict[str, pd.DataFrame]: Factor name to Date×Symbol matrix.
+    """
+    specs = get_factor_specs(names)
+    names = [spec.name for spec in specs]
+    if not isinstance(data, Panel):
+        data = to_panel(
+            trim_history(data, names, start=start, end=end), required_columns(names)
+        )
+
+    rows = np.ones(len(data.dates), dtype=bool)
+    if start is not None:
+        rows &= data.dates >= pd.Timestamp(start)
+    if end is not None:
+        rows &= data.dates <= pd.Timestamp(end)
+    return {spec.name: data.to_frame(spec.panel_func(data))[rows] for spec in specs}
+
+
+def compute_latest(df: pd.DataFrame, names: list[str] | None = None) -> pd.DataFrame:
+    """
+    Evaluate the per-window functions on the latest date of every symbol.
+
+    Each symbol's history is cut once to the longest lookback and then to each
+    group's lookback, so every call gets exactly the rows it reads. Symbols with
+    too little history get NaN without calling the function.
+
+    Args:
+        df (pd.DataFrame): Long-format market data sorted by date within each symbol.
+        names (list[str], optional): Factor names. Defaults to every registered factor.
+
+    Returns:
+        pd.DataFrame: Factor values indexed by Symbol with one column per factor.
+    """
+    specs = get_factor_specs(names)
+    groups = group_by_lookback([spec.name for spec in specs])
+    history = df.groupby("Symbol", sort=True).tail(max(groups))
+
+    values = {}
+    for symbol, sub_df in history.groupby("Symbol", sort=True):
+        row = {}
+        for lookback, group in groups.items():
+            if len(sub_df) < lookback:
+                row.update(dict.fromkeys(group, np.nan))
+                continue
+            window = sub_df.iloc[-lookback:]
+            row.update({n: REGISTRY[n].func(window) for n in group})
+        values[symbol] = row
+
+    out = pd.DataFrame.from_dict(
+        values, orient="index", columns=[s.name for s in specs]
+    )
+    out.index.name = "Symbol"
+    return out.astype(float)
+
+
+_GTJA_OUTPUT: dict[str, OutputType] = {
+    "alpha_004": "sign",
+    "alpha_010": "rank",
+    "alpha_012": "rank",
+    "alpha_018": "rank",
+    "alpha_028": "rank",
+}
+
+for _name, _panel_func in gtja.PANEL_ALPHAS.items():
+    register_factor(
+        FactorSpec(
+            name=_name,
+            lookback=_panel_func.lookback,
+            columns=tuple(_panel_func.columns),
+            output=_GTJA_OUTPUT.get(_name, "float"),
+            func=getattr(gtja, _name),
+            panel_func=_panel_func,
+        )
+    )
+
+
+__all__ = [
+    "FactorSpec",
+    "REGISTRY",
+    "register_factor",
+    "get_factor_specs",
+    "required_columns",
+    "required_lookback",
+    "group_by_lookback",
+    "trim_history",
+    "load_csv",
+    "compute_factors",
+    "compute_latest",
+]
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+
+from .registry import (
+    get_factor_specs,
+    group_by_lookback,
+    required_columns,
+    required_lookback,
+)
+
+
+class StreamingCalculator:
+    """
+    Incremental daily calculator for the GTJA panel alphas.
+
+    Keeps the last `window` bars of every symbol in ring buffers, where `window` is
+    the largest lookback of the requested alphas (e.g. 20 for `alpha_004`). Each
+    call to `update` appends one cross-section of bars and evaluates every alpha on
+    its own lookback only, so the cost depends on the number of symbols and not on
+    the length of the history. Values equal the rows `gtja.compute_panel` would
+    produce for the same dates.
+
+    Args:
+        names (list[str], optional): Factor names. Defaults to every registered factor.
+        symbols (list, optional): Initial symbol universe. Symbols first seen in
+            `update` are appended automatically.
+
+    Raises:
+        ValueError: If a factor name is unknown.
+    """
+
+    def __init__(self, names: list[str] | None = None, symbols: list | None = None):
+        self.names = [spec.name for spec in get_factor_specs(names)]
+        self.columns = required_columns(self.names)
+        self.window = required_lookback(self.names)
+        self.symbols = pd.Index([] if symbols is None else symbols, name="Symbol")
+        self.last_date: pd.Timestamp | None = None
+        self._head = 0  # slot of the next bar; the oldest bar once the buffer is full
+        self._buffers = {
+            c: np.full((self.window, len(self.symbols)), np.nan) for c in self.columns
+        }
+
+    def update(
+        self, bars: pd.DataFrame, date: str | pd.Timestamp | None = None
+    ) -> pd.DataFrame:
+        """
+        Append one trading day of bars and return that day's factor values.
+
+        Args:
+            bars (pd.DataFrame): One row per symbol, with a "Symbol" column or a
+                Symbol index, and the OHLCV columns used by the alphas. A "Date"
+                column is used when `date` is not given. Symbols without a bar
+                get NaN for this date, which restarts their warm-up.
+            date (str | pd.Timestamp, optional): Trading date of the bars.
+
+        Returns:
+            pd.DataFrame: Factor values indexed by Symbol with one column per alpha.
+
+        Raises:
+            ValueError: If the date is missing, not after the last update, or a
+                required column is missing.
+        """
+        if "Symbol" in bars.columns:
+            bars = bars.set_index("Symbol")
+        if date is None:
+            if "Date" not in bars.columns or bars["Date"].nunique() != 1:
+                raise ValueError(
+                    "bars must contain a single 'Date' or date must be given"
+                )
+            date = bars["Date"].iloc[0]
+        date = pd.Timestamp(date)
+        if self.last_date is not None and date <= self.last_date:
+            raise ValueError(
+                f"date must be after the last update; got {date.date()} <= {self.last_date.date()}."
+            )
+        missing = [c for c in self.columns if c not in bars.columns]
+        if missing:
+            raise ValueError(f"Missing columns in bars: {missing}")
+
+        new_symbols = bars.index.difference(self.symbols)
+        if len(new_symbols) > 0:
+            self._add_symbols(new_symbols)
+
+        codes = self.symbols.get_indexer(bars.index)
+        for c in self.columns:
+            row = np.full(len(self.symbols), np.nan)
+            row[codes] = bars[c].to_numpy(dtype=float)
+            self._buffers[c][self._head] = row
+        self._head = (self._head + 1) % self.window
+        self.last_date = date
+
+        # Chronological row order, oldest first
+        order = (self._head + np.arange(self.window)) % self.window
+        result = pd.DataFrame(np.nan, index=self.symbols, columns=self.names)
+        for lookback, group in group_by_lookback(self.names).items():
+            tail = {c: b[order[-lookback:]] for c, b in self._buffers.items()}
+            for spec in get_factor_specs(group):
+                result[spec.name] = spec.panel_func(tail)[-1]
+
+        return result
+
+    def state_dict(self) -> dict[str, np.ndarray]:
+        """
+        Return the calculator state as plain NumPy arrays.
+
+        The buffers are stored oldest bar first, so the state does not depend on
+        the ring position.
+        """
+        order = (self._head + np.arange(self.window)) % self.window
+        symbols = self.symbols.to_numpy()
+        if symbols.dtype == object:
+            symbols = symbols.astype(str)
+        state = {
+            "names": np.array(self.names),
+            "symbols": symbols,
+            "last_date": np.array(
+                "NaT" if self.last_date is None else self.last_date.to_datetime64(),
+                dtype="datetime64[ns]",
+            ),
+        }
+        for c, b in self._buffers.items():
+            state[f"buffer_{c}"] = b[order]
+        return state
+
+    @classmethod
+    def from_state_dict(cls, state: dict[str, np.ndarray]) -> "StreamingCalculator":
+        """Rebuild a calculator from `state_dict` output."""
+        calc = cls(names=[str(n) for n in state["names"]], symbols=state["symbols"])
+        last_date = state["last_date"]
+        calc.last_date = None if np.isnat(last_date) else pd.Timestamp(last_date[()])
+        for c in calc.columns:
+            buffer = np.asarray(state[f"buffer_{c}"], dtype=float)
+            if buffer.shape != calc._buffers[c].shape:
+                raise ValueError(
+                    f"buffer_{c} must have shape {calc._buffers[c].shape}; got {buffer.shape}."
+                )
+            calc._buffers[c] = buffer.copy()
+        return calc
+
+    def save(self, path: str) -> None:
+        """Write the state to an `.npz` file."""
+        np.savez(path, **self.state_dict())
+
+    @classmethod
+    def load(cls, path: str) -> "StreamingCalculator":
+        """Restore a calculator written by `save`."""
+        with np.load(path, allow_pickle=False) as state:
+            return cls.from_state_dict(dict(state))
+
+    def _add_symbols(self, new_symbols: pd.Index) -> None:
+        self.symbols = pd.Index([*self.symbols, *new_symbols], name="Symbol")
+        pad = np.full((self.window, len(new_symbols)), np.nan)
+        for c in self.columns:
+            self._buffers[c] = np.hstack([self._buffers[c], pad])
+
+
+__all__ = ["StreamingCalculator"]
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from ..panel import Panel, to_panel
+from ..precision import storage_dtype
+from .registry import compute_factors, get_factor_specs, required_columns
+
+
+# Accuracy checks for reduced-precision storage.
+#
+# Every factor is computed twice from the same data: once with float64 fields and
+# float64 storage (the reference), once with the fields rounded to the candidate
+# dtype and that dtype as storage, i.e. what a float32 pipeline would produce.
+
+
+def precision_report(
+    data: Panel | pd.DataFrame,
+    names: list[str] | None = None,
+    dtype="float32",
+    rtol: float = 1e-4,
+) -> pd.DataFrame:
+    """
+    Maximum deviation of each factor from its float64 result under `dtype` storage.
+
+    Args:
+        data (Panel | pd.DataFrame): A `Panel`, or long-format market data.
+        names (list[str], optional): Factor names. Defaults to every registered factor.
+        dtype: Storage dtype to check. Defaults to float32.
+        rtol (float): Largest accepted `max_rel_dev`. Defaults to 1e-4.
+
+    Returns:
+        pd.DataFrame: One row per factor, indexed by name, with columns
+            - max_abs_dev: largest |value - reference| over cells finite in both.
+            - max_rel_dev: max_abs_dev divided by the largest |reference|, so it
+              stays meaningful for factors that cross zero.
+            - nan_mismatch: number of cells NaN in exactly one of the two results.
+            - passed: max_rel_dev <= rtol and no NaN mismatch.
+
+    Note:
+        Rank and sign factors are discrete: a tie broken differently after rounding
+        moves a value by a whole step, which shows up as a large deviation on few
+        cells rather than a small one everywhere.
+    """
+    names = [spec.name for spec in get_factor_specs(names)]
+    if not isinstance(data, Panel):
+        data = to_panel(data, required_columns(names), dtype=np.float64)
+    data = data.astype(np.float64)
+
+    with storage_dtype(np.float64):
+        reference = compute_factors(data, names)
+    with storage_dtype(dtype):
+        reduced = compute_factors(data.astype(dtype), names)
+
+    rows = {}
+    for name in names:
+        ref = reference[name].to_numpy()
+        val = reduced[name].to_numpy(dtype=float)
+        both = np.isfinite(ref) & np.isfinite(val)
+        abs_dev = np.abs(val[both] - ref[both]).max(initial=0.0)
+        scale = np.abs(ref[both]).max(initial=0.0)
+        rel_dev = abs_dev / scale if scale > 0 else abs_dev
+        rows[name] = {
+            "max_abs_dev": abs_dev,
+            "max_rel_dev": rel_dev,
+            "nan_mismatch": int((np.isnan(ref) != np.isnan(val)).sum()),
+        }
+
+    report = pd.DataFrame.from_dict(rows, orient="index")
+    report.index.name = "factor"
+    report["passed"] = (report["max_rel_dev"] <= rtol) & (report["nan_mismatch"] == 0)
+    return report
+
+
+__all__ = ["precision_report"]
@@ -0,0 +1,288 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .analytics import _as_returns
+from .ingest import AlphaCube
+
+
+# Fama-MacBeth cross-sectional regressions over a full history.
+#
+# On every date t the returns of the valid stocks are regressed on their factor
+# exposures; the coefficients are that date's factor returns. The dates are
+# solved a chunk at a time over the (n_dates, n_symbols, n_regressors) design
+# cube, with the same masking as `neutralize_cube`: invalid stocks are zero rows,
+# so each date's solution is the least-squares fit on its own valid stocks. The
+# work is in batched matrix products forming the (K, K) normal equations of every
+# date, centered like `regress_model` when there is an intercept; their
+# pseudo-inverse gives the minimum-norm solution for rank-deficient exposures.
+# Forming X'X squares the condition number, which is harmless for factor
+# exposures but makes near-collinear directions drop out sooner than in an
+# SVD-based fit.
+#
+# The time-series mean of the factor returns is tested with Newey-West (Bartlett
+# kernel) standard errors, which allow for autocorrelated factor returns, e.g.
+# from overlapping forward returns.
+
+
+@dataclass
+class FamaMacBethResult:
+    """
+    Output of `fama_macbeth`. Every frame is indexed by date.
+
+    Attributes:
+        factor_returns (pd.DataFrame): Cross-sectional regression coefficients,
+            columns "intercept" (if fitted) then the factors. NaN on dates with
+            fewer than `min_obs` valid stocks.
+        metrics (pd.DataFrame): Per-date MSE, RMSE, MAE and R2 of the fit on the
+            valid stocks, as `evaluate_regression_model` reports them.
+        n_obs (pd.Series): Valid stocks per date.
+    """
+
+    factor_returns: pd.DataFrame
+    metrics: pd.DataFrame
+    n_obs: pd.Series
+
+    @property
+    def r2(self) -> pd.Series:
+        """Per-date R²."""
+        return self.metrics["R2"]
+
+    def summary(self, lags: int | None = None) -> pd.DataFrame:
+        """
+        Mean factor returns and their Fama-MacBeth and Newey-West t-statistics.
+
+        Args:
+            lags (int, optional): Newey-West lags. Defaults to
+                floor(4 * (T / 100) ** (2 / 9)) for T fitted dates.
+
+        Returns:
+            pd.DataFrame: Indexed by factor with columns mean, std, t_stat
+                (mean / (std / sqrt(T))), nw_se, nw_t_stat and n_dates.
+        """
+        returns = self.factor_returns.dropna()
+        values = returns.to_numpy()
+        n = len(values)
+        if lags is None:
+            lags = int(np.floor(4 * (n / 100) ** (2 / 9))) if n else 0
+        if lags < 0:
+            raise ValueError(f"lags must be non-negative; got {lags}.")
+
+        mean = values.mean(axis=0) if n else np.full(values.shape[1], np.nan)
+        std = values.std(axis=0, ddof=1) if n > 1 else np.full_like(mean, np.nan)
+        nw_se = np.sqrt(_newey_west_variance(values, lags) / n) if n else mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t_stat = mean / (std / np.sqrt(n))
+            nw_t_stat = mean / nw_se
+        return pd.DataFrame(
+            {
+                "mean": mean,
+                "std": std,
+                "t_stat": t_stat,
+                "nw_se": nw_se,
+                "nw_t_stat": nw_t_stat,
+                "n_dates": n,
+            },
+            index=pd.Index(returns.columns, name="factor"),
+        )
+
+
+def _newey_west_variance(values: np.ndarray, lags: int) -> np.ndarray:
+    # Long-run variance of each column: gamma_0 + 2 * sum_j (1 - j / (L + 1)) gamma_j
+    n = len(values)
+    centered = values - values.mean(axis=0)
+    variance = np.einsum("tk,tk->k", centered, centered) / n
+    for j in range(1, min(lags, n - 1) + 1):
+        gamma = np.einsum("tk,tk->k", centered[j:], centered[:-j]) / n
+        variance += 2 * (1 - j / (lags + 1)) * gamma
+    return variance
+
+
+def _fit_chunk(
+    y: np.ndarray,
+    x: np.ndarray,
+    valid: np.ndarray,
+    w: np.ndarray | None,
+    fit_intercept: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Coefficients (c, p) and [MSE, RMSE, MAE, R2] (c, 4) of a chunk of dates."""
+    y = np.where(valid, y, 0.0)
+    x = np.where(valid[:, :, None], x, 0.0)
+    # Per-stock weights of the fit and the metrics, zero for invalid stocks
+    wts = valid.astype(float) if w is None else np.where(valid, w, 0.0)
+    xw = x if w is None else x * wts[:, :, None]
+
+    # Normal equations from batched matrix products. With an intercept they are
+    # centered on each date's (weighted) means, as in `regress_model`, and the
+    # intercept follows from the means
+    total = wts.sum(axis=1)
+    xwt = xw.transpose(0, 2, 1)
+    gram = xwt @ x
+    # X'Wy and X'W1 (the weighted column sums) in one product
+    rhs = np.stack([y if w is None else wts * y, wts], axis=2)
+    moment, x_sum = np.moveaxis(x.transpose(0, 2, 1) @ rhs, 2, 0)
+    if fit_intercept:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x_mean = x_sum / total[:, None]
+            y_mean = np.einsum("cn,cn->c", wts, y) / total
+        gram -= total[:, None, None] * x_mean[:, :, None] * x_mean[:, None, :]
+        moment -= (total * y_mean)[:, None] * x_mean
+        gram[total == 0] = 0.0
+        moment[total == 0] = 0.0
+
+    # The pseudo-inverse of the small Gram matrices gives the minimum-norm
+    # least-squares solution
+    eigval, eigvec = np.linalg.eigh(gram)
+    n_valid = valid.sum(axis=1)
+    tol = eigval.max(axis=1, initial=0.0) * np.maximum(n_valid, gram.shape[2])
+    keep = eigval > (tol * np.finfo(float).eps)[:, None]
+    with np.errstate(divide="ignore"):
+        inv = np.where(keep, 1.0 / eigval, 0.0)
+    projected = (eigvec.transpose(0, 2, 1) @ moment[:, :, None])[:, :, 0]
+    beta = (eigvec @ (inv * projected)[:, :, None])[:, :, 0]
+
+    residual = y - (x @ beta[:, :, None])[:, :, 0]
+    coef = beta
+    if fit_intercept:
+        intercept = y_mean - np.einsum("cp,cp->c", x_mean, beta)
+        residual -= intercept[:, None] * valid
+        coef = np.column_stack([intercept, beta])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ss_res = np.einsum("cn,cn,cn->c", wts, residual, residual)
+        mse = ss_res / total
+        mae = np.einsum("cn,cn->c", wts, np.abs(residual)) / total
+        deviation = y - (np.einsum("cn,cn->c", wts, y) / total)[:, None]
+        ss_tot = np.einsum("cn,cn,cn->c", wts, deviation, deviation)
+        r2 = np.where(ss_tot != 0, 1 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+    return coef, np.column_stack([mse, np.sqrt(mse), mae, r2])
+
+
+def fama_macbeth(
+    returns: pd.DataFrame | np.ndarray,
+    exposures: np.ndarray | AlphaCube,
+    factor_names: list[str] | None = None,
+    mask: np.ndarray | None = None,
+    weights: np.ndarray | None = None,
+    fit_intercept: bool = True,
+    min_obs: int | None = None,
+    max_memory_mb: float = 512.0,
+) -> FamaMacBethResult:
+    """
+    Fama-MacBeth regressions of returns on factor exposures, for every date at once.
+
+    On each date, the stocks with a finite return, finite exposures to every
+    factor and, if given, `mask` set are regressed by least squares (weighted if
+    `weights` is given). Up to rounding, the coefficients of a date equal
+    `regress_model` on its valid stocks, and its metrics equal
+    `evaluate_regression_model` with the intercept as the first column.
+
+    Returns and exposures are taken on the same dates: to estimate the returns
+    earned by exposures known on date t, pass the forward returns of t, e.g.
+    `calculate_forward_returns(df)["Fwd1"].unstack("Symbol")`.
+
+    Args:
+        returns (pd.DataFrame | np.ndarray): Date×Symbol returns, an array of
+            shape (n_dates, n_symbols), or the output of `calculate_daily_return`.
+            With an `AlphaCube`, a DataFrame is aligned to the cube's dates and
+            symbols; otherwise it must already match the exposures.
+        exposures (np.ndarray | AlphaCube): Factor exposures, shape
+            (n_dates, n_symbols, n_factors), e.g. from `AlphaMatrixIngestor.stack`.
+        factor_names (list[str], optional): Factor names. Default to the cube's
+            factors, or "factor_0", "factor_1", ... for an array.
+        mask (np.ndarray, optional): Boolean universe, shape (n_dates, n_symbols).
+        weights (np.ndarray, optional): Non-negative regression weights, shape
+            (n_dates, n_symbols), e.g. market caps. Stocks with NaN weights are
+            left out.
+        fit_intercept (bool): Whether to include an intercept. Defaults to True.
+        min_obs (int, optional): Minimum valid stocks per date; dates with fewer
+            are NaN. Defaults to the number of regressors plus one.
+        max_memory_mb (float): Approximate memory budget of one chunk of dates.
+
+    Returns:
+        FamaMacBethResult: Factor returns, per-date metrics and stock counts;
+            `summary()` gives the Newey-West t-statistics.
+
+    Raises:
+        ValueError: If the shapes are inconsistent or weights are negative.
+    """
+    if isinstance(exposures, AlphaCube):
+        cube = exposures
+        if isinstance(returns, pd.DataFrame):
+            returns = _as_returns(returns).reindex(
+                index=cube.dates, columns=cube.symbols
+            )
+        dates, exposures = cube.dates, cube.values
+        factor_names = factor_names or list(cube.factors)
+    elif isinstance(returns, pd.DataFrame):
+        returns = _as_returns(returns)
+        dates = returns.index
+    else:
+        dates = pd.RangeIndex(len(returns), name="Date")
+    y_all = np.asarray(returns, dtype=float)
+
+    if exposures.ndim != 3:
+        raise ValueError(
+            f"exposures must be 3-D (n_dates, n_symbols, n_factors); got shape={exposures.shape}."
+        )
+    n_dates, n_symbols, n_factors = exposures.shape
+    if y_all.shape != (n_dates, n_symbols):
+        raise ValueError(
+            f"returns must have shape (n_dates, n_symbols); got returns.shape={y_all.shape}, exposures.shape={exposures.shape}."
+        )
+    for name, array in (("mask", mask), ("weights", weights)):
+        if array is not None and array.shape != (n_dates, n_symbols):
+            raise ValueError(
+                f"{name} must have shape (n_dates, n_symbols); got {name}.shape={array.shape}, exposures.shape={exposures.shape}."
+            )
+    if weights is not None and (np.asarray(weights) < 0).any():
+        raise ValueError("weights must be non-negative.")
+    if factor_names is None:
+        factor_names = [f"factor_{k}" for k in range(n_factors)]
+    if len(factor_names) != n_factors:
+        raise ValueError(
+            f"factor_names must have one name per factor; got {len(factor_names)} names for {n_factors} factors."
+        )
+    n_regressors = n_factors + int(fit_intercept)
+    if min_obs is None:
+        min_obs = n_regressors + 1
+
+    valid = np.isfinite(y_all) & np.isfinite(exposures).all(axis=2)
+    if mask is not None:
+        valid &= mask
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)
+        valid &= np.isfinite(weights)
+    n_obs = valid.sum(axis=1)
+
+    # Masked and weighted exposures and a few per-stock vectors of one date
+    bytes_per_date = 8 * n_symbols * (2 * n_factors + 6)
+    chunk = max(1, int(max_memory_mb * 2**20 // max(bytes_per_date, 1)))
+
+    coef = np.full((n_dates, n_regressors), np.nan)
+    metrics = np.full((n_dates, 4), np.nan)
+    for start in range(0, n_dates, chunk):
+        rows = slice(start, start + chunk)
+        coef[rows], metrics[rows] = _fit_chunk(
+            y_all[rows],
+            np.asarray(exposures[rows], dtype=float),
+            valid[rows],
+            None if weights is None else weights[rows],
+            fit_intercept,
+        )
+    too_few = n_obs < min_obs
+    coef[too_few] = np.nan
+    metrics[too_few] = np.nan
+
+    index = pd.Index(dates, name="Date")
+    columns = (["intercept"] if fit_intercept else []) + list(factor_names)
+    return FamaMacBethResult(
+        factor_returns=pd.DataFrame(coef, index=index, columns=columns),
+        metrics=pd.DataFrame(
+            metrics, index=index, columns=["MSE", "RMSE", "MAE", "R2"]
+        ),
+        n_obs=pd.Series(n_obs, index=index, name="n_obs"),
+    )
+
+
+__all__ = ["FamaMacBethResult", "fama_macbeth"]
@@ -1,8 +1,11 @@
 # Import packages and library will be used
+import numpy as np
 import pandas as pd
-from typing import List, Any
+from typing import Iterator, List, Any, Sequence
 
-pd.options.display.float_format = "{:.2f}".format
+from .ingest import AlphaMatrixIngestor
+
+_INGESTOR = AlphaMatrixIngestor()
 
 
 def ddb_alpha_matrix_to_df(alpha_matrix: Any) -> pd.DataFrame:
@@ -14,11 +17,99 @@ def ddb_alpha_matrix_to_df(alpha_matrix: Any) -> pd.DataFrame:
         alpha_matrix (List [Any]): The return result from DolphinDB gtjaAlpha191 Module (Using Python Connector).
 
     Returns:
-        The Pandas Dataframe of the same dataset.
+        The Pandas Dataframe of the same dataset, indexed by Date with one column
+        per ticker. It wraps the values without copying them, and the date and
+        ticker indexes are parsed once and reused by later calls with the same
+        labels. Use `AlphaMatrixIngestor.stack` to combine many alphas.
+    """
+    return _INGESTOR.to_frame(alpha_matrix)
+
+
+class _SymbolSeries:
     """
-    values, dates, tickers = alpha_matrix
-    df = pd.DataFrame(values, index=pd.to_datetime(dates), columns=tickers)
-    return df
+    Per-symbol time series of a long frame with MultiIndex ['Date', 'Symbol'].
+
+    A dense frame sorted by Date then Symbol (every symbol on every date) is
+    viewed as a (n_dates, n_symbols) array, so shifting a symbol's series by k
+    observations is shifting by k rows. Otherwise rows are sorted by symbol and
+    date once (a stable sort by symbol if already sorted by date), which makes
+    each symbol's rows contiguous, and a shift is only valid within a symbol.
+    String dates are parsed first, so the order is chronological.
+    """
+
+    def __init__(self, index: pd.MultiIndex):
+        # String dates (e.g. "01/02/2018") do not sort chronologically; only the
+        # distinct dates of the level need parsing
+        level = index.levels[0]
+        if not isinstance(level, pd.DatetimeIndex):
+            index = index.set_levels(pd.to_datetime(level), level="Date")
+        codes = np.asarray(index.codes[1])
+        n_symbols = int(codes.max()) + 1 if len(codes) else 0
+        n_dates, rest = divmod(len(codes), max(n_symbols, 1))
+        self.dense = (
+            index.is_monotonic_increasing
+            and rest == 0
+            and np.array_equal(
+                codes.reshape(n_dates, n_symbols),
+                np.broadcast_to(np.arange(n_symbols), (n_dates, n_symbols)),
+            )
+        )
+        if self.dense:
+            self.shape = (n_dates, n_symbols)
+        elif index.is_monotonic_increasing:
+            self.order = np.argsort(codes, kind="stable")
+            self.codes = codes[self.order]
+        else:
+            self.order = np.lexsort((index.get_level_values("Date"), codes))
+            self.codes = codes[self.order]
+
+    def gather(self, values: np.ndarray) -> np.ndarray:
+        return values.reshape(self.shape) if self.dense else values[self.order]
+
+    def scatter(self, arranged: np.ndarray) -> np.ndarray:
+        if self.dense:
+            return arranged.ravel()
+        out = np.empty_like(arranged)
+        out[self.order] = arranged
+        return out
+
+    def shift(self, x: np.ndarray, lag: int) -> np.ndarray:
+        """Value `lag` observations earlier (later for negative `lag`), NaN if none."""
+        out = np.full(x.shape, np.nan)
+        if lag == 0 or abs(lag) >= len(x):
+            return x.copy() if lag == 0 else out
+        if lag > 0:
+            out[lag:] = x[:-lag]
+        else:
+            out[:lag] = x[-lag:]
+        if not self.dense:
+            same = np.zeros(len(x), dtype=bool)
+            if lag > 0:
+                same[lag:] = self.codes[lag:] == self.codes[:-lag]
+            else:
+                same[:lag] = self.codes[:lag] == self.codes[-lag:]
+            out[~same] = np.nan
+        return out
+
+    def ffill(self, x: np.ndarray) -> np.ndarray:
+        """Fill NaN with the symbol's last valid value (leading NaN stay NaN)."""
+        if len(x) == 0:
+            return x.copy()
+        positions = np.arange(len(x)).reshape(-1, *[1] * (x.ndim - 1))
+        keep = ~np.isnan(x)
+        if self.dense:
+            keep[0] = True
+        else:
+            keep[np.r_[True, self.codes[1:] != self.codes[:-1]]] = True
+        source = np.maximum.accumulate(np.where(keep, positions, 0), axis=0)
+        return np.take_along_axis(x, source, axis=0)
+
+
+def _check_price_frame(df: pd.DataFrame) -> None:
+    if not isinstance(df.index, pd.MultiIndex) or df.index.names != ["Date", "Symbol"]:
+        raise ValueError("Input must have MultiIndex ['Date', 'Symbol']")
+    if "ClosePrice" not in df.columns:
+        raise ValueError("Missing 'ClosePrice' column in input")
 
 
 def calculate_daily_return(df: pd.DataFrame) -> pd.DataFrame:
@@ -27,11 +118,17 @@ def calculate_daily_return(df: pd.DataFrame) -> pd.DataFrame:
 
     Assumes:
         - df uses MultiIndex ['Date', 'Symbol']
-        - df is already sorted by ['Date', 'Symbol']
+        - df is sorted by ['Date', 'Symbol'] (fastest; other orders are sorted
+          internally)
         - df contains a 'ClosePrice' column
 
     Does NOT modify the original DataFrame.
 
+    Returns are array shifts within each symbol instead of a groupby; dense sorted
+    panels are a reshape with no sort at all, and other row orders are sorted
+    internally. As with `pct_change`, a missing close is filled with the symbol's
+    previous close.
+
     Args:
         df (pd.DataFrame): MultiIndex DataFrame with 'ClosePrice'
 
@@ -40,24 +137,154 @@ def calculate_daily_return(df: pd.DataFrame) -> pd.DataFrame:
             - 'ClosePrice': copied from original df
             - 'Return': daily return per stock, grouped by Symbol
     """
-    if not isinstance(df.index, pd.MultiIndex) or df.index.names != ["Date", "Symbol"]:
-        raise ValueError("Input must have MultiIndex ['Date', 'Symbol']")
-    if "ClosePrice" not in df.columns:
-        raise ValueError("Missing 'ClosePrice' column in input")
+    _check_price_frame(df)
 
-    # Calculate the return rate without change the original DataFrame
-    rtn = df.groupby(level="Symbol")["ClosePrice"].pct_change()
+    series = _SymbolSeries(df.index)
+    close = series.gather(df["ClosePrice"].to_numpy(dtype=float))
+    filled = series.ffill(close)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rtn = series.scatter(filled / series.shift(filled, 1) - 1.0)
 
     # Return the new DataFrame with the original indexing
     return pd.DataFrame({"ClosePrice": df["ClosePrice"], "Return": rtn}, index=df.index)
 
 
-def get_single_day_info(df: pd.DataFrame, date: str) -> pd.DataFrame:
+def calculate_forward_returns(
+    df: pd.DataFrame, horizons: Sequence[int] = (1, 5, 10, 20)
+) -> pd.DataFrame:
+    """
+    Daily and forward returns per stock, simple and log, in one pass.
+
+    Takes the layout of `calculate_daily_return` (MultiIndex ['Date', 'Symbol'],
+    'ClosePrice' column), fastest when sorted by Date then Symbol. Horizons count
+    observations of each symbol, i.e. trading days. Missing closes are not
+    filled: any return touching one is NaN.
+
+    Args:
+        df (pd.DataFrame): MultiIndex DataFrame with 'ClosePrice'.
+        horizons (Sequence[int]): Forward horizons. Defaults to (1, 5, 10, 20).
+
+    Returns:
+        pd.DataFrame: Same index as `df`, with columns
+            - 'Return', 'LogReturn': from the previous close to this close.
+            - 'Fwd{h}', 'LogFwd{h}' for each h: from this close to the close h
+              days later (NaN for the last h days of each symbol). These are the
+              labels for the IC and regression of a factor observed at this close.
+
+    Raises:
+        ValueError: If the layout is wrong or a horizon is not a positive integer.
+    """
+    _check_price_frame(df)
+    horizons = [int(h) for h in horizons]
+    if min(horizons, default=0) < 1:
+        raise ValueError(f"horizons must be positive integers; got {horizons}.")
+
+    series = _SymbolSeries(df.index)
+    close = series.gather(df["ClosePrice"].to_numpy(dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_close = np.log(close)
+        columns = {"Return": close / series.shift(close, 1) - 1.0}
+        columns["LogReturn"] = log_close - series.shift(log_close, 1)
+        for h in horizons:
+            columns[f"Fwd{h}"] = series.shift(close, -h) / close - 1.0
+        for h in horizons:
+            columns[f"LogFwd{h}"] = series.shift(log_close, -h) - log_close
+    return pd.DataFrame(
+        {name: series.scatter(values) for name, values in columns.items()},
+        index=df.index,
+    )
+
+
+class DayIndex:
+    """
+    Date to row-range index over long-format data, for per-day lookups.
+
+    The dates are parsed once here (e.g. the "01/02/2018" strings of
+    `data/sample_data.csv`), the rows are stably sorted by date if they are not
+    already, and the first row of every date is recorded. A lookup is then a
+    binary search plus a positional slice, which pandas returns without copying
+    the data, instead of a boolean scan over the whole frame.
+
+    Args:
+        df (pd.DataFrame): Long-format data with a "Date" column, or a MultiIndex
+            with a 'Date' level (as from `calculate_daily_return`).
+        date_format (str, optional): `strftime` format of string dates, e.g.
+            "%m/%d/%Y". Inferred by default.
+
+    Attributes:
+        frame (pd.DataFrame): The data sorted by date, with parsed dates.
+        dates (pd.DatetimeIndex): Distinct dates, ascending.
+
+    Example:
+        >>> days = DayIndex(pd.read_csv("data/sample_data.csv"))
+        >>> for date, day in days:
+        ...     ...
+    """
+
+    def __init__(self, df: pd.DataFrame, date_format: str | None = None):
+        if "Date" in df.columns:
+            df = df.assign(Date=pd.to_datetime(df["Date"], format=date_format))
+            keys = df["Date"].to_numpy()
+        elif isinstance(df.index, pd.MultiIndex) and "Date" in df.index.names:
+            # Only the distinct dates of the level need parsing
+            level = pd.to_datetime(
+                df.index.levels[df.index.names.index("Date")], format=date_format
+            )
+            df = df.set_axis(df.index.set_levels(level, level="Date"))
+            keys = df.index.get_level_values("Date").to_numpy()
+        elif df.index.name == "Date":
+            df = df.set_axis(pd.to_datetime(df.index, format=date_format))
+            keys = df.index.to_numpy()
+        else:
+            raise ValueError("No valid date column in DataFrame!")
+
+        if len(keys) and (keys[1:] < keys[:-1]).any():
+            order = np.argsort(keys, kind="stable")
+            df, keys = df.iloc[order], keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else []
+        self.frame = df
+        self.dates = pd.DatetimeIndex(keys[starts], name="Date")
+        self._offsets = np.r_[starts, len(keys)].astype(np.int64)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, date) -> bool:
+        return pd.Timestamp(date) in self.dates
+
+    def __iter__(self) -> Iterator[tuple[pd.Timestamp, pd.DataFrame]]:
+        for i, date in enumerate(self.dates):
+            yield date, self.frame.iloc[self._offsets[i] : self._offsets[i + 1]]
+
+    def day(self, date) -> pd.DataFrame:
+        """Rows of one date (any format `pd.Timestamp` parses); empty if absent."""
+        i = self.dates.searchsorted(pd.Timestamp(date))
+        if i == len(self.dates) or self.dates[i] != pd.Timestamp(date):
+            return self.frame.iloc[:0]
+        return self.frame.iloc[self._offsets[i] : self._offsets[i + 1]]
+
+    def between(self, start=None, end=None) -> pd.DataFrame:
+        """Rows with `start <= Date <= end`; either bound may be omitted."""
+        first = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start))
+        last = (
+            len(self.dates)
+            if end is None
+            else self.dates.searchsorted(pd.Timestamp(end), side="right")
+        )
+        return self.frame.iloc[self._offsets[first] : self._offsets[max(first, last)]]
+
+
+def get_single_day_info(df: pd.DataFrame | DayIndex, date: str) -> pd.DataFrame:
     """
     Get the return rate of each stock at the given date, ignoring time component.
 
+    Given a `DayIndex`, the rows are a slice found by binary search; build the
+    index once and reuse it when looking up many dates. A plain DataFrame is
+    scanned with a boolean mask on every call.
+
     Args:
-        df (pd.DataFrame): The full DataFrame containing all symbol and date data.
+        df (pd.DataFrame | DayIndex): The full DataFrame containing all symbol and
+            date data, or a `DayIndex` over it.
         date (str): Date (YYYY-MM-DD) to filter.
 
     Returns:
@@ -65,6 +292,8 @@ def get_single_day_info(df: pd.DataFrame, date: str) -> pd.DataFrame:
     """
     # target_date = pd.to_datetime(date).date()
 
+    if isinstance(df, DayIndex):
+        return df.day(date)
     if "Date" in df.columns:
         return df[df["Date"] == date]
     else:
@@ -73,6 +302,8 @@ def get_single_day_info(df: pd.DataFrame, date: str) -> pd.DataFrame:
 
 __all__ = [
     "calculate_daily_return",
+    "calculate_forward_returns",
     "get_single_day_info",
+    "DayIndex",
     "ddb_alpha_matrix_to_df",
 ]
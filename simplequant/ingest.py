@@ -0,0 +1,309 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .precision import resolve_dtype
+
+_SOURCE_VERSION = 1
+
+
+# Bulk ingestion of DolphinDB alpha matrices.
+#
+# The gtjaAlpha191 module returns every alpha as a `(values, dates, tickers)`
+# triple with the same row and column labels. `AlphaMatrixIngestor` wraps the
+# values in a DataFrame without copying them and parses each distinct label array
+# once: a label array equal to a cached one (usually the very same object) reuses
+# its index, so matrices that share their dates and tickers share one
+# `pd.DatetimeIndex` and one `pd.Index`. `stack` copies many matrices once, into
+# a Date×Symbol×Factor cube.
+#
+# `LocalAlphaSource` replays matrices saved with `save_alpha_matrices`, returning
+# the same triples as the connector (values memory-mapped, each label array
+# loaded once), so the path can be tested and benchmarked without a server.
+
+
+def _labels_key(labels) -> str:
+    hashed = pd.util.hash_array(np.asarray(labels))
+    return hashlib.blake2b(hashed.tobytes(), digest_size=16).hexdigest()
+
+
+class AlphaMatrixIngestor:
+    """
+    Convert `(values, dates, tickers)` alpha matrices with cached label indexes.
+
+    Args:
+        max_cached (int): Number of distinct date indexes, and of ticker indexes,
+            to keep; the least recently used is dropped first. Defaults to 8.
+
+    Attributes:
+        hits (int): Label lookups served from the cache.
+        misses (int): Label arrays that had to be parsed.
+    """
+
+    def __init__(self, max_cached: int = 8):
+        if max_cached < 1:
+            raise ValueError(f"max_cached must be at least 1; got {max_cached}.")
+        self.max_cached = max_cached
+        self._indexes: dict[str, list[tuple[np.ndarray, pd.Index]]] = {
+            "dates": [],
+            "tickers": [],
+        }
+        self.hits = 0
+        self.misses = 0
+
+    def _index(self, labels, kind: str) -> pd.Index:
+        # Most recently used first; the same array object is a hit without a compare
+        labels = np.asarray(labels)
+        cache = self._indexes[kind]
+        for i, (cached, index) in enumerate(cache):
+            if cached is labels or (
+                cached.shape == labels.shape
+                and cached.dtype == labels.dtype
+                and np.array_equal(cached, labels)
+            ):
+                self.hits += 1
+                cache.insert(0, cache.pop(i))
+                return index
+        self.misses += 1
+        if kind == "dates":
+            index = pd.DatetimeIndex(pd.to_datetime(labels), name="Date")
+        else:
+            index = pd.Index(labels, name="Symbol")
+        cache.insert(0, (labels, index))
+        del cache[self.max_cached :]
+        return index
+
+    def indexes(self, alpha_matrix: Any) -> tuple[pd.DatetimeIndex, pd.Index]:
+        """Cached (dates, tickers) indexes of one matrix."""
+        _, dates, tickers = alpha_matrix
+        return self._index(dates, "dates"), self._index(tickers, "tickers")
+
+    def to_frame(self, alpha_matrix: Any) -> pd.DataFrame:
+        """
+        Date×Symbol DataFrame over the matrix's values, without copying them.
+
+        Raises:
+            ValueError: If the values do not match the label lengths.
+        """
+        values = np.asarray(alpha_matrix[0])
+        dates, tickers = self.indexes(alpha_matrix)
+        if values.shape != (len(dates), len(tickers)):
+            raise ValueError(
+                f"values must have shape (n_dates, n_tickers); got values.shape={values.shape}, n_dates={len(dates)}, n_tickers={len(tickers)}."
+            )
+        return pd.DataFrame(values, index=dates, columns=tickers, copy=False)
+
+    def stack(self, matrices: Mapping[str, Any], dtype=None) -> "AlphaCube":
+        """
+        Stack alpha matrices into one Date×Symbol×Factor cube.
+
+        Matrices that share their labels (the usual case) are copied straight
+        into the cube. Otherwise the cube spans the union of all dates and
+        tickers and missing cells are NaN.
+
+        Args:
+            matrices (Mapping[str, Any]): Alpha name to `(values, dates, tickers)`.
+            dtype (optional): Cube dtype. Defaults to the storage dtype.
+
+        Returns:
+            AlphaCube: The stacked alphas, factors in the order of `matrices`.
+        """
+        if not matrices:
+            raise ValueError("matrices must contain at least one alpha matrix.")
+        labels = {name: self.indexes(m) for name, m in matrices.items()}
+        dates, symbols = next(iter(labels.values()))
+        shared = all(d is dates and s is symbols for d, s in labels.values())
+        if not shared:
+            for d, s in labels.values():
+                dates, symbols = dates.union(d), symbols.union(s)
+
+        cube = np.full(
+            (len(dates), len(symbols), len(matrices)),
+            np.nan,
+            dtype=resolve_dtype(dtype),
+        )
+        if shared:
+            # Fill a few dates at a time: the factor axis is the innermost, so the
+            # writes of one block stay in cache instead of striding the whole cube
+            arrays = [np.asarray(m[0]) for m in matrices.values()]
+            step = max(1, 2**23 // max(cube[0].nbytes, 1))
+            for start in range(0, len(dates), step):
+                block = cube[start : start + step]
+                for k, values in enumerate(arrays):
+                    block[:, :, k] = values[start : start + step]
+        else:
+            for k, (name, matrix) in enumerate(matrices.items()):
+                d, s = labels[name]
+                rows, cols = dates.get_indexer(d), symbols.get_indexer(s)
+                cube[rows[:, None], cols[None, :], k] = np.asarray(matrix[0])
+        return AlphaCube(
+            values=cube, dates=dates, symbols=symbols, factors=list(matrices)
+        )
+
+
+@dataclass
+class AlphaCube:
+    """
+    Alphas stacked as one (n_dates, n_symbols, n_factors) array.
+
+    This is the layout `neutralize_cube` takes.
+
+    Attributes:
+        values (np.ndarray): The cube.
+        dates (pd.DatetimeIndex): Row labels.
+        symbols (pd.Index): Column labels.
+        factors (list[str]): Alpha names along the last axis.
+    """
+
+    values: np.ndarray
+    dates: pd.DatetimeIndex
+    symbols: pd.Index
+    factors: list[str]
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """Date×Symbol DataFrame of one alpha (a view of the cube)."""
+        try:
+            k = self.factors.index(name)
+        except ValueError:
+            raise KeyError(
+                f"Factor '{name}' is not in the cube; available: {self.factors}"
+            ) from None
+        return pd.DataFrame(
+            self.values[:, :, k], index=self.dates, columns=self.symbols, copy=False
+        )
+
+    def frames(self) -> dict[str, pd.DataFrame]:
+        """Every alpha as a DataFrame, e.g. for `information_coefficient`."""
+        return {name: self.frame(name) for name in self.factors}
+
+
+def save_alpha_matrices(
+    path: str, matrices: Mapping[str, Any], overwrite: bool = False
+) -> "LocalAlphaSource":
+    """
+    Save `(values, dates, tickers)` matrices for replay by `LocalAlphaSource`.
+
+    Values go to one `.npy` file per alpha; every distinct label array is saved
+    once. Like `write_store`, the directory is written elsewhere and renamed.
+
+    Args:
+        path (str): Source directory.
+        matrices (Mapping[str, Any]): Alpha name to `(values, dates, tickers)`,
+            e.g. as pulled from the gtjaAlpha191 module.
+        overwrite (bool): Replace an existing source at `path`. Defaults to False.
+
+    Returns:
+        LocalAlphaSource: The source opened at `path`.
+
+    Raises:
+        FileExistsError: If `path` exists and `overwrite` is False.
+    """
+    path = os.path.abspath(path)
+    if os.path.exists(path) and not overwrite:
+        raise FileExistsError(f"Source already exists at {path}; pass overwrite=True.")
+
+    tmp = tempfile.mkdtemp(prefix=".alphas-", dir=os.path.dirname(path))
+    try:
+        manifest = {}
+        for name, (values, dates, tickers) in matrices.items():
+            keys = {}
+            for kind, labels in (("dates", dates), ("tickers", tickers)):
+                labels = np.asarray(labels)
+                if labels.dtype == object:
+                    labels = labels.astype(str)
+                keys[kind] = f"{kind}-{_labels_key(labels)}"
+                label_path = os.path.join(tmp, f"{keys[kind]}.npy")
+                if not os.path.exists(label_path):
+                    np.save(label_path, labels)
+            np.save(os.path.join(tmp, f"{name}.npy"), np.asarray(values))
+            manifest[name] = keys
+        with open(os.path.join(tmp, "manifest.json"), "w") as f:
+            json.dump({"version": _SOURCE_VERSION, "matrices": manifest}, f)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.replace(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return LocalAlphaSource(path)
+
+
+class LocalAlphaSource:
+    """
+    File-backed stand-in for the DolphinDB alpha source.
+
+    Returns the saved matrices as `(values, dates, tickers)` triples: values are
+    read-only memory maps and each label array is loaded once and shared by all
+    matrices that use it, as the connector does for one query.
+
+    Args:
+        path (str): Directory written by `save_alpha_matrices`.
+
+    Raises:
+        FileNotFoundError: If `path` is not a saved source.
+        ValueError: If it was written by an incompatible version.
+    """
+
+    def __init__(self, path: str):
+        manifest_path = os.path.join(path, "manifest.json")
+        if not os.path.isfile(manifest_path):
+            raise FileNotFoundError(f"No alpha matrix source at {path}")
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get("version") != _SOURCE_VERSION:
+            raise ValueError(
+                f"Unsupported source version {manifest.get('version')}; expected {_SOURCE_VERSION}."
+            )
+        self.path = path
+        self._manifest: dict[str, dict[str, str]] = manifest["matrices"]
+        self._labels: dict[str, np.ndarray] = {}
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._manifest)
+
+    def __len__(self) -> int:
+        return len(self._manifest)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._manifest)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._manifest
+
+    def _label_array(self, key: str) -> np.ndarray:
+        if key not in self._labels:
+            self._labels[key] = np.load(os.path.join(self.path, f"{key}.npy"))
+        return self._labels[key]
+
+    def __getitem__(self, name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if name not in self._manifest:
+            raise KeyError(
+                f"Alpha '{name}' is not in the source; available: {self.names}"
+            )
+        keys = self._manifest[name]
+        values = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+        return (
+            values,
+            self._label_array(keys["dates"]),
+            self._label_array(keys["tickers"]),
+        )
+
+    def fetch(self, names: list[str] | None = None) -> dict[str, tuple]:
+        """Matrices of `names` (default: all), in order."""
+        return {name: self[name] for name in (self.names if names is None else names)}
+
+
+__all__ = [
+    "AlphaMatrixIngestor",
+    "AlphaCube",
+    "save_alpha_matrices",
+    "LocalAlphaSource",
+]
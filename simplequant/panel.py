@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .precision import resolve_dtype
+
+OHLCV_COLUMNS = [
+    "OpenPrice",
+    "HighPrice",
+    "LowPrice",
+    "ClosePrice",
+    "Volume",
+    "Amount",
+]
+
+
+@dataclass
+class Panel:
+    """
+    Dense Date×Symbol market data panel.
+
+    Every field is a float array of shape (n_dates, n_symbols), float64 or
+    float32 depending on the storage dtype (see `simplequant.precision`). Rows follow
+    `dates` (ascending) and columns follow `symbols`. Missing bars are NaN.
+
+    Attributes:
+        dates (pd.DatetimeIndex): Trading dates, sorted ascending.
+        symbols (pd.Index): Security identifiers, sorted ascending.
+        fields (dict[str, np.ndarray]): Field name (e.g. "ClosePrice") to 2-D array.
+    """
+
+    dates: pd.DatetimeIndex
+    symbols: pd.Index
+    fields: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        try:
+            return self.fields[name]
+        except KeyError:
+            raise KeyError(
+                f"Field '{name}' is not in the panel; available: {list(self.fields)}"
+            ) from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.dates), len(self.symbols)
+
+    def to_frame(self, values: np.ndarray) -> pd.DataFrame:
+        """
+        Wrap a (n_dates, n_symbols) array into a Date×Symbol DataFrame.
+
+        Args:
+            values (np.ndarray): Array aligned with this panel.
+
+        Returns:
+            pd.DataFrame: Frame indexed by `dates` with `symbols` as columns.
+        """
+        if values.shape != self.shape:
+            raise ValueError(
+                f"values must have shape {self.shape}; got values.shape={values.shape}."
+            )
+        return pd.DataFrame(values, index=self.dates, columns=self.symbols)
+
+    def astype(self, dtype) -> "Panel":
+        """
+        Copy of the panel with every field cast to `dtype` (float32 or float64).
+
+        Fields that already have `dtype` are shared, not copied.
+        """
+        dtype = resolve_dtype(dtype)
+        return Panel(
+            dates=self.dates,
+            symbols=self.symbols,
+            fields={
+                name: values.astype(dtype, copy=False)
+                for name, values in self.fields.items()
+            },
+        )
+
+
+def to_panel(df: pd.DataFrame, columns: list[str] | None = None, dtype=None) -> Panel:
+    """
+    Pivot long-format market data (one row per Symbol and Date) into a `Panel`.
+
+    Accepts either the layout of `data/sample_data.csv` ("Symbol" and "Date"
+    columns) or a frame with MultiIndex ['Date', 'Symbol']. Dates are parsed once
+    here, so strings such as "01/02/2018" are supported.
+
+    Args:
+        df (pd.DataFrame): Long-format market data.
+        columns (list[str], optional): Fields to load. Defaults to every OHLCV
+            column present in `df`.
+        dtype (optional): Field dtype, float32 or float64. Defaults to the storage
+            dtype of `simplequant.precision`.
+
+    Returns:
+        Panel: Dense Date×Symbol panel. Missing (Date, Symbol) pairs are NaN.
+
+    Raises:
+        ValueError: If the frame has no Date/Symbol keys or a requested column is missing.
+    """
+    if isinstance(df.index, pd.MultiIndex) and df.index.names == ["Date", "Symbol"]:
+        df = df.reset_index()
+    if "Date" not in df.columns or "Symbol" not in df.columns:
+        raise ValueError(
+            "Input must have 'Date' and 'Symbol' columns or MultiIndex ['Date', 'Symbol']"
+        )
+
+    if columns is None:
+        columns = [c for c in OHLCV_COLUMNS if c in df.columns]
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns in input: {missing}")
+
+    date_codes, dates = pd.factorize(pd.to_datetime(df["Date"]), sort=True)
+    symbol_codes, symbols = pd.factorize(df["Symbol"], sort=True)
+
+    dtype = resolve_dtype(dtype)
+    fields = {}
+    for col in columns:
+        values = np.full((len(dates), len(symbols)), np.nan, dtype=dtype)
+        values[date_codes, symbol_codes] = df[col].to_numpy(dtype=float)
+        fields[col] = values
+
+    return Panel(
+        dates=pd.DatetimeIndex(dates, name="Date"),
+        symbols=pd.Index(symbols, name="Symbol"),
+        fields=fields,
+    )
+
+
+__all__ = ["Panel", "to_panel"]
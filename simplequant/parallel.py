@@ -0,0 +1,270 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from .diagnostics import RegressionStats
+from .panel import Panel, to_panel
+from .precision import get_storage_dtype
+from .regression import neutralize_all_factors
+from .factor.registry import get_factor_specs, required_columns
+
+
+# Process-pool execution of factor and neutralization work.
+#
+# Inputs and outputs live in POSIX shared memory: the parent copies each array in
+# once, workers attach to the segments when the pool starts and write their shard
+# of the result in place, so nothing but slice bounds is pickled per task. Factors
+# are sharded by symbol (the panel alphas are column-independent; cross-sectional
+# formula factors run in the calling process) and neutralization by date, so
+# results are bit-identical to the serial functions. Segments carry their dtype, so
+# float32 inputs are shared as float32 and outputs take the parent's storage dtype.
+#
+# The panel functions travel to the workers with the segments rather than being
+# looked up by name, as under the "spawn" start method (the default on Windows and
+# macOS) a worker's registry holds only the built-in factors, not formulas
+# registered at run time. Functions that cannot be pickled run in the calling
+# process.
+
+_WORKER_SEGMENTS: list[SharedMemory] = []
+_WORKER_ARRAYS: dict[str, np.ndarray] = {}
+_WORKER_FUNCS: dict[str, tuple[tuple[str, ...], Callable]] = {}
+
+
+class _SharedArrays:
+    """Owner of the shared-memory segments for one parallel call."""
+
+    def __init__(self):
+        self._segments: list[SharedMemory] = []
+        self.arrays: dict[str, np.ndarray] = {}
+        self.specs: dict[str, tuple[str, tuple[int, ...], str]] = {}
+
+    def __enter__(self) -> "_SharedArrays":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.arrays.clear()
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+
+    def add(
+        self, key: str, shape: tuple[int, ...], source=None, dtype=float
+    ) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shm = SharedMemory(create=True, size=size)
+        self._segments.append(shm)
+        array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        if source is not None:
+            array[...] = source
+        self.arrays[key] = array
+        self.specs[key] = (shm.name, shape, dtype.str)
+        return array
+
+
+def _attach(
+    specs: dict[str, tuple[str, tuple[int, ...], str]],
+    funcs: dict[str, tuple[tuple[str, ...], Callable]] | None = None,
+) -> None:
+    for key, (name, shape, dtype) in specs.items():
+        shm = SharedMemory(name=name)
+        _WORKER_SEGMENTS.append(shm)
+        _WORKER_ARRAYS[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _WORKER_FUNCS.update(funcs or {})
+
+
+def _picklable(func: Callable) -> bool:
+    try:
+        pickle.dumps(func)
+    except Exception:  # PicklingError, AttributeError or TypeError by object kind
+        return False
+    return True
+
+
+def _chunks(n: int, n_workers: int) -> list[tuple[int, int]]:
+    # A few chunks per worker keeps the pool busy when shards are uneven
+    bounds = np.linspace(0, n, min(n, 4 * n_workers) + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def _run(specs, tasks, func, n_workers: int, funcs=None) -> list:
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_attach, initargs=(specs, funcs)
+    ) as pool:
+        return [future.result() for future in [pool.submit(func, *t) for t in tasks]]
+
+
+def _factor_task(names: list[str], start: int, stop: int) -> None:
+    out = _WORKER_ARRAYS["out"]
+    for k, name in enumerate(names):
+        columns, panel_func = _WORKER_FUNCS[name]
+        fields = {c: _WORKER_ARRAYS[c][:, start:stop] for c in columns}
+        out[k, :, start:stop] = panel_func(fields)
+
+
+def _neutralize_task(
+    start: int,
+    stop: int,
+    fit_intercept: bool,
+    factor_names: list[str] | None,
+    dates: list[str] | None,
+    verbose: bool,
+    collect_stats: bool,
+) -> RegressionStats | None:
+    factors, exposures = _WORKER_ARRAYS["factors"], _WORKER_ARRAYS["exposures"]
+    out = _WORKER_ARRAYS["out"]
+    stats = RegressionStats() if collect_stats else None
+    for d in range(start, stop):
+        out[d] = neutralize_all_factors(
+            factors[d],
+            exposures[d],
+            fit_intercept=fit_intercept,
+            factor_names=factor_names,
+            date_str=dates[d] if dates is not None else None,
+            verbose=verbose,
+            stats=stats,
+        )
+    return stats
+
+
+def compute_factors_parallel(
+    data: Panel | pd.DataFrame,
+    names: list[str] | None = None,
+    n_workers: int | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Compute factor panels across a process pool, sharding by symbol.
+
+    Args:
+        data (Panel | pd.DataFrame): A `Panel`, or long-format market data which is
+            pivoted first (required columns only).
+        names (list[str], optional): Factor names. Defaults to every registered factor.
+        n_workers (int, optional): Number of worker processes. Defaults to
+            `os.cpu_count()`. With 1, everything runs in the calling process.
+
+    Returns:
+        dict[str, pd.DataFrame]: Factor name to Date×Symbol matrix, identical to
+            `registry.compute_factors`.
+    """
+    names = [spec.name for spec in get_factor_specs(names)]
+    columns = required_columns(names)
+    if not isinstance(data, Panel):
+        data = to_panel(data, columns)
+    n_workers = n_workers or os.cpu_count() or 1
+
+    if n_workers == 1:
+        fields = {c: data[c] for c in columns}
+        return {
+            spec.name: data.to_frame(spec.panel_func(fields))
+            for spec in get_factor_specs(names)
+        }
+
+    # Factors that mix symbols cannot be sharded by symbol
+    funcs = {
+        spec.name: (spec.columns, spec.panel_func)
+        for spec in get_factor_specs(names)
+        if not getattr(spec.panel_func, "cross_sectional", False)
+        and _picklable(spec.panel_func)
+    }
+    sharded = list(funcs)
+    result = {
+        spec.name: data.to_frame(spec.panel_func(data))
+        for spec in get_factor_specs(names)
+        if spec.name not in sharded
+    }
+
+    n_dates, n_symbols = data.shape
+    if sharded:
+        with _SharedArrays() as shared:
+            for c in required_columns(sharded):
+                shared.add(c, data.shape, data[c], data[c].dtype)
+            out = shared.add(
+                "out", (len(sharded), n_dates, n_symbols), dtype=get_storage_dtype()
+            )
+            tasks = [(sharded, a, b) for a, b in _chunks(n_symbols, n_workers)]
+            _run(shared.specs, tasks, _factor_task, n_workers, funcs)
+            for k, name in enumerate(sharded):
+                result[name] = data.to_frame(out[k].copy())
+            del out
+    return {name: result[name] for name in names}
+
+
+def neutralize_parallel(
+    factor_cube: np.ndarray,
+    exposure_cube: np.ndarray,
+    fit_intercept: bool = False,
+    factor_names: list[str] | None = None,
+    dates: list[str] | None = None,
+    verbose: bool = False,
+    n_workers: int | None = None,
+    stats: RegressionStats | None = None,
+) -> np.ndarray:
+    """
+    Run `neutralize_all_factors` for every date across a process pool.
+
+    Args:
+        factor_cube (np.ndarray): Raw factor values, shape (n_dates, n_samples, n_factors).
+        exposure_cube (np.ndarray): Exposures, shape (n_dates, n_samples, n_features).
+        fit_intercept (bool): Whether to include intercept in the regression.
+        factor_names (list[str], optional): Names of the factors (for debugging).
+        dates (list[str], optional): Date strings to include in logs.
+        verbose (bool): Whether to print diagnostic logs.
+        n_workers (int, optional): Number of worker processes. Defaults to
+            `os.cpu_count()`. With 1, everything runs in the calling process.
+        stats (RegressionStats, optional): Stats to add every date's counts and
+            stage times to. Each task collects its own and they are merged here.
+
+    Returns:
+        np.ndarray: Neutralized factor values, shape (n_dates, n_samples, n_factors),
+            identical to calling `neutralize_all_factors` date by date.
+    """
+    if factor_cube.ndim != 3 or exposure_cube.ndim != 3:
+        raise ValueError(
+            f"factor_cube and exposure_cube must be 3-D; got factor_cube.shape={factor_cube.shape}, exposure_cube.shape={exposure_cube.shape}."
+        )
+    if factor_cube.shape[:2] != exposure_cube.shape[:2]:
+        raise ValueError(
+            f"factor_cube and exposure_cube must share (n_dates, n_samples); got factor_cube.shape={factor_cube.shape}, exposure_cube.shape={exposure_cube.shape}."
+        )
+    n_workers = n_workers or os.cpu_count() or 1
+    n_dates = factor_cube.shape[0]
+
+    if n_workers == 1:
+        return np.stack(
+            [
+                neutralize_all_factors(
+                    factor_cube[d],
+                    exposure_cube[d],
+                    fit_intercept=fit_intercept,
+                    factor_names=factor_names,
+                    date_str=dates[d] if dates is not None else None,
+                    verbose=verbose,
+                    stats=stats,
+                )
+                for d in range(n_dates)
+            ]
+        )
+
+    with _SharedArrays() as shared:
+        shared.add("factors", factor_cube.shape, factor_cube, factor_cube.dtype)
+        shared.add("exposures", exposure_cube.shape, exposure_cube, exposure_cube.dtype)
+        out = shared.add("out", factor_cube.shape, dtype=get_storage_dtype())
+        tasks = [
+            (a, b, fit_intercept, factor_names, dates, verbose, stats is not None)
+            for a, b in _chunks(n_dates, n_workers)
+        ]
+        task_stats = _run(shared.specs, tasks, _neutralize_task, n_workers)
+        if stats is not None:
+            for task in task_stats:
+                stats.merge(task)
+        result = out.copy()
+        del out
+    return result
+
+
+__all__ = ["compute_factors_parallel", "neutralize_parallel"]
@@ -8,6 +8,11 @@ import os
 GLOBAL_DPI = 120
 MARKERS = ["o"]
 COLORS = plt.get_cmap("Set1").colors
+# Above this many factors per side, cell annotations are unreadable and slow to draw
+ANNOTATE_MAX_FACTORS = 30
+# Pillow holds every frame of a GIF until the file is written, so long histories
+# go to PNGs or a PDF instead
+GIF_MAX_FRAMES = 500
 
 
 def plot_factor_matrix(
@@ -16,6 +21,7 @@ def plot_factor_matrix(
     date: Union[str, pd.Timestamp],
     figsize: Optional[Tuple[int, int]] = (12, 10),
     save_path: Optional[str] = None,
+    annotate: Optional[bool] = None,
 ) -> None:
     """
     Plots a covariance or correlation matrix as a heatmap, with optional image export.
@@ -26,6 +32,9 @@ def plot_factor_matrix(
         date (Union[str, pd.Timestamp]): Date to show in title.
         figsize (Optional[Tuple[int, int]]): Size of figure.
         save_path (Optional[str]): If provided, saves the plot to this path.
+        annotate (Optional[bool]): Write the value in every cell. Defaults to True for
+            correlation matrices of at most `ANNOTATE_MAX_FACTORS` factors, where
+            the text is still legible; False otherwise.
 
     Returns:
         None
@@ -45,14 +54,17 @@ def plot_factor_matrix(
 
     if isinstance(date, pd.Timestamp):
         date = date.strftime("%Y-%m-%d")
+    if annotate is None:
+        annotate = matrix_type == "corr" and len(matrix) <= ANNOTATE_MAX_FACTORS
 
     plt.figure(figsize=figsize)
 
     if matrix_type == "cov":
         sns.heatmap(
             matrix,
-            annot=False,
+            annot=annotate,
             fmt=".2f",
+            annot_kws={"size": 5},
             cmap="coolwarm",
             center=0,
             xticklabels=True,
@@ -66,7 +78,7 @@ def plot_factor_matrix(
             center=0,
             vmin=-1,
             vmax=1,
-            annot=True,
+            annot=annotate,
             fmt=".2f",
             annot_kws={"size": 5},
             xticklabels=True,
@@ -107,11 +119,13 @@ def plot_model_comparison(
             representing the error values (e.g., rmse, r2) for different models.
             Each row corresponds to one date.
         metric (Literal): The name of the error metric to display on the y-axis.
-            Must be one of: "rmse", "mse", "mae", "r2", "residual".
+            Must be one of: "rmse", "mse", "mae", "r2", "ic", "rank_ic". IC series
+            come from `analytics.ic_frame`.
         figsize (Optional[Tuple[int, int]], optional): Size of the matplotlib figure as
             (width, height). Defaults to (12, 10).
-        save_path (Optional[str], optional): If specified, saves the plot to this path.
-            Intermediate directories will be created automatically.
+        save_path (Optional[str], optional): If specified, saves the plot to this path
+            instead of showing it. Intermediate directories will be created
+            automatically.
 
     Returns:
         None
@@ -120,9 +134,9 @@ def plot_model_comparison(
         >>> plot_model_comparison(df, metric="r2", save_path="output/r2_comparison.png")
     """
     metric = metric.lower()
-    if metric not in {"rmse", "mse", "mae", "r2"}:
+    if metric not in {"rmse", "mse", "mae", "r2", "ic", "rank_ic"}:
         raise ValueError(
-            f"Invalid metric '{metric}'. Must be one of: rmse, mse, mae, r2."
+            f"Invalid metric '{metric}'. Must be one of: rmse, mse, mae, r2, ic, rank_ic."
         )
 
     plt.figure(figsize=figsize)
@@ -182,9 +196,270 @@ def plot_model_comparison(
     if save_path:
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
         plt.savefig(save_path, dpi=GLOBAL_DPI, bbox_inches="tight")
-
-    plt.show()
+    else:
+        plt.show()
     plt.close()
 
 
-__all__ = ["plot_factor_matrix", "plot_model_comparison"]
+# Batch rendering of Date×K×K matrix stacks (e.g. from `rolling_covariance`).
+#
+# Each worker process builds one Agg figure (heatmap image, colorbar, tick labels
+# and, if annotating, one text per cell) and, for every frame, only swaps the
+# image data, color limits, title and cell texts before drawing it. pyplot is not
+# used, so workers never touch an interactive backend. PNG frames are written by
+# the workers; GIF frames are rendered by the workers and streamed to Pillow in
+# order; a multi-page PDF is written by the calling process with the same reused
+# figure, since its pages go to one file.
+
+_RENDERER = None
+
+
+class _MatrixRenderer:
+    """One reusable heatmap figure for matrices of a fixed size."""
+
+    def __init__(
+        self,
+        factor_names: List[str],
+        matrix_type: Literal["cov", "corr"],
+        figsize: Tuple[float, float],
+        dpi: int,
+        annotate: bool,
+    ):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        k = len(factor_names)
+        self.matrix_type = matrix_type
+        self.dpi = dpi
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        ax = self.figure.add_subplot()
+        self.image = ax.imshow(
+            np.zeros((k, k)),
+            cmap="coolwarm",
+            vmin=-1,
+            vmax=1,
+            interpolation="nearest",
+            aspect="auto",
+        )
+        label = "Covariance" if matrix_type == "cov" else "Correlation"
+        self.figure.colorbar(self.image, ax=ax, label=label)
+        tick_size = min(10.0, max(3.0, 400.0 / max(k, 1)))
+        ax.set_xticks(range(k), factor_names, rotation=90, fontsize=tick_size)
+        ax.set_yticks(range(k), factor_names, fontsize=tick_size)
+        ax.set_xlabel("Factors")
+        ax.set_ylabel("Factors")
+        self.title = ax.set_title(f"{label} Matrix on 0000-00-00", fontsize=16)
+        self.texts = (
+            [
+                ax.text(j, i, "", ha="center", va="center", fontsize=5)
+                for i in range(k)
+                for j in range(k)
+            ]
+            if annotate
+            else []
+        )
+        self.figure.tight_layout()
+
+    def update(self, matrix: np.ndarray, date: str) -> None:
+        self.image.set_data(matrix)
+        if self.matrix_type == "cov":
+            # Symmetric around 0, like the centered seaborn colormap
+            bound = np.nanmax(np.abs(matrix)) if np.isfinite(matrix).any() else 0.0
+            self.image.set_clim(-bound or -1.0, bound or 1.0)
+        for text, value in zip(self.texts, matrix.ravel()):
+            text.set_text(f"{value:.2f}" if np.isfinite(value) else "")
+        prefix = "Covariance" if self.matrix_type == "cov" else "Correlation"
+        self.title.set_text(f"{prefix} Matrix on {date}")
+
+    def save(self, path: str) -> None:
+        self.figure.savefig(path, dpi=self.dpi)
+
+    def frame(self):
+        """The figure as a palette image, as the GIF writer stores it."""
+        from PIL import Image
+
+        self.figure.canvas.draw()
+        image = Image.fromarray(np.asarray(self.figure.canvas.buffer_rgba()))
+        return image.convert("RGB").convert("P", palette=Image.Palette.ADAPTIVE)
+
+
+def _init_renderer(config: tuple) -> None:
+    global _RENDERER
+    _RENDERER = _MatrixRenderer(*config)
+
+
+def _render_frames(
+    matrices: np.ndarray, dates: List[str], paths: Optional[List[str]]
+) -> Optional[List[np.ndarray]]:
+    # PNG frames go straight to their files; otherwise palette images come back,
+    # one byte per pixel
+    frames = []
+    for i, (matrix, date) in enumerate(zip(matrices, dates)):
+        _RENDERER.update(matrix, date)
+        if paths is not None:
+            _RENDERER.save(paths[i])
+        else:
+            frames.append(_RENDERER.frame())
+    return None if paths is not None else frames
+
+
+def _rendered(config, matrices, dates, paths, n_workers):
+    """
+    Results of `_render_frames` over chunks of frames, in order.
+
+    At most `n_workers + 1` chunks are submitted but not yet consumed, so the
+    rendered frames of a long stack never pile up in the calling process.
+    """
+    from .parallel import _chunks
+
+    chunks = _chunks(len(matrices), n_workers)
+    tasks = [
+        (matrices[a:b], dates[a:b], None if paths is None else paths[a:b])
+        for a, b in chunks
+    ]
+    if n_workers == 1:
+        _init_renderer(config)
+        for task in tasks:
+            yield _render_frames(*task)
+        return
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_init_renderer, initargs=(config,)
+    ) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(_render_frames, *task))
+            if len(pending) > n_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def render_factor_matrices(
+    matrices: np.ndarray,
+    dates: List[Union[str, pd.Timestamp]],
+    factor_names: List[str],
+    matrix_type: Literal["cov", "corr"],
+    output: str,
+    n_workers: Optional[int] = None,
+    figsize: Tuple[float, float] = (12, 10),
+    dpi: int = GLOBAL_DPI,
+    annotate: Optional[bool] = None,
+    fps: float = 4.0,
+) -> List[str]:
+    """
+    Render a stack of covariance or correlation matrices, one frame per date.
+
+    The batch counterpart of `plot_factor_matrix`: every frame reuses one figure and
+    colorbar per worker, on the non-interactive Agg backend. The kind of output
+    follows `output`:
+
+    - a path ending in ".gif": one animated GIF, a frame per date. Pillow keeps
+      every frame in memory until the file is written, as a palette image of one
+      byte per pixel (about 1.7 MB at the default 12×10 in and 120 dpi), so at
+      most `GIF_MAX_FRAMES` dates are allowed. Workers send back palette images
+      and only a few chunks are in flight, so the rest of the pipeline adds
+      little to that;
+    - a path ending in ".pdf": one multi-page PDF, a page per date (written by the
+      calling process);
+    - anything else: a directory of PNGs named "{matrix_type}_{date}.png".
+
+    Args:
+        matrices (np.ndarray): Stack of shape (n_dates, K, K), e.g. the values of
+            `rolling_covariance`.
+        dates (List[Union[str, pd.Timestamp]]): Date of each matrix, shown in titles
+            and PNG file names.
+        factor_names (List[str]): The K factor names, used as tick labels.
+        matrix_type (Literal["cov", "corr"]): "corr" uses a fixed [-1, 1] scale,
+            "cov" a scale symmetric around 0 fitted to each frame.
+        output (str): Output file or directory, see above.
+        n_workers (Optional[int]): Rendering processes. Defaults to the CPU count,
+            capped by the number of frames; 1 renders in the calling process.
+        figsize (Tuple[float, float]): Size of each frame in inches.
+        dpi (int): Resolution of each frame. Defaults to `GLOBAL_DPI`.
+        annotate (Optional[bool]): Write the value in every cell. Defaults to True
+            for correlation matrices of at most `ANNOTATE_MAX_FACTORS` factors.
+        fps (float): Frames per second of a GIF. Defaults to 4.
+
+    Returns:
+        List[str]: The written file paths (one per date for PNGs).
+
+    Raises:
+        ValueError: If `matrix_type` is invalid, the shapes of `matrices`,
+            `dates` and `factor_names` do not match, or a GIF would have more than
+            `GIF_MAX_FRAMES` frames.
+
+    Example:
+        >>> cov = rolling_covariance(factor_returns, window=60)
+        >>> render_factor_matrices(
+        ...     cov, factor_returns.index, list(factor_returns.columns), "cov", "output/cov.gif"
+        ... )
+    """
+    if matrix_type not in {"cov", "corr"}:
+        raise ValueError(
+            f"Invalid matrix_type: {matrix_type}. Must be 'cov' or 'corr'."
+        )
+    matrices = np.asarray(matrices, dtype=float)
+    k = len(factor_names)
+    if matrices.ndim != 3 or matrices.shape[1:] != (k, k):
+        raise ValueError(
+            f"matrices must have shape (n_dates, {k}, {k}); got {matrices.shape}."
+        )
+    if len(dates) != len(matrices):
+        raise ValueError(
+            f"dates must have one entry per matrix; got {len(dates)} dates for {len(matrices)} matrices."
+        )
+    kind = os.path.splitext(output)[1].lower()
+    if kind == ".gif" and len(matrices) > GIF_MAX_FRAMES:
+        raise ValueError(
+            f"GIF output must have at most {GIF_MAX_FRAMES} frames; got {len(matrices)}. Render to PNGs or a PDF instead."
+        )
+    if len(matrices) == 0:
+        return []
+    dates = [pd.Timestamp(d).strftime("%Y-%m-%d") for d in dates]
+    if annotate is None:
+        annotate = matrix_type == "corr" and k <= ANNOTATE_MAX_FACTORS
+    config = (list(factor_names), matrix_type, tuple(figsize), dpi, annotate)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(matrices)))
+
+    if kind == ".pdf":
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        renderer = _MatrixRenderer(*config)
+        with PdfPages(output) as pdf:
+            for matrix, date in zip(matrices, dates):
+                renderer.update(matrix, date)
+                pdf.savefig(renderer.figure)
+        return [output]
+
+    if kind == ".gif":
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        images = (
+            frame
+            for chunk in _rendered(config, matrices, dates, None, n_workers)
+            for frame in chunk
+        )
+        first = next(images)
+        first.save(
+            output,
+            save_all=True,
+            append_images=images,
+            duration=int(round(1000 / fps)),
+            loop=0,
+        )
+        return [output]
+
+    os.makedirs(output, exist_ok=True)
+    paths = [os.path.join(output, f"{matrix_type}_{date}.png") for date in dates]
+    for _ in _rendered(config, matrices, dates, paths, n_workers):
+        pass
+    return paths
+
+
+__all__ = ["plot_factor_matrix", "plot_model_comparison", "render_factor_matrices"]
@@ -0,0 +1,81 @@
+import contextlib
+from typing import Iterator
+
+import numpy as np
+
+# Floating-point dtype policy.
+#
+# The storage dtype is used for arrays that are kept around: `Panel` fields built
+# by `to_panel`, factor outputs, neutralized factors and covariance histories.
+# float32 halves their memory and bandwidth. The arithmetic that is sensitive to
+# rounding (rolling sums and their squares, correlations, cross-sectional
+# moments, least-squares factorizations) upcasts its inputs and accumulates in
+# float64 whatever the storage dtype; only the result is rounded to storage.
+#
+# Use `simplequant.factor.validation.precision_report` to measure the deviation
+# of float32 storage from float64 for each factor before switching.
+
+_STORAGE_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+_storage_dtype = np.dtype(np.float64)
+
+
+def _check_dtype(dtype) -> np.dtype:
+    try:
+        resolved = np.dtype(dtype)
+    except TypeError:
+        resolved = np.dtype(object)
+    if dtype is None or resolved not in _STORAGE_DTYPES:
+        raise ValueError(f"dtype must be float32 or float64; got {dtype!r}.")
+    return resolved
+
+
+def get_storage_dtype() -> np.dtype:
+    """Current storage dtype (float64 unless changed)."""
+    return _storage_dtype
+
+
+def set_storage_dtype(dtype) -> np.dtype:
+    """
+    Set the storage dtype for panels, factors and regression outputs.
+
+    Args:
+        dtype: `np.float32` / "float32" or `np.float64` / "float64".
+
+    Returns:
+        np.dtype: The previous storage dtype.
+
+    Raises:
+        ValueError: If `dtype` is not float32 or float64.
+    """
+    global _storage_dtype
+    previous, _storage_dtype = _storage_dtype, _check_dtype(dtype)
+    return previous
+
+
+@contextlib.contextmanager
+def storage_dtype(dtype) -> Iterator[np.dtype]:
+    """
+    Use `dtype` as storage dtype inside a `with` block.
+
+    Example:
+        >>> with storage_dtype("float32"):
+        ...     factors = compute_factors(df)
+    """
+    previous = set_storage_dtype(dtype)
+    try:
+        yield _storage_dtype
+    finally:
+        set_storage_dtype(previous)
+
+
+def resolve_dtype(dtype=None) -> np.dtype:
+    """`dtype` if given (validated), else the current storage dtype."""
+    return _storage_dtype if dtype is None else _check_dtype(dtype)
+
+
+__all__ = [
+    "get_storage_dtype",
+    "set_storage_dtype",
+    "storage_dtype",
+    "resolve_dtype",
+]
@@ -1,11 +1,51 @@
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
-from sklearn.linear_model import LinearRegression
+
+from .diagnostics import RegressionStats
+from .precision import get_storage_dtype
+
+
+def _check_weights(weights: np.ndarray | None, n_samples: int) -> None:
+    if weights is None:
+        return
+    if weights.shape != (n_samples,):
+        raise ValueError(
+            f"weights must have shape (n_samples,); got weights.shape={weights.shape}, n_samples={n_samples}."
+        )
+    if not (np.isfinite(weights).all() and (weights >= 0).all()):
+        raise ValueError("weights must be finite and non-negative.")
+
+
+def _regression_metrics(
+    y_true: np.ndarray, y_pred: np.ndarray, weights: np.ndarray | None = None
+) -> dict[str, float | np.ndarray]:
+    """
+    MSE, RMSE, MAE and R² from one residual array, per column for 2-D targets.
+
+    Matches `sklearn.metrics` (including `sample_weight`), where a constant target
+    gives R² = 1.0 for a perfect fit and 0.0 otherwise.
+    """
+    residual = y_true - y_pred
+    mse = np.average(residual * residual, axis=0, weights=weights)
+    mae = np.average(np.abs(residual), axis=0, weights=weights)
+    deviation = y_true - np.average(y_true, axis=0, weights=weights)
+    w = 1.0 if weights is None else (weights if y_true.ndim == 1 else weights[:, None])
+    ss_res = np.sum(w * residual * residual, axis=0)
+    ss_tot = np.sum(w * deviation * deviation, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(ss_tot != 0, 1 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+    results = {"MSE": mse, "RMSE": np.sqrt(mse), "MAE": mae, "R2": r2}
+    if y_true.ndim == 1:
+        return {k: float(v) for k, v in results.items()}
+    return results
 
 
 def evaluate_regression_model(
-    y_true: np.ndarray, beta: np.ndarray, x: np.ndarray, plot: bool = False
+    y_true: np.ndarray,
+    beta: np.ndarray,
+    x: np.ndarray,
+    plot: bool = False,
+    weights: np.ndarray | None = None,
 ) -> dict[str, float]:
     """
     Evaluate a linear regression model's performance.
@@ -24,6 +64,8 @@ def evaluate_regression_model(
             Must be augmented with a column of ones if an intercept is used.
         plot (bool, optional): Whether to display a diagnostic plot.
             Currently unimplemented. Defaults to False.
+        weights (np.ndarray, optional): Sample weights of shape (n_samples,) for
+            weighted metrics. Defaults to None (equal weights).
 
     Returns:
         dict[str, float]: A dictionary containing:
@@ -50,13 +92,10 @@ def evaluate_regression_model(
             f"y_true and x must have the same number of samples; got y_true.shape={y_true.shape}, x.shape={x.shape}"
         )
 
-    y_pred = x @ beta.T
-    mse = mean_squared_error(y_true, y_pred)
-    rmse = np.sqrt(mse)
-    mae = mean_absolute_error(y_true, y_pred)
-    r2 = r2_score(y_true, y_pred)
+    _check_weights(weights, x.shape[0])
 
-    results = {"MSE": mse, "RMSE": rmse, "MAE": mae, "R2": r2}
+    y_pred = x @ beta.T
+    results = _regression_metrics(y_true, y_pred, weights)
 
     if plot:
         print("I will plot!")
@@ -65,31 +104,49 @@ def evaluate_regression_model(
 
 
 def regress_model(
-    y_true: np.ndarray, x: np.ndarray, fit_intercept: bool = False
+    y_true: np.ndarray,
+    x: np.ndarray,
+    fit_intercept: bool = False,
+    compute_metrics: bool = True,
+    weights: np.ndarray | None = None,
+    stats: RegressionStats | None = None,
 ) -> dict[str, float | np.ndarray]:
     """
     Fit a linear regression model and return coefficients, intercept, residuals, and metrics.
 
+    Ordinary least squares, or weighted least squares when `weights` is given
+    (e.g. market caps for cap-weighted neutralization). The solution matches
+    `sklearn.linear_model.LinearRegression`, including minimum-norm coefficients
+    for rank-deficient `x`.
+
     Args:
-        y_true (np.ndarray): Target values, shape (n_samples,).
+        y_true (np.ndarray): Target values, shape (n_samples,) or (n_samples, n_targets).
         x (np.ndarray): Feature matrix, shape (n_samples, n_features).
         fit_intercept (bool): Whether to include an intercept term.
+        compute_metrics (bool): Whether to compute the regression metrics. When
+            False, only "beta", "intercept" and "residual" are returned.
+        weights (np.ndarray, optional): Non-negative sample weights, shape (n_samples,).
+            Metrics are weighted as well.
+        stats (RegressionStats, optional): Stats to add this call's "fit",
+            "residual" and "metrics" times to.
 
     Returns:
         dict[str, float | np.ndarray]: Dictionary containing:
 
-            - "beta": Estimated regression coefficients
-            - "intercept": Estimated intercept (0.0 if not used)
-            - "residual": Vector of residuals (y_true - y_pred)
-            - "MSE", "RMSE", "MAE", "R2": Standard regression metrics. See documentation for `evaluate_regression_model`.
+            - "beta": Estimated regression coefficients, shape (n_features,) or
+              (n_targets, n_features)
+            - "intercept": Estimated intercept (0.0 if not used), per target for 2-D y
+            - "residual": Residuals (y_true - y_pred), same shape as `y_true`
+            - "MSE", "RMSE", "MAE", "R2": Standard regression metrics, per target for
+              2-D y. See documentation for `evaluate_regression_model`.
 
     Notes:
-        **Intercept Warning**: If `fit_intercept=True`, x will be augmented internally.
+        **Intercept Warning**: If `fit_intercept=True`, x and y are centered internally.
     """
 
-    if y_true.ndim != 1:
+    if y_true.ndim not in (1, 2):
         raise ValueError(
-            f"y_true must be 1-D; got ndim={y_true.ndim}, shape={y_true.shape}."
+            f"y_true must be 1-D or 2-D; got ndim={y_true.ndim}, shape={y_true.shape}."
         )
 
     if x.ndim != 2:
@@ -103,24 +160,39 @@ def regress_model(
             f"got len(y_true)={y_true.shape[0]} vs x.shape[0]={x.shape[0]}."
         )
 
-    model = LinearRegression(fit_intercept=fit_intercept)
-    model.fit(x, y_true)
-    A = np.array(model.coef_, dtype=float)
-    c = model.intercept_ if fit_intercept else 0.0
+    _check_weights(weights, x.shape[0])
 
+    if stats is not None:
+        stats.start()
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y_true, dtype=float)
     if fit_intercept:
-        x_aug = np.hstack([x, np.ones((x.shape[0], 1))])
-        y_pred = x_aug @ np.hstack([A, [c]])
+        x_mean = np.average(x, axis=0, weights=weights)
+        y_mean = np.average(y, axis=0, weights=weights)
+        x_fit, y_fit = x - x_mean, y - y_mean
     else:
-        x_aug = x
-        y_pred = x @ A
-
-    residual = y_true - y_pred
-    res = evaluate_regression_model(
-        y_true=y_true,
-        beta=A if not fit_intercept else np.hstack([A, [c]]),
-        x=x_aug,
-    )
+        x_fit, y_fit = x, y
+    if weights is not None:
+        sqrt_w = np.sqrt(weights)
+        x_fit = x_fit * sqrt_w[:, None]
+        y_fit = y_fit * (sqrt_w if y.ndim == 1 else sqrt_w[:, None])
+
+    coef = np.linalg.lstsq(x_fit, y_fit, rcond=None)[0]
+    A = coef.T
+    c = y_mean - x_mean @ coef if fit_intercept else 0.0
+    if stats is not None:
+        stats.lap("fit")
+
+    y_pred = x @ coef + c
+    residual = y - y_pred
+    if stats is not None:
+        stats.lap("residual")
+    if not compute_metrics:
+        return {"beta": A, "intercept": c, "residual": residual}
+
+    res = _regression_metrics(y, y_pred, weights)
+    if stats is not None:
+        stats.lap("metrics")
 
     return {"beta": A, "intercept": c, "residual": residual} | res
 
@@ -145,9 +217,8 @@ def compute_correlation_from_covariance(df_cov: pd.DataFrame) -> pd.DataFrame:
     """
 
     if not df_cov.index.equals(df_cov.columns):
-        print(df_cov)
         raise ValueError(
-            "Covariance matrix must be square with identical index and columns."
+            f"Covariance matrix must be square with identical index and columns; got shape={df_cov.shape}."
         )
 
     # Compute standard deviations
@@ -170,6 +241,80 @@ def compute_correlation_from_covariance(df_cov: pd.DataFrame) -> pd.DataFrame:
     return corr
 
 
+def residualize(
+    y: np.ndarray, x: np.ndarray, weights: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Residuals of the least-squares regression of every column of `y` on `x`.
+
+    `x` is factorized once (thin SVD) and all columns are projected out of its
+    column space together: residual = y - Q (Qᵀ y). Rank-deficient `x` (e.g.
+    industry dummies plus an intercept) is handled by dropping singular
+    directions, so the residuals equal those of a minimum-norm least-squares fit.
+    With `weights`, the fit is weighted least squares on `sqrt(weights) * x`.
+
+    Args:
+        y (np.ndarray): Targets, shape (n_samples,) or (n_samples, n_targets).
+        x (np.ndarray): Feature matrix, shape (n_samples, n_features). Must
+            already include an intercept column if one is wanted.
+        weights (np.ndarray, optional): Non-negative sample weights, shape (n_samples,).
+
+    Returns:
+        np.ndarray: float64 residuals with the shape of `y`.
+
+    Raises:
+        ValueError: If `x` is not 2-D, has a different number of samples than `y`,
+            contains NaN or Inf, or `weights` are invalid.
+    """
+    _check_design(y, x, weights)
+    # Factorize and project in float64 whatever the input dtype
+    y, x = np.asarray(y, dtype=float), np.asarray(x, dtype=float)
+    return _project_out(y, x, _factorize(x, weights), weights)
+
+
+def _check_design(y: np.ndarray, x: np.ndarray, weights: np.ndarray | None) -> None:
+    if x.ndim != 2:
+        raise ValueError(
+            f"x must be 2-D (n_samples, n_features); got ndim={x.ndim}, shape={x.shape}."
+        )
+    if x.shape[0] != y.shape[0]:
+        raise ValueError(
+            f"y and x must have the same number of samples; got y.shape={y.shape}, x.shape={x.shape}."
+        )
+    if not np.isfinite(x).all():
+        raise ValueError("x contains NaN or Inf.")
+    _check_weights(weights, x.shape[0])
+
+
+def _factorize(
+    x: np.ndarray, weights: np.ndarray | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Thin SVD of the (weighted) design matrix without its null directions."""
+    if weights is not None:
+        x = x * np.sqrt(weights)[:, None]
+    u, s, vt = np.linalg.svd(x, full_matrices=False)
+    keep = s > s.max(initial=0.0) * max(x.shape) * np.finfo(float).eps
+    return u[:, keep], s[keep], vt[keep]
+
+
+def _project_out(
+    y: np.ndarray,
+    x: np.ndarray,
+    svd: tuple[np.ndarray, np.ndarray, np.ndarray],
+    weights: np.ndarray | None,
+) -> np.ndarray:
+    """Residuals of `y` given the `_factorize` output of `x`."""
+    u, s, vt = svd
+    if weights is None:
+        return y - u @ (u.T @ y)
+
+    # Weighted: solve in the scaled space, then predict with the unscaled x so
+    # zero-weight samples still get residuals
+    sqrt_w = np.sqrt(weights) if y.ndim == 1 else np.sqrt(weights)[:, None]
+    coef = vt.T @ ((u.T @ (y * sqrt_w)) / s.reshape(-1, *[1] * (y.ndim - 1)))
+    return y - x @ coef
+
+
 def neutralize_all_factors(
     factor_array: np.ndarray,
     exposure_matrix: np.ndarray,
@@ -177,6 +322,8 @@ def neutralize_all_factors(
     factor_names: list[str] | None = None,
     date_str: str | None = None,
     verbose: bool = False,
+    weights: np.ndarray | None = None,
+    stats: RegressionStats | None = None,
 ) -> np.ndarray:
     """
     Neutralize all factors in a matrix against the same exposure matrix, with robust handling.
@@ -188,63 +335,231 @@ def neutralize_all_factors(
         factor_names (list[str], optional): Names of the factors (for debugging).
         date_str (str, optional): Date string to include in logs.
         verbose (bool): Whether to print diagnostic logs.
+        weights (np.ndarray, optional): Sample weights for weighted least squares,
+            shape (n_samples,), e.g. market caps for cap-weighted neutralization.
+        stats (RegressionStats, optional): Stats to add this call's skip counts
+            (per factor if `factor_names` is given) and stage times to. Unlike
+            `verbose`, this prints nothing and can be merged across processes.
 
     Returns:
-        np.ndarray: Neutralized factor values (residuals), same shape as input.
+        np.ndarray: Neutralized factor values (residuals), same shape as input, in
+            the storage dtype (see `simplequant.precision`).
+
+    Notes:
+        Columns with NaN/Inf or values above 1e10 are set to 0 and constant
+        columns are returned unchanged. All remaining columns share one
+        factorization of the exposure matrix (see `residualize`), and no
+        regression metrics are computed. The checks and the regression run in
+        float64, also for float32 input.
     """
+    if stats is not None:
+        stats.start()
+    factor_array = np.asarray(factor_array, dtype=float)
     n_samples, n_factors = factor_array.shape
-    neutralized = np.empty_like(factor_array)
-
-    for j in range(n_factors):
-        y = factor_array[:, j]
-        fname = factor_names[j] if factor_names else f"Factor{j}"
-
-        # Handle NaN or Inf
-        if np.isnan(y).any() or np.isinf(y).any():
-            if verbose:
+    neutralized = np.zeros(factor_array.shape, dtype=get_storage_dtype())
+
+    # Classify every column at once; the regression itself is one batched solve
+    invalid = ~np.isfinite(factor_array).all(axis=0)
+    constant = ~invalid & np.isclose(factor_array, factor_array[:1]).all(axis=0)
+    overflow = ~invalid & ~constant & (np.abs(factor_array).max(axis=0) > 1e10)
+    regress = ~(invalid | constant | overflow)
+
+    # Handle constant values (std = 0): keep as-is, since unexplainable by X
+    neutralized[:, constant] = factor_array[:, constant]
+    if stats is not None:
+        stats.lap("classify")
+
+    error = None
+    if regress.any():
+        x = exposure_matrix
+        if fit_intercept:
+            x = np.hstack([x, np.ones((x.shape[0], 1))])
+        try:
+            y = factor_array[:, regress]
+            _check_design(y, x, weights)
+            x = np.asarray(x, dtype=float)
+            svd = _factorize(x, weights)
+            if stats is not None:
+                stats.lap("fit")
+            neutralized[:, regress] = _project_out(y, x, svd, weights)
+            if stats is not None:
+                stats.lap("residual")
+        except Exception as e:
+            error = e
+
+    if stats is not None:
+        skipped = {
+            "invalid": invalid,
+            "constant": constant,
+            "overflow": overflow,
+            "error": regress & (error is not None),
+        }
+        stats.count_columns(1, n_factors, skipped, factor_names)
+        if error is not None:
+            stats.errors[type(error).__name__] += 1
+
+    if verbose:
+        for j in range(n_factors):
+            y = factor_array[:, j]
+            fname = factor_names[j] if factor_names else f"Factor{j}"
+            if invalid[j]:
                 print(
                     f"[Skip] {date_str or ''} {fname}: contains NaN or Inf → set to 0."
                 )
-            neutralized[:, j] = 0.0
-            continue
-
-        # Handle constant values (std = 0): keep as-is
-        if np.allclose(y, y[0]):
-            if verbose:
+            elif constant[j]:
                 print(
                     f"[Constant] {date_str or ''} {fname}: constant ({y[0]:.4f}) → residual = original value."
                 )
-            neutralized[:, j] = y  # retain original, since unexplainable by X
-            continue
-
-        # Handle extremely large values (overflow risk)
-        if np.abs(y).max() > 1e10:
-            if verbose:
+            elif overflow[j]:
                 print(
                     f"[Clip] {date_str or ''} {fname}: max={np.max(np.abs(y)):.2e} → set to 0."
                 )
-            neutralized[:, j] = 0.0
-            continue
-
-        # Try standard regression
-        try:
-            res = regress_model(
-                y_true=y, x=exposure_matrix, fit_intercept=fit_intercept
-            )
-            neutralized[:, j] = res["residual"]
-        except Exception as e:
-            if verbose:
+            elif error is not None:
                 print(
-                    f"[Error] {date_str or ''} {fname}: regression failed: {e} → set to 0."
+                    f"[Error] {date_str or ''} {fname}: regression failed: {error} → set to 0."
                 )
-            neutralized[:, j] = 0.0
 
     return neutralized
 
 
+def neutralize_cube(
+    factor_cube: np.ndarray,
+    exposure_cube: np.ndarray,
+    fit_intercept: bool = False,
+    mask: np.ndarray | None = None,
+    max_memory_mb: float = 512.0,
+    stats: RegressionStats | None = None,
+    factor_names: list[str] | None = None,
+) -> np.ndarray:
+    """
+    Neutralize a whole history of factors against per-date exposures.
+
+    Each date is regressed on its own set of valid stocks: those with finite
+    exposures, at least one non-NaN factor value and, if given, `mask` set. On
+    those stocks the result equals `neutralize_all_factors` for that date,
+    including its NaN/Inf, constant and overflow rules; other stocks are NaN.
+
+    Dates are processed in chunks with batched SVDs and matrix products, so there
+    is no per-date Python work. Invalid stocks are zero rows of the chunk's
+    design matrices, which leaves the valid stocks' residuals unchanged.
+
+    Args:
+        factor_cube (np.ndarray): Raw factor values, shape (n_dates, n_samples, n_factors).
+        exposure_cube (np.ndarray): Exposures, shape (n_dates, n_samples, n_features).
+        fit_intercept (bool): Whether to include intercept in the regression.
+        mask (np.ndarray, optional): Boolean universe, shape (n_dates, n_samples).
+        max_memory_mb (float): Approximate memory budget of one chunk of dates.
+        stats (RegressionStats, optional): Stats to add the skip counts of every
+            (date, factor) and the stage times to.
+        factor_names (list[str], optional): Names of the factors, to count skips
+            per factor in `stats`.
+
+    Returns:
+        np.ndarray: Neutralized factor values, shape (n_dates, n_samples, n_factors),
+            in the storage dtype. Each chunk is upcast and solved in float64, so
+            float32 cubes only cost float64 memory for one chunk at a time.
+
+    Raises:
+        ValueError: If the cube shapes are inconsistent.
+    """
+    if factor_cube.ndim != 3 or exposure_cube.ndim != 3:
+        raise ValueError(
+            f"factor_cube and exposure_cube must be 3-D; got factor_cube.shape={factor_cube.shape}, exposure_cube.shape={exposure_cube.shape}."
+        )
+    if factor_cube.shape[:2] != exposure_cube.shape[:2]:
+        raise ValueError(
+            f"factor_cube and exposure_cube must share (n_dates, n_samples); got factor_cube.shape={factor_cube.shape}, exposure_cube.shape={exposure_cube.shape}."
+        )
+    if mask is not None and mask.shape != factor_cube.shape[:2]:
+        raise ValueError(
+            f"mask must have shape (n_dates, n_samples); got mask.shape={mask.shape}, factor_cube.shape={factor_cube.shape}."
+        )
+
+    n_dates, n_samples, n_factors = factor_cube.shape
+    n_features = exposure_cube.shape[2] + int(fit_intercept)
+
+    valid = np.isfinite(exposure_cube).all(axis=2) & ~np.isnan(factor_cube).all(axis=2)
+    if mask is not None:
+        valid &= mask
+
+    # Inputs, masked copies, residuals and SVD factors of one date
+    bytes_per_date = 8 * n_samples * (4 * n_factors + 3 * n_features)
+    chunk = max(1, int(max_memory_mb * 2**20 // max(bytes_per_date, 1)))
+
+    neutralized = np.empty((n_dates, n_samples, n_factors), dtype=get_storage_dtype())
+    if stats is not None:
+        stats.calls += 1
+    for start in range(0, n_dates, chunk):
+        dates = slice(start, start + chunk)
+        neutralized[dates] = _neutralize_chunk(
+            factor_cube[dates],
+            exposure_cube[dates],
+            valid[dates],
+            fit_intercept,
+            stats,
+            factor_names,
+        )
+    return neutralized
+
+
+def _neutralize_chunk(
+    y: np.ndarray,
+    x: np.ndarray,
+    valid: np.ndarray,
+    fit_intercept: bool,
+    stats: RegressionStats | None = None,
+    factor_names: list[str] | None = None,
+) -> np.ndarray:
+    if stats is not None:
+        stats.start(count=False)
+    y, x = np.asarray(y, dtype=float), np.asarray(x, dtype=float)
+    v = valid[:, :, None]
+    x = np.where(v, x, 0.0)
+    if fit_intercept:
+        x = np.concatenate([x, v.astype(float)], axis=2)
+
+    # Invalid stocks take each column's first valid value: that keeps them out of
+    # the column ranges below, and their rows of x are zero so the fit ignores them
+    first = np.take_along_axis(y, valid.argmax(axis=1)[:, None, None], axis=1)
+    y = np.where(v, y, first)
+
+    # Same per-column rules as neutralize_all_factors; NaN and Inf surface in the
+    # column max/min, and "allclose to the first value" is a range check
+    y_max, y_min = y.max(axis=1), y.min(axis=1)
+    first = first[:, 0, :]
+    invalid = ~(np.isfinite(y_max) & np.isfinite(y_min))
+    tol = 1e-8 + 1e-5 * np.abs(first)
+    constant = ~invalid & (y_max <= first + tol) & (y_min >= first - tol)
+    overflow = ~invalid & ~constant & (np.maximum(np.abs(y_max), np.abs(y_min)) > 1e10)
+    regress = ~(invalid | constant | overflow)
+    if invalid.any():
+        y = np.where(invalid[:, None, :], 0.0, y)
+    if stats is not None:
+        skipped = {"invalid": invalid, "constant": constant, "overflow": overflow}
+        stats.count_columns(len(y), invalid.size, skipped, factor_names)
+        stats.lap("classify")
+
+    u, s, _ = np.linalg.svd(x, full_matrices=False)
+    tol = s.max(axis=1, initial=0.0)[:, None] * max(x.shape[1:]) * np.finfo(float).eps
+    q = u * (s > tol)[:, None, :]
+    if stats is not None:
+        stats.lap("fit")
+    out = q @ (q.transpose(0, 2, 1) @ y)
+    np.subtract(y, out, out=out)
+
+    out *= regress[:, None, :]
+    np.copyto(out, y, where=constant[:, None, :])
+    out[~valid] = np.nan
+    if stats is not None:
+        stats.lap("residual")
+    return out
+
+
 __all__ = [
     "evaluate_regression_model",
     "regress_model",
     "compute_correlation_from_covariance",
     "neutralize_all_factors",
+    "residualize",
+    "neutralize_cube",
 ]
@@ -0,0 +1,225 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .panel import Panel, to_panel
+
+_STORE_VERSION = 1
+
+
+def write_store(panel: Panel, path: str, overwrite: bool = False) -> "MarketDataStore":
+    """
+    Write a `Panel` to a columnar on-disk store and open it.
+
+    The store is a directory with one `.npy` file per field (Date×Symbol, float32
+    fields stay float32 and everything else is float64, C order so a date range is
+    one contiguous block), `dates.npy`, `symbols.npy` and `meta.json`. It is
+    written to a temporary directory first and renamed, so readers never see a
+    half-written store. With `overwrite`, the old store is renamed aside before
+    the new one takes its place and deleted afterwards; should the process die in
+    between, it survives in a ".store-*.old" directory next to `path`.
+
+    Args:
+        panel (Panel): Data to write.
+        path (str): Store directory.
+        overwrite (bool): Replace an existing store at `path`. Defaults to False.
+
+    Returns:
+        MarketDataStore: The store opened at `path`.
+
+    Raises:
+        FileExistsError: If `path` exists and `overwrite` is False.
+    """
+    path = os.path.abspath(path)
+    if os.path.exists(path) and not overwrite:
+        raise FileExistsError(f"Store already exists at {path}; pass overwrite=True.")
+
+    symbols = panel.symbols.to_numpy()
+    if symbols.dtype == object:
+        symbols = symbols.astype(str)
+
+    tmp = tempfile.mkdtemp(prefix=".store-", dir=os.path.dirname(path))
+    try:
+        np.save(
+            os.path.join(tmp, "dates.npy"),
+            panel.dates.to_numpy(dtype="datetime64[ns]"),
+        )
+        np.save(os.path.join(tmp, "symbols.npy"), symbols)
+        for name, values in panel.fields.items():
+            np.save(
+                os.path.join(tmp, f"{name}.npy"),
+                np.ascontiguousarray(
+                    values, dtype=values.dtype if values.dtype == np.float32 else float
+                ),
+            )
+        meta = {
+            "version": _STORE_VERSION,
+            "fields": list(panel.fields),
+            "shape": list(panel.shape),
+        }
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        old = None
+        if os.path.exists(path):
+            old = f"{tmp}.old"
+            os.replace(path, old)
+        try:
+            os.replace(tmp, path)
+        except BaseException:
+            if old is not None:
+                os.replace(old, path)
+            raise
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    if old is not None:
+        shutil.rmtree(old, ignore_errors=True)
+    return MarketDataStore(path)
+
+
+def build_store(
+    csv_path: str,
+    path: str,
+    columns: list[str] | None = None,
+    overwrite: bool = False,
+    date_format: str | None = None,
+) -> "MarketDataStore":
+    """
+    Convert a CSV in the layout of `data/sample_data.csv` into a store.
+
+    The CSV is parsed once (dates included); afterwards `MarketDataStore(path)`
+    opens the data without touching the CSV.
+
+    Args:
+        csv_path (str): Long-format CSV with "Symbol", "Date" and field columns.
+        path (str): Store directory.
+        columns (list[str], optional): Fields to keep. Defaults to every OHLCV
+            column in the CSV.
+        overwrite (bool): Replace an existing store at `path`. Defaults to False.
+        date_format (str, optional): `strftime` format of the dates, e.g.
+            "%m/%d/%Y". Inferred by default.
+
+    Returns:
+        MarketDataStore: The new store.
+    """
+    usecols = None if columns is None else ["Symbol", "Date", *columns]
+    df = pd.read_csv(csv_path, usecols=usecols)
+    df["Date"] = pd.to_datetime(df["Date"], format=date_format)
+    return write_store(to_panel(df, columns), path, overwrite=overwrite)
+
+
+class MarketDataStore:
+    """
+    Read-only, memory-mapped view of a store written by `write_store`/`build_store`.
+
+    Opening a store reads only the date and symbol dictionaries; field arrays are
+    memory-mapped on first access, so several processes reading the same store
+    share one copy in the OS page cache.
+
+    Args:
+        path (str): Store directory.
+
+    Raises:
+        FileNotFoundError: If `path` is not a store.
+        ValueError: If the store was written by an incompatible version.
+    """
+
+    def __init__(self, path: str):
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.isfile(meta_path):
+            raise FileNotFoundError(f"No market data store at {path}")
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get("version") != _STORE_VERSION:
+            raise ValueError(
+                f"Unsupported store version {meta.get('version')}; expected {_STORE_VERSION}."
+            )
+        self.path = path
+        self.fields: list[str] = meta["fields"]
+        self.dates = pd.DatetimeIndex(
+            np.load(os.path.join(path, "dates.npy")), name="Date"
+        )
+        self.symbols = pd.Index(
+            np.load(os.path.join(path, "symbols.npy")), name="Symbol"
+        )
+        self._arrays: dict[str, np.memmap] = {}
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.dates), len(self.symbols)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Full (n_dates, n_symbols) read-only memory map of one field."""
+        if name not in self.fields:
+            raise KeyError(
+                f"Field '{name}' is not in the store; available: {self.fields}"
+            )
+        if name not in self._arrays:
+            self._arrays[name] = np.load(
+                os.path.join(self.path, f"{name}.npy"), mmap_mode="r"
+            )
+        return self._arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
+
+    def read(
+        self,
+        columns: list[str] | None = None,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        symbols: list | None = None,
+    ) -> Panel:
+        """
+        Read a date range and symbol subset as a `Panel` backed by the memory maps.
+
+        Date ranges are always zero-copy views. A symbol subset is a view as well
+        when it is a contiguous run of the store's (sorted) symbols; any other
+        subset is gathered into new arrays.
+
+        Args:
+            columns (list[str], optional): Fields to read. Defaults to all fields.
+            start (str | pd.Timestamp, optional): First date (inclusive).
+            end (str | pd.Timestamp, optional): Last date (inclusive).
+            symbols (list, optional): Symbols to read. Defaults to all symbols.
+
+        Returns:
+            Panel: Read-only panel over the selected rows and columns.
+
+        Raises:
+            KeyError: If a field is not in the store.
+            ValueError: If a symbol is not in the store.
+        """
+        columns = self.fields if columns is None else columns
+        first = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start))
+        last = (
+            len(self.dates)
+            if end is None
+            else self.dates.searchsorted(pd.Timestamp(end), side="right")
+        )
+        rows = slice(first, last)
+
+        if symbols is None:
+            cols = slice(None)
+            selected = self.symbols
+        else:
+            codes = self.symbols.get_indexer(pd.Index(symbols))
+            if (codes < 0).any():
+                unknown = list(pd.Index(symbols)[codes < 0])
+                raise ValueError(f"Unknown symbols: {unknown}")
+            contiguous = len(codes) > 0 and (np.diff(codes) == 1).all()
+            cols = slice(codes[0], codes[-1] + 1) if contiguous else codes
+            selected = self.symbols[cols]
+
+        return Panel(
+            dates=self.dates[rows],
+            symbols=selected,
+            fields={c: self[c][rows, cols] for c in columns},
+        )
+
+
+__all__ = ["MarketDataStore", "build_store", "write_store"]
@@ -0,0 +1,36 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+
+def make_market_data(n_dates: int = 40, n_symbols: int = 3, seed: int = 0):
+    """Random-walk OHLCV data in the layout of data/sample_data.csv."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2020-01-01", periods=n_dates)
+    frames = []
+    for symbol in range(n_symbols):
+        close = 10 * np.exp(np.cumsum(rng.normal(0, 0.02, n_dates)))
+        open_price = close * np.exp(rng.normal(0, 0.01, n_dates))
+        high = np.maximum(open_price, close) * (1 + rng.uniform(0, 0.02, n_dates))
+        low = np.minimum(open_price, close) * (1 - rng.uniform(0, 0.02, n_dates))
+        volume = rng.integers(1_000_000, 10_000_000, n_dates).astype(float)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Symbol": 600000 + symbol,
+                    "Date": dates.strftime("%m/%d/%Y"),
+                    "OpenPrice": open_price,
+                    "HighPrice": high,
+                    "LowPrice": low,
+                    "ClosePrice": close,
+                    "Volume": volume,
+                    "Amount": volume * close,
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture(scope="module")
+def market_data():
+    return make_market_data()
@@ -0,0 +1,120 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant import (
+    calculate_daily_return,
+    ic_decay,
+    ic_frame,
+    ic_summary,
+    information_coefficient,
+)
+from simplequant.factor.registry import compute_factors
+
+
+@pytest.fixture(scope="module")
+def ic_inputs(market_data):
+    factors = compute_factors(market_data, ["alpha_002", "alpha_014", "alpha_018"])
+    returns = (
+        market_data.assign(Date=pd.to_datetime(market_data["Date"]))
+        .set_index(["Date", "Symbol"])
+        .sort_index()
+    )
+    return factors, calculate_daily_return(returns)
+
+
+def _reference_ic(factor, returns, horizon, method):
+    # Per-date pandas loop the engine replaces
+    forward = (1 + returns).rolling(horizon).apply(np.prod, raw=True).shift(
+        -horizon
+    ) - 1
+    out = {}
+    for date in factor.index:
+        pair = pd.concat([factor.loc[date], forward.loc[date]], axis=1).dropna()
+        out[date] = (
+            pair.iloc[:, 0].corr(pair.iloc[:, 1], method=method)
+            if len(pair) >= 3
+            else np.nan
+        )
+    return pd.Series(out)
+
+
+def test_information_coefficient_matches_pandas_loop(ic_inputs):
+    factors, returns = ic_inputs
+    ic = information_coefficient(factors, returns, horizons=[1, 5])
+    assert list(ic.columns) == ["Date", "factor", "horizon", "ic", "rank_ic", "n_obs"]
+    assert len(ic) == 2 * 3 * 40
+
+    wide = returns["Return"].unstack("Symbol")
+    for name in factors:
+        for horizon in (1, 5):
+            rows = ic[(ic["factor"] == name) & (ic["horizon"] == horizon)]
+            for column, method in (("ic", "pearson"), ("rank_ic", "spearman")):
+                expected = _reference_ic(factors[name], wide, horizon, method)
+                np.testing.assert_allclose(
+                    rows[column].to_numpy(), expected.to_numpy(), atol=1e-12
+                )
+
+
+def test_information_coefficient_rank_ties_and_min_obs():
+    dates = pd.bdate_range("2021-01-01", periods=4)
+    returns = pd.DataFrame(
+        [[0.0] * 4, [0.01, 0.02, 0.02, -0.01], [0.0] * 4, [0.0] * 4],
+        index=dates,
+        columns=list("ABCD"),
+    )
+    factor = pd.DataFrame(
+        [[1.0, 2.0, 2.0, 0.0], [1.0, np.nan, np.nan, 0.0], [1, 2, 3, 4], [1, 2, 3, 4]],
+        index=dates,
+        columns=list("ABCD"),
+    )
+    ic = information_coefficient({"f": factor}, returns)
+    assert ic.loc[0, "rank_ic"] == pytest.approx(1.0)
+    assert ic.loc[0, "n_obs"] == 4
+    # Date 1 has two symbols left and a constant forward return on date 2
+    assert np.isnan(ic.loc[1, "ic"]) and ic.loc[1, "n_obs"] == 2
+    assert np.isnan(ic.loc[2, "ic"])
+    assert np.isnan(ic.loc[3, "ic"]) and ic.loc[3, "n_obs"] == 0
+
+
+def test_ic_summary_decay_and_frame(ic_inputs):
+    factors, returns = ic_inputs
+    ic = information_coefficient(factors, returns, horizons=[1, 3])
+
+    summary = ic_summary(ic)
+    assert list(summary.columns) == [
+        "ic_mean",
+        "ic_std",
+        "icir",
+        "rank_ic_mean",
+        "rank_ic_std",
+        "rank_icir",
+        "n_dates",
+    ]
+    row = summary.loc[("alpha_014", 3)]
+    series = ic[(ic["factor"] == "alpha_014") & (ic["horizon"] == 3)]["ic"]
+    assert row["icir"] == pytest.approx(series.mean() / series.std())
+    assert row["n_dates"] == series.count()
+
+    decay = ic_decay(ic)
+    assert list(decay.index) == list(factors) and list(decay.columns) == [1, 3]
+    assert decay.loc["alpha_014", 3] == pytest.approx(row["rank_ic_mean"])
+
+    frame = ic_frame(ic, "rank_ic", horizon=3, window=5)
+    assert list(frame.columns) == list(factors)
+    assert isinstance(frame.index, pd.DatetimeIndex)
+    raw = ic_frame(ic, "rank_ic", horizon=3)
+    pd.testing.assert_frame_equal(frame, raw.rolling(5).mean())
+
+
+def test_information_coefficient_errors(ic_inputs):
+    factors, returns = ic_inputs
+    with pytest.raises(ValueError, match="horizons must be positive integers"):
+        information_coefficient(factors, returns, horizons=[0])
+    with pytest.raises(ValueError, match="factors must contain"):
+        information_coefficient({}, returns)
+    ic = information_coefficient(factors, returns)
+    with pytest.raises(ValueError, match="horizon must be one of"):
+        ic_frame(ic, horizon=5)
+    with pytest.raises(ValueError, match="metric must be 'ic' or 'rank_ic'"):
+        ic_decay(ic, metric="r2")
@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant import backtest_sweep, calculate_daily_return, quantile_backtest
+
+
+@pytest.fixture(scope="module")
+def random_panel():
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2020-01-01", periods=60, name="Date")
+    symbols = pd.Index(range(25), name="Symbol")
+    factor = pd.DataFrame(rng.normal(size=(60, 25)), index=dates, columns=symbols)
+    factor.iloc[5, :4] = np.nan
+    returns = pd.DataFrame(
+        rng.normal(0, 0.02, size=(60, 25)), index=dates, columns=symbols
+    )
+    returns.iloc[10, 3] = np.nan
+    return factor, returns
+
+
+def _reference_buckets(factor, returns, q, holding_period):
+    # Per-date pandas loop: qcut of the ranks on each rebalance date
+    out = {}
+    for s in range(1, len(factor)):
+        t0 = (s - 1) // holding_period * holding_period
+        pct = factor.iloc[t0].rank(pct=True)
+        bucket = np.ceil(pct * q).clip(upper=q)
+        day = returns.iloc[s]
+        out[factor.index[s]] = day.groupby(bucket).mean().reindex(range(1, q + 1))
+    return pd.DataFrame(out).T
+
+
+@pytest.mark.parametrize("q, holding_period", [(5, 1), (4, 3)])
+def test_bucket_returns_match_loop(random_panel, q, holding_period):
+    factor, returns = random_panel
+    result = quantile_backtest(factor, returns, q, holding_period)
+    expected = _reference_buckets(factor, returns, q, holding_period)
+    np.testing.assert_allclose(
+        result.bucket_returns.to_numpy(), expected.to_numpy(), atol=1e-15
+    )
+    np.testing.assert_allclose(result.spread, expected[q] - expected[1], atol=1e-15)
+    assert result.bucket_returns.index.equals(factor.index[1:])
+
+
+def test_turnover_and_cost():
+    dates = pd.bdate_range("2021-01-01", periods=4)
+    factor = pd.DataFrame(
+        [[1, 2, 3, 4], [1, 2, 3, 4], [4, 3, 2, 1], [4, 3, 2, 1]],
+        index=dates,
+        columns=list("ABCD"),
+        dtype=float,
+    )
+    returns = pd.DataFrame(0.01, index=dates, columns=list("ABCD"))
+    result = quantile_backtest(factor, returns, n_quantiles=2, cost_bps=10)
+    # Formed at once (1), unchanged (0), then both legs fully replaced (2)
+    np.testing.assert_array_equal(result.turnover[2], [1.0, 0.0, 2.0])
+    np.testing.assert_array_equal(result.turnover[1], [1.0, 0.0, 2.0])
+    np.testing.assert_allclose(result.cost, [2e-3, 0.0, 4e-3])
+    np.testing.assert_allclose(result.pnl, -result.cost)
+
+    held = quantile_backtest(factor, returns, n_quantiles=2, holding_period=2)
+    np.testing.assert_array_equal(held.turnover[2], [1.0, 0.0, 2.0])
+    held = quantile_backtest(factor, returns, n_quantiles=2, holding_period=3)
+    np.testing.assert_array_equal(held.turnover[2], [1.0, 0.0, 0.0])
+
+
+def test_accepts_calculate_daily_return(market_data):
+    df = market_data.assign(Date=pd.to_datetime(market_data["Date"]))
+    df = df.set_index(["Date", "Symbol"]).sort_index()
+    returns = calculate_daily_return(df)
+    factor = df["ClosePrice"].unstack("Symbol")
+    result = quantile_backtest(factor, returns, n_quantiles=3)
+    wide = returns["Return"].unstack("Symbol")
+    expected = _reference_buckets(factor, wide, 3, 1)
+    np.testing.assert_allclose(result.bucket_returns.to_numpy(), expected.to_numpy())
+
+
+def test_summary_and_sweep(random_panel):
+    factor, returns = random_panel
+    result = quantile_backtest(factor, returns, 5, 5, cost_bps=5)
+    summary = result.summary()
+    pnl = result.pnl.dropna()
+    assert summary["ann_return"] == pytest.approx(pnl.mean() * 252)
+    assert summary["sharpe"] == pytest.approx(pnl.mean() / pnl.std() * np.sqrt(252))
+    assert 0 <= summary["max_drawdown"] < 1
+
+    sweep = backtest_sweep(factor, returns, [3, 5], [1, 5], cost_bps=5)
+    assert list(sweep.index) == [(3, 1), (3, 5), (5, 1), (5, 5)]
+    pd.testing.assert_series_equal(sweep.loc[(5, 5)], summary, check_names=False)
+
+
+def test_invalid_parameters(random_panel):
+    factor, returns = random_panel
+    with pytest.raises(ValueError, match="n_quantiles must be at least 2"):
+        quantile_backtest(factor, returns, n_quantiles=1)
+    with pytest.raises(ValueError, match="holding_period must be at least 1"):
+        quantile_backtest(factor, returns, holding_period=0)
+    with pytest.raises(ValueError, match="cost_bps must be non-negative"):
+        backtest_sweep(factor, returns, cost_bps=-1)
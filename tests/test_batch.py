@@ -0,0 +1,61 @@
+import pytest
+import numpy as np
+
+from simplequant import to_panel
+from simplequant.factor import BatchEvaluator, compute_batch, gtja
+from simplequant.factor.formula import Formula
+from simplequant.factor.registry import compute_factors
+
+
+@pytest.fixture(scope="module")
+def panel(market_data):
+    panel = to_panel(market_data)
+    # Suspensions restart the warm-up of every alpha
+    for c in panel.fields:
+        panel[c][12, 1] = np.nan
+    panel["Volume"][30, 0] = np.nan
+    return panel
+
+
+@pytest.mark.parametrize("name", sorted(gtja.PANEL_FORMULAS))
+def test_panel_formulas_match_panel_alphas(panel, name):
+    formula = Formula(gtja.PANEL_FORMULAS[name])
+    alpha = gtja.PANEL_ALPHAS[name]
+    assert formula.lookback <= alpha.lookback
+    assert set(formula.columns) <= set(alpha.columns)
+    result = BatchEvaluator([name]).run(panel)[name]
+    np.testing.assert_allclose(result, alpha(panel), rtol=1e-12, equal_nan=True)
+
+
+def test_batch_matches_compute_factors_and_shares_nodes(panel):
+    evaluator = BatchEvaluator()
+    assert evaluator.n_unique < evaluator.n_nodes
+    assert evaluator.roots["alpha_006"] == evaluator.roots["alpha_008"]
+
+    result = compute_batch(panel)
+    expected = compute_factors(panel)
+    assert list(result) == list(expected)
+    for name in expected:
+        np.testing.assert_allclose(
+            result[name].to_numpy(),
+            expected[name].to_numpy(),
+            rtol=1e-12,
+            equal_nan=True,
+        )
+
+
+def test_batch_memory_budget(panel):
+    node_mb = panel.shape[0] * panel.shape[1] * 8 / 2**20
+    unbounded = BatchEvaluator()
+    expected = unbounded.run(panel)
+
+    bounded = BatchEvaluator(memory_budget_mb=4 * node_mb)
+    delivered = {}
+    assert bounded.run(panel, on_result=delivered.__setitem__) == {}
+    assert bounded.n_batches > 1
+    assert bounded.peak_bytes <= 4 * node_mb * 2**20 < unbounded.peak_bytes
+    for name in expected:
+        np.testing.assert_array_equal(delivered[name], expected[name])
+
+    with pytest.raises(ValueError, match="memory_budget_mb must be positive"):
+        BatchEvaluator(memory_budget_mb=0)
@@ -0,0 +1,67 @@
+import dataclasses
+
+import pytest
+import numpy as np
+
+from benchmarks import (
+    compare,
+    load_baseline,
+    run_suite,
+    save_baseline,
+    synthetic_panel,
+)
+from simplequant.panel import OHLCV_COLUMNS
+
+
+def test_synthetic_panel_is_valid_ohlcv():
+    panel = synthetic_panel(60, 7, missing=0.1, seed=1)
+    assert panel.shape == (60, 7)
+    assert list(panel.fields) == OHLCV_COLUMNS
+    present = ~np.isnan(panel["ClosePrice"])
+    for name in OHLCV_COLUMNS:
+        np.testing.assert_array_equal(~np.isnan(panel[name]), present)
+    high, low = panel["HighPrice"][present], panel["LowPrice"][present]
+    assert (high >= panel["ClosePrice"][present]).all()
+    assert (low <= panel["OpenPrice"][present]).all()
+    assert 0 < (~present).mean() < 0.2
+
+
+def test_run_suite_covers_every_case():
+    panels = {"tiny": synthetic_panel(30, 5)}
+    results = run_suite(["tiny"], names=["alpha_002"], repeat=1, panels=panels)
+    assert [r.case for r in results] == [
+        "factor:alpha_002",
+        "calculate_daily_return",
+        "regress_model",
+        "neutralize_all_factors",
+        "compute_correlation_from_covariance",
+    ]
+    for r in results:
+        assert (r.size, r.n_dates, r.n_symbols) == ("tiny", 30, 5)
+        assert r.seconds > 0 and r.peak_mb >= 0
+        assert r.throughput == pytest.approx(r.cells / r.seconds)
+
+
+def test_run_suite_rejects_unknown_size():
+    with pytest.raises(ValueError, match="sizes must be in"):
+        run_suite(["huge"])
+
+
+def test_baseline_roundtrip_and_regression_flags(tmp_path):
+    panels = {"tiny": synthetic_panel(30, 5)}
+    results = run_suite(["tiny"], names=["alpha_002"], repeat=1, panels=panels)
+    path = tmp_path / "baseline.json"
+    save_baseline(results, str(path))
+    baseline = load_baseline(str(path))
+    assert baseline == results
+
+    report = compare(results, baseline)
+    assert not report["regression"].any()
+
+    slow = dataclasses.replace(results[0], seconds=10 * max(results[0].seconds, 1e-3))
+    heavy = dataclasses.replace(results[1], peak_mb=10 * max(results[1].peak_mb, 1))
+    new = dataclasses.replace(results[2], case="new_case")
+    report = compare([slow, heavy, new], baseline)
+    assert report["slower"].tolist() == [True, False, False]
+    assert report["more_memory"].tolist() == [False, True, False]
+    assert np.isnan(report.loc[("tiny", "new_case"), "time_ratio"])
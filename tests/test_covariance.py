@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant import (
+    RollingCovariance,
+    ewm_covariance,
+    rolling_covariance,
+    shrink_covariance,
+)
+
+
+@pytest.fixture(scope="module")
+def factor_returns():
+    rng = np.random.default_rng(0)
+    values = rng.normal(0.001, 0.02, size=(120, 4)) @ rng.normal(size=(4, 4))
+    return pd.DataFrame(values, columns=[f"alpha_{k:03d}" for k in range(1, 5)])
+
+
+def test_rolling_covariance_matches_np_cov(factor_returns):
+    out = rolling_covariance(factor_returns, window=20)
+    assert out.shape == (120, 4, 4)
+    assert np.isnan(out[:19]).all()
+    values = factor_returns.to_numpy()
+    for t in range(19, 120):
+        np.testing.assert_allclose(
+            out[t], np.cov(values[t - 19 : t + 1], rowvar=False), rtol=1e-10
+        )
+
+
+def test_rolling_covariance_skips_nan_rows(factor_returns):
+    values = factor_returns.to_numpy().copy()
+    values[30, 2] = np.nan
+    out = rolling_covariance(values, window=10, min_periods=5)
+    window = values[25:35]
+    expected = np.cov(window[np.isfinite(window).all(axis=1)], rowvar=False)
+    np.testing.assert_allclose(out[34], expected, rtol=1e-10)
+    np.testing.assert_allclose(out[4], np.cov(values[:5], rowvar=False))
+    assert np.isnan(out[3]).all()
+
+
+def test_rolling_covariance_ledoit_wolf(factor_returns):
+    sklearn_covariance = pytest.importorskip("sklearn.covariance")
+    values = factor_returns.to_numpy()
+    out = rolling_covariance(values, window=30, shrinkage="ledoit-wolf")
+    window = values[-30:]
+    intensity = sklearn_covariance.ledoit_wolf_shrinkage(window)
+    expected = shrink_covariance(np.cov(window, rowvar=False), intensity)
+    np.testing.assert_allclose(out[-1], expected, rtol=1e-9)
+
+
+def test_ewm_covariance_matches_pandas(factor_returns):
+    halflife = 10
+    out = ewm_covariance(factor_returns, halflife=halflife)
+    expected = (
+        factor_returns.ewm(halflife=halflife, adjust=False).cov(bias=True).to_numpy()
+    )
+    np.testing.assert_allclose(out[1:].reshape(-1, 4), expected[4:], rtol=1e-9)
+    assert np.isnan(out[0]).all()
+
+
+def test_shrink_covariance():
+    cov = np.array([[2.0, 0.5], [0.5, 4.0]])
+    np.testing.assert_allclose(shrink_covariance(cov, 0.0), cov)
+    np.testing.assert_allclose(shrink_covariance(cov, 1.0), 3.0 * np.eye(2))
+    with pytest.raises(ValueError, match="shrinkage must be in"):
+        shrink_covariance(cov, 1.5)
+
+
+def test_rolling_covariance_invalid_arguments():
+    with pytest.raises(ValueError, match="window must be an integer"):
+        RollingCovariance(1)
+    with pytest.raises(ValueError, match="min_periods must be in"):
+        RollingCovariance(5, min_periods=6)
+    estimator = RollingCovariance(5)
+    estimator.update(np.zeros(3))
+    with pytest.raises(ValueError, match="x must have shape"):
+        estimator.update(np.zeros(2))
@@ -0,0 +1,71 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant.factor.cross_section import (
+    cs_group_demean,
+    cs_rank,
+    cs_winsorize,
+    cs_zscore,
+)
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 6, size=(30, 12)).astype(float)  # many ties
+    x[rng.random(x.shape) < 0.2] = np.nan
+    x[3] = np.nan
+    return x
+
+
+def test_cs_rank_matches_pandas(matrix):
+    expected = pd.DataFrame(matrix).rank(axis=1, pct=True).to_numpy()
+    np.testing.assert_allclose(cs_rank(matrix), expected)
+
+
+def test_cs_rank_mask(matrix):
+    mask = np.ones(matrix.shape, dtype=bool)
+    mask[:, :4] = False
+    out = cs_rank(matrix, mask=mask)
+    assert np.isnan(out[:, :4]).all()
+    expected = pd.DataFrame(matrix[:, 4:]).rank(axis=1, pct=True).to_numpy()
+    np.testing.assert_allclose(out[:, 4:], expected)
+
+
+def test_cs_zscore_matches_pandas(matrix):
+    df = pd.DataFrame(matrix)
+    expected = df.sub(df.mean(axis=1), axis=0).div(df.std(axis=1, ddof=0), axis=0)
+    np.testing.assert_allclose(cs_zscore(matrix), expected.to_numpy(), atol=1e-12)
+
+    constant = np.array([[2.0, 2.0, np.nan], [1.0, np.nan, np.nan]])
+    np.testing.assert_array_equal(
+        cs_zscore(constant, ddof=1), [[0.0, 0.0, np.nan], [np.nan] * 3]
+    )
+
+
+def test_cs_winsorize():
+    x = np.array([[1.0, 2.0, 3.0, 4.0, 100.0, np.nan], [np.nan] * 6])
+    out = cs_winsorize(x, n_mad=2.0)
+    bound = 2.0 * 1.4826 * 1.0  # median 3, MAD 1
+    np.testing.assert_allclose(out[0, :5], [1.0, 2.0, 3.0, 4.0, 3.0 + bound])
+    assert np.isnan(out[0, 5]) and np.isnan(out[1]).all()
+    with pytest.raises(ValueError, match="n_mad must be positive"):
+        cs_winsorize(x, n_mad=0)
+
+
+def test_cs_group_demean_matches_groupby(matrix):
+    rng = np.random.default_rng(1)
+    industries = rng.choice(["bank", "tech", "energy"], size=matrix.shape[1])
+    out = cs_group_demean(matrix, industries)
+    for t in range(matrix.shape[0]):
+        row = pd.Series(matrix[t])
+        expected = row - row.groupby(industries).transform("mean")
+        np.testing.assert_allclose(out[t], expected.to_numpy(), atol=1e-12)
+
+    per_date = np.broadcast_to(industries, matrix.shape).astype(object).copy()
+    per_date[:, 0] = None
+    out = cs_group_demean(matrix, per_date)
+    assert np.isnan(out[:, 0]).all()
+    with pytest.raises(ValueError, match="groups must have shape"):
+        cs_group_demean(matrix, industries[:-1])
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+
+from simplequant import storage_dtype, to_panel
+from simplequant.factor import FactorCache, register_formula
+from simplequant.factor.registry import REGISTRY, compute_factors
+
+NAMES = ["alpha_002", "alpha_004", "alpha_014"]
+
+
+def _assert_same(result, expected):
+    assert list(result) == list(expected)
+    for name in expected:
+        pd.testing.assert_frame_equal(result[name], expected[name], check_freq=False)
+
+
+def test_factor_cache_matches_compute_factors(market_data, tmp_path):
+    panel = to_panel(market_data)
+    cache = FactorCache(str(tmp_path))
+    expected = compute_factors(panel, NAMES, start=panel.dates[10])
+
+    _assert_same(cache.compute(panel, NAMES, start=panel.dates[10]), expected)
+    assert cache.computed == dict.fromkeys(NAMES, 30)
+
+    again = cache.compute(panel, NAMES, start=panel.dates[15], end=panel.dates[20])
+    assert cache.computed == dict.fromkeys(NAMES, 0)
+    _assert_same(
+        again,
+        compute_factors(panel, NAMES, start=panel.dates[15], end=panel.dates[20]),
+    )
+
+
+def test_factor_cache_appends_new_dates(market_data, tmp_path):
+    panel = to_panel(market_data)
+    dates = panel.dates
+    cache = FactorCache(str(tmp_path))
+    history = market_data[pd.to_datetime(market_data["Date"]) <= dates[29]]
+    cache.compute(history, NAMES)
+
+    result = cache.compute(panel, NAMES)
+    assert cache.computed == dict.fromkeys(NAMES, 10)
+    _assert_same(result, compute_factors(panel, NAMES))
+
+
+def test_factor_cache_recomputes_revised_data(market_data, tmp_path):
+    cache = FactorCache(str(tmp_path))
+    cache.get(market_data, "alpha_014")
+
+    revised = market_data.copy()
+    revised.loc[5, "HighPrice"] *= 1.01
+    result = cache.get(revised, "alpha_014")
+    assert cache.computed == {"alpha_014": 40}
+    expected = compute_factors(revised, ["alpha_014"])["alpha_014"]
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    # Starting before the cached range computes only the earlier dates
+    cache.clear()
+    cache.get(revised, "alpha_014", start=revised["Date"].iloc[20])
+    assert cache.computed == {"alpha_014": 20}
+    result = cache.get(revised, "alpha_014")
+    assert cache.computed == {"alpha_014": 20}
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
+    cache.get(revised, "alpha_014")
+    assert cache.computed == {"alpha_014": 0}
+
+
+def test_factor_cache_lru_eviction(market_data, tmp_path):
+    panel = to_panel(market_data)
+    entry_bytes = 40 * 3 * 8
+    cache = FactorCache(str(tmp_path), max_bytes=2 * entry_bytes + 4096)
+    for name in ["alpha_002", "alpha_004", "alpha_014"]:
+        cache.get(panel, name)
+    cache.get(panel, "alpha_002")
+    cache.get(panel, "alpha_018")
+    assert cache.size_bytes() <= cache.max_bytes
+
+    cache.get(panel, "alpha_018")
+    assert cache.computed == {"alpha_018": 0}
+    cache.get(panel, "alpha_004")
+    assert cache.computed == {"alpha_004": 40}
+    np.testing.assert_array_equal(
+        cache.get(panel, "alpha_004").to_numpy(),
+        compute_factors(panel, ["alpha_004"])["alpha_004"].to_numpy(),
+    )
+
+
+def test_factor_cache_keys_formula_text(market_data, tmp_path):
+    name = "test_cache_formula"
+    cache = FactorCache(str(tmp_path))
+    try:
+        register_formula(name, "MEAN(CLOSE, 5)")
+        cache.get(market_data, name)
+        REGISTRY.pop(name)
+        register_formula(name, "MEAN(CLOSE, 6)")
+        result = cache.get(market_data, name)
+        assert cache.computed == {name: 40}
+        expected = compute_factors(market_data, [name])[name]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+    finally:
+        REGISTRY.pop(name, None)
+
+
+def test_factor_cache_storage_dtype(market_data, tmp_path):
+    panel = to_panel(market_data)
+    dates = panel.dates
+    cache = FactorCache(str(tmp_path))
+    with storage_dtype("float32"):
+        cache.get(panel, "alpha_014", end=dates[29])
+        result = cache.get(panel, "alpha_014")
+        assert cache.computed == {"alpha_014": 10}
+        assert (result.dtypes == np.float32).all()
+        expected = compute_factors(panel, ["alpha_014"])["alpha_014"]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    # Switching back to float64 rebuilds the entry rather than misreading it
+    result = cache.get(panel, "alpha_014")
+    assert cache.computed == {"alpha_014": 40}
+    assert (result.dtypes == np.float64).all()
+
+
+def test_factor_cache_extends_both_ways_without_mmap(market_data, tmp_path):
+    panel = to_panel(market_data)
+    dates = panel.dates
+    cache = FactorCache(str(tmp_path), mmap=False)
+    cache.compute(panel, NAMES, start=dates[15], end=dates[25])
+    result = cache.compute(panel, NAMES, start=dates[5])
+    assert cache.computed == dict.fromkeys(NAMES, 10 + 14)
+    _assert_same(result, compute_factors(panel, NAMES, start=dates[5]))
+    for frame in result.values():
+        assert not isinstance(frame.values.base, np.memmap)
+
+    # Every cached row survives, so the whole history is a hit
+    cache.compute(panel, NAMES, start=dates[5])
+    assert cache.computed == dict.fromkeys(NAMES, 0)
+    cache.clear()
+    assert cache.size_bytes() == 0
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant import (
+    AlphaCube,
+    evaluate_regression_model,
+    fama_macbeth,
+    regress_model,
+)
+
+
+@pytest.fixture(scope="module")
+def fm_inputs():
+    rng = np.random.default_rng(0)
+    n_dates, n_symbols, n_factors = 40, 60, 3
+    exposures = rng.normal(size=(n_dates, n_symbols, n_factors))
+    premia = np.array([0.01, -0.005, 0.0])
+    returns = exposures @ premia + rng.normal(0, 0.02, size=(n_dates, n_symbols))
+    returns[3, :10] = np.nan  # missing returns
+    exposures[5, 7, 1] = np.nan  # one missing exposure
+    mask = np.ones((n_dates, n_symbols), dtype=bool)
+    mask[8, 30:] = False
+    return returns, exposures, mask
+
+
+def test_matches_regress_model_per_date(fm_inputs):
+    returns, exposures, mask = fm_inputs
+    result = fama_macbeth(returns, exposures, mask=mask, max_memory_mb=0)
+
+    for d in range(len(returns)):
+        valid = (
+            np.isfinite(returns[d]) & np.isfinite(exposures[d]).all(axis=1) & mask[d]
+        )
+        assert result.n_obs.iloc[d] == valid.sum()
+        fit = regress_model(returns[d][valid], exposures[d][valid], fit_intercept=True)
+        row = result.factor_returns.iloc[d].to_numpy()
+        np.testing.assert_allclose(row[0], fit["intercept"], atol=1e-12)
+        np.testing.assert_allclose(row[1:], fit["beta"], atol=1e-12)
+
+        x = np.column_stack([np.ones(valid.sum()), exposures[d][valid]])
+        expected = evaluate_regression_model(returns[d][valid], row, x)
+        for name, value in expected.items():
+            np.testing.assert_allclose(result.metrics[name].iloc[d], value, rtol=1e-10)
+
+
+def test_weighted_and_without_intercept(fm_inputs):
+    returns, exposures, _ = fm_inputs
+    weights = np.random.default_rng(1).uniform(0.5, 2.0, size=returns.shape)
+    result = fama_macbeth(returns, exposures, weights=weights, fit_intercept=False)
+    assert list(result.factor_returns.columns) == ["factor_0", "factor_1", "factor_2"]
+
+    d = 3
+    valid = np.isfinite(returns[d])
+    fit = regress_model(
+        returns[d][valid], exposures[d][valid], weights=weights[d][valid]
+    )
+    np.testing.assert_allclose(result.factor_returns.iloc[d], fit["beta"], atol=1e-12)
+    np.testing.assert_allclose(result.r2.iloc[d], fit["R2"], rtol=1e-10)
+
+
+def test_rank_deficient_exposures_use_minimum_norm(fm_inputs):
+    returns, exposures, _ = fm_inputs
+    # A duplicated factor with a large mean, like an unscaled style exposure
+    shifted = exposures[:, :, :1] + 20.0
+    design = np.concatenate([shifted, exposures, shifted], axis=2)
+    result = fama_macbeth(returns, design)
+
+    d = 0
+    fit = regress_model(returns[d], design[d], fit_intercept=True)
+    row = result.factor_returns.iloc[d].to_numpy()
+    np.testing.assert_allclose(row[1:], fit["beta"], atol=1e-10)
+    np.testing.assert_allclose(row[0], fit["intercept"], atol=1e-8)
+    np.testing.assert_allclose(result.r2.iloc[d], fit["R2"], rtol=1e-10)
+
+
+def test_alpha_cube_alignment_and_min_obs(fm_inputs):
+    returns, exposures, _ = fm_inputs
+    dates = pd.bdate_range("2021-01-01", periods=len(returns), name="Date")
+    symbols = pd.Index([f"S{i}" for i in range(returns.shape[1])], name="Symbol")
+    cube = AlphaCube(exposures, dates, symbols, ["value", "momentum", "size"])
+    frame = pd.DataFrame(returns, index=dates, columns=symbols)
+    # Shuffled columns and an extra date are realigned to the cube
+    shuffled = frame.iloc[:, ::-1].copy()
+    shuffled.loc[dates[-1] + pd.Timedelta(days=1)] = 0.0
+
+    result = fama_macbeth(shuffled, cube, min_obs=55)
+    expected = fama_macbeth(returns, exposures, min_obs=55)
+    assert list(result.factor_returns.columns) == [
+        "intercept",
+        "value",
+        "momentum",
+        "size",
+    ]
+    assert result.factor_returns.index.equals(dates)
+    np.testing.assert_allclose(
+        result.factor_returns.to_numpy(), expected.factor_returns.to_numpy()
+    )
+    assert result.factor_returns.iloc[3].isna().all()  # 50 stocks < min_obs
+    assert result.metrics.iloc[3].isna().all()
+
+
+def test_summary_newey_west(fm_inputs):
+    returns, exposures, _ = fm_inputs
+    result = fama_macbeth(returns, exposures)
+    summary = result.summary(lags=2)
+    assert list(summary.index) == ["intercept", "factor_0", "factor_1", "factor_2"]
+
+    f = result.factor_returns["factor_0"].to_numpy()
+    n, c = len(f), f - f.mean()
+    gamma = [c[j:] @ c[: n - j] / n for j in range(3)]
+    variance = gamma[0] + 2 * (2 / 3 * gamma[1] + 1 / 3 * gamma[2])
+    row = summary.loc["factor_0"]
+    np.testing.assert_allclose(row["nw_se"], np.sqrt(variance / n))
+    np.testing.assert_allclose(row["nw_t_stat"], f.mean() / np.sqrt(variance / n))
+    np.testing.assert_allclose(row["t_stat"], f.mean() / (f.std(ddof=1) / np.sqrt(n)))
+    assert row["n_dates"] == n
+    assert summary.loc["factor_0", "nw_t_stat"] > 2  # true premium of 1%
+
+    # Zero lags reduce to the (biased-variance) Fama-MacBeth standard error
+    plain = result.summary(lags=0).loc["factor_0"]
+    np.testing.assert_allclose(plain["nw_se"], f.std() / np.sqrt(n))
+
+
+def test_rejects_inconsistent_shapes(fm_inputs):
+    returns, exposures, _ = fm_inputs
+    with pytest.raises(ValueError, match="returns must have shape"):
+        fama_macbeth(returns[:, :5], exposures)
+    with pytest.raises(ValueError, match="mask must have shape"):
+        fama_macbeth(returns, exposures, mask=np.ones((2, 2), dtype=bool))
+    with pytest.raises(ValueError, match="weights must be non-negative"):
+        fama_macbeth(returns, exposures, weights=-np.ones(returns.shape))
+    with pytest.raises(ValueError, match="factor_names must have one name"):
+        fama_macbeth(returns, exposures, factor_names=["a"])
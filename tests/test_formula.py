@@ -0,0 +1,204 @@
+import pytest
+import numpy as np
+
+from conftest import make_market_data
+from simplequant import compute_factors_parallel, to_panel
+from simplequant.factor import (
+    StreamingCalculator,
+    compile_formula,
+    gtja,
+    register_formula,
+)
+from simplequant.factor.cross_section import cs_group_demean, cs_rank
+from simplequant.factor.formula import (
+    SMA_TOLERANCE,
+    parse_formula,
+    sma_burn_in,
+    walk,
+)
+from simplequant.factor.operators import (
+    delta,
+    ts_corr,
+    ts_mean,
+    ts_regresi,
+    ts_sum,
+    ts_trend,
+)
+from simplequant.factor.registry import REGISTRY, compute_factors
+
+
+@pytest.fixture(scope="module")
+def panel(market_data):
+    return to_panel(market_data)
+
+
+@pytest.mark.parametrize(
+    "name, text",
+    [
+        ("alpha_008", "-1 * CORR(OPEN, VOLUME, 10)"),
+        ("alpha_009", "TSMAX(VOLUME, 5) / (MEAN(VOLUME, 5) + 1e-9)"),
+        ("alpha_010", "-1*TSRANK(CLOSE,6)"),
+        ("alpha_014", "(TSMAX(HIGH,6)-TSMIN(LOW,6))/(MA(HIGH,6)+0.000000001)"),
+        ("alpha_023", "MEAN(CLOSE,3)-DELAY(MEAN(CLOSE,3),3)"),
+        ("alpha_029", "close - delay(close, 14)"),
+        ("alpha_030", "STD(CLOSE,10)/(MEAN(CLOSE,10)+1e-9)"),
+    ],
+)
+def test_formula_matches_panel_alpha(panel, name, text):
+    formula = compile_formula(text)
+    expected = gtja.PANEL_ALPHAS[name]
+    assert formula.lookback == expected.lookback
+    assert set(formula.columns) == set(expected.columns)
+    np.testing.assert_allclose(formula(panel), expected(panel), rtol=1e-12)
+
+
+def test_formula_cross_sectional(panel):
+    text = "(-1 * CORR(RANK(DELTA(LOG(VOLUME),1)),RANK(((CLOSE-OPEN)/OPEN)),6))"
+    formula = compile_formula(text)
+    close, open_, volume = panel["ClosePrice"], panel["OpenPrice"], panel["Volume"]
+    expected = -1 * ts_corr(
+        cs_rank(delta(np.log(volume), 1)), cs_rank((close - open_) / open_), 6
+    )
+    np.testing.assert_allclose(formula(panel), expected, equal_nan=True)
+    assert formula.cross_sectional and formula.lookback == 7
+    assert formula.columns == ("OpenPrice", "ClosePrice", "Volume")
+    with pytest.raises(ValueError, match="Cross-sectional formula"):
+        formula.window_func(None)
+
+
+def test_parse_precedence_and_sharing():
+    assert parse_formula("1 + 2 * 3 ^ 2 ^ 0.5 - -1").params[0] == pytest.approx(
+        1 + 2 * 3**1.4142135623730951 + 1
+    )
+    assert parse_formula("-2^2").params[0] == -4.0
+    assert parse_formula("SUM(CLOSE, 20/2)").params == (10,)
+    # Aliases and repeats collapse to one node
+    root = parse_formula("RANK(MA(CLOSE,5)) + rank(mean(close, 5.9))")
+    assert root.args[0] == root.args[1]
+    assert len(list(walk(root))) == 4  # field, ts_mean, rank, add
+
+
+def test_formula_conditions_and_groups():
+    close = np.array([[1.0, 2.0, np.nan, 4.0], [3.0, 1.0, 2.0, 5.0]])
+    data = {"ClosePrice": close, "OpenPrice": np.full(close.shape, 2.0)}
+    out = compile_formula("CLOSE > OPEN ? CLOSE : -1 * OPEN")(data)
+    np.testing.assert_array_equal(
+        out, [[-2.0, -2.0, np.nan, 4.0], [3.0, -2.0, -2.0, 5.0]]
+    )
+    out = compile_formula("(CLOSE >= 2) && (OPEN == 2) || 0")(data)
+    np.testing.assert_array_equal(out, [[0.0, 1.0, np.nan, 1.0], [1.0, 0.0, 1.0, 1.0]])
+    np.testing.assert_array_equal(
+        compile_formula("CLOSE / (OPEN - 2)")(data), np.full(close.shape, np.nan)
+    )
+
+    industry = np.array(["a", "a", "b", "b"])
+    formula = compile_formula("IndNeutralize(close, IndClass.industry)")
+    np.testing.assert_array_equal(
+        formula(data, groups={"industry": industry}), cs_group_demean(close, industry)
+    )
+    with pytest.raises(ValueError, match="Group labels 'industry' are required"):
+        formula(data)
+
+
+def test_gtja_helper_functions(panel):
+    close, volume = panel["ClosePrice"], panel["Volume"]
+    # GTJA #21 and the one-argument DELAY of the published #30-style formulas
+    np.testing.assert_allclose(
+        compile_formula("REGBETA(MEAN(CLOSE,6),SEQUENCE(6))")(panel),
+        ts_trend(ts_mean(close, 6), 6),
+    )
+    np.testing.assert_array_equal(
+        compile_formula("REGBETA(CLOSE, SEQUENCE, 20)")(panel),
+        compile_formula("REGBETA(CLOSE, SEQUENCE(20))")(panel),
+    )
+    np.testing.assert_array_equal(
+        compile_formula("REGRESI(CLOSE, VOLUME, 6)")(panel),
+        ts_regresi(close, volume, 6),
+    )
+    np.testing.assert_array_equal(
+        compile_formula("CLOSE / DELAY(CLOSE) - 1")(panel),
+        compile_formula("RET")(panel),
+    )
+    np.testing.assert_array_equal(
+        compile_formula("SUM(FILTER(VOLUME, CLOSE > DELAY(CLOSE, 1)), 5)")(panel),
+        compile_formula("SUMIF(VOLUME, 5, CLOSE > DELAY(CLOSE, 1))")(panel),
+    )
+    np.testing.assert_array_equal(
+        compile_formula("SUMAC(CLOSE, 4)")(panel), ts_sum(close, 4)
+    )
+    assert compile_formula("REGBETA(MEAN(CLOSE,6),SEQUENCE(6))").lookback == 11
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("FOO(CLOSE)", "Unknown function 'FOO'"),
+        ("MEAN(CLOSE, 5", "Unexpected end of formula; expected '\\)'"),
+        ("MEAN(CLOSE)", "TS_MEAN takes 2 arguments; got 1"),
+        ("MEAN(CLOSE, OPEN)", "TS_MEAN expects a constant argument"),
+        ("CLOSE $ 2", "Unexpected character '\\$'"),
+        ("CLOSE OPEN", "Unexpected token 'OPEN' at position 6"),
+        ("1 + 2", "Formula must reference at least one field"),
+        ("MEAN(CLOSE, 0)", "TS_MEAN expects a window of at least 1; got 0"),
+        ("DELAY(CLOSE, -1)", "DELAY expects a window of at least 0; got -1"),
+        ("SMA(CLOSE, 2, 3)", "SMA requires 0 < m <= n"),
+        ("CLOSE * SEQUENCE(5)", "SEQUENCE is only supported as the regressor"),
+        ("REGBETA(CLOSE, SEQUENCE(5), 5)", "REGBETA takes SEQUENCE\\(n\\) or"),
+        ("CLOSE > 1 ? SELF : 0", "SELF .* is not supported"),
+        ("SUMAC(CLOSE)", "TS_SUM takes 2 arguments; got 1"),
+    ],
+)
+def test_formula_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        compile_formula(text)
+
+
+def test_register_formula(market_data, panel):
+    names = ["test_formula_ts", "test_formula_cs"]
+    try:
+        register_formula(names[0], "SUMIF(VOLUME, 5, CLOSE > DELAY(CLOSE, 1))")
+        register_formula(names[1], "RANK(HIGHDAY(HIGH, 5))", output="rank")
+        assert REGISTRY[names[0]].lookback == 6
+        result = compute_factors(panel, names)
+        assert result[names[0]].shape == panel.shape
+
+        sub_df = market_data[market_data["Symbol"] == panel.symbols[1]]
+        assert REGISTRY[names[0]].func(sub_df) == pytest.approx(
+            result[names[0]].iloc[-1, 1]
+        )
+
+        parallel = compute_factors_parallel(panel, names, n_workers=2)
+        for name in names:
+            np.testing.assert_array_equal(parallel[name], result[name])
+    finally:
+        for name in names:
+            REGISTRY.pop(name, None)
+
+
+def test_sma_lookback_covers_burn_in():
+    assert sma_burn_in(3, 3) == 1
+    assert 0.95 ** (sma_burn_in(20, 1) - 1) <= SMA_TOLERANCE
+    assert 0.95 ** (sma_burn_in(20, 1) - 2) > SMA_TOLERANCE
+    assert compile_formula("DELAY(SMA(CLOSE, 20, 1), 2)").lookback == 2 + sma_burn_in(
+        20, 1
+    )
+
+
+def test_sma_formula_trimmed_history_and_streaming_agree():
+    name = "test_formula_sma"
+    market_data = make_market_data(n_dates=300, n_symbols=2)
+    panel = to_panel(market_data)
+    try:
+        spec = register_formula(name, "SMA(CLOSE, 20, 1)")
+        assert spec.lookback < 300
+        full = compute_factors(panel, [name])[name]
+        start = panel.dates[-5]
+        trimmed = compute_factors(market_data, [name], start=start)[name]
+        np.testing.assert_allclose(trimmed, full.loc[start:], rtol=0, atol=1e-5)
+
+        calc = StreamingCalculator(names=[name])
+        for date, bars in market_data.groupby("Date", sort=False):
+            row = calc.update(bars)
+        np.testing.assert_allclose(row[name], full.iloc[-1], rtol=0, atol=1e-5)
+    finally:
+        REGISTRY.pop(name, None)
@@ -0,0 +1,37 @@
+import pytest
+import numpy as np
+
+from simplequant import to_panel
+from simplequant.factor import gtja
+
+
+def test_to_panel_layout(market_data):
+    panel = to_panel(market_data)
+    assert panel.shape == (40, 3)
+    assert panel.dates.is_monotonic_increasing
+    first = market_data.iloc[0]
+    assert panel["ClosePrice"][0, 0] == first["ClosePrice"]
+
+
+def test_to_panel_missing_column(market_data):
+    with pytest.raises(ValueError, match="Missing columns in input"):
+        to_panel(market_data, columns=["VWAP"])
+
+
+def test_compute_panel_unknown_alpha(market_data):
+    with pytest.raises(ValueError, match="Unknown alpha 'alpha_999'"):
+        gtja.compute_panel(market_data, "alpha_999")
+
+
+@pytest.mark.parametrize("name", sorted(gtja.PANEL_ALPHAS))
+def test_compute_panel_matches_per_window(market_data, name):
+    panel = to_panel(market_data)
+    result = gtja.compute_panel(panel, name)
+    func = getattr(gtja, name)
+
+    for j, symbol in enumerate(panel.symbols):
+        sub_df = market_data[market_data["Symbol"] == symbol].reset_index(drop=True)
+        expected = np.array([func(sub_df.iloc[: i + 1]) for i in range(len(sub_df))])
+        np.testing.assert_allclose(
+            result.iloc[:, j].to_numpy(), expected, rtol=1e-7, atol=1e-9
+        )
@@ -0,0 +1,165 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant import (
+    DayIndex,
+    calculate_daily_return,
+    calculate_forward_returns,
+    get_single_day_info,
+)
+
+
+def _long_frame(
+    dense: bool, seed: int = 0, dates: pd.DatetimeIndex | None = None
+) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    if dates is None:
+        dates = pd.bdate_range("2021-01-01", periods=30)
+    index = pd.MultiIndex.from_product([dates, ["A", "B", "C", "D"]])
+    index = index.set_names(["Date", "Symbol"])
+    df = pd.DataFrame({"ClosePrice": rng.uniform(5, 15, len(index))}, index=index)
+    df.iloc[[9, 22, 23]] = np.nan
+    if not dense:
+        # Symbols listing late and missing days
+        df = df.drop(index=df.index[[0, 4, 8, 13, 50, 51, 77]])
+    return df
+
+
+def _reference_daily(df: pd.DataFrame) -> pd.Series:
+    close = df.groupby(level="Symbol")["ClosePrice"].ffill()
+    return close.groupby(level="Symbol").pct_change(fill_method=None)
+
+
+@pytest.mark.parametrize("dense", [True, False])
+def test_calculate_daily_return_matches_groupby(dense):
+    df = _long_frame(dense)
+    out = calculate_daily_return(df)
+    assert out.index.equals(df.index)
+    assert list(out.columns) == ["ClosePrice", "Return"]
+    pd.testing.assert_series_equal(out["ClosePrice"], df["ClosePrice"])
+    np.testing.assert_allclose(out["Return"], _reference_daily(df), rtol=1e-15)
+
+
+@pytest.mark.parametrize("dense", [True, False])
+def test_returns_of_unsorted_input(dense):
+    df = _long_frame(dense)
+    shuffled = df.sample(frac=1.0, random_state=0)
+    out = calculate_daily_return(shuffled)
+    assert out.index.equals(shuffled.index)
+    pd.testing.assert_frame_equal(out.sort_index(), calculate_daily_return(df))
+    pd.testing.assert_frame_equal(
+        calculate_forward_returns(shuffled).sort_index(), calculate_forward_returns(df)
+    )
+
+
+@pytest.mark.parametrize("dense", [True, False])
+def test_calculate_forward_returns_matches_groupby(dense):
+    df = _long_frame(dense)
+    out = calculate_forward_returns(df, horizons=[1, 5])
+    assert list(out.columns) == [
+        "Return",
+        "LogReturn",
+        "Fwd1",
+        "Fwd5",
+        "LogFwd1",
+        "LogFwd5",
+    ]
+    close = df["ClosePrice"]
+    grouped = close.groupby(level="Symbol")
+    np.testing.assert_allclose(out["Return"], close / grouped.shift(1) - 1)
+    np.testing.assert_allclose(
+        out["LogReturn"], np.log(close / grouped.shift(1)), rtol=1e-12
+    )
+    for h in (1, 5):
+        np.testing.assert_allclose(out[f"Fwd{h}"], grouped.shift(-h) / close - 1)
+        np.testing.assert_allclose(
+            out[f"LogFwd{h}"], np.log(grouped.shift(-h) / close), atol=1e-14
+        )
+
+
+def test_returns_of_string_dates_across_years():
+    # "%m/%d/%Y" labels sort alphabetically out of date order across a year end
+    df = _long_frame(dense=False, dates=pd.bdate_range("2020-12-15", periods=30))
+    labels = df.index.levels[0].strftime("%m/%d/%Y")
+    labelled = df.set_axis(df.index.set_levels(labels, level="Date"))
+
+    def parsed(out):
+        level = pd.to_datetime(out.index.levels[0], format="%m/%d/%Y")
+        return out.set_axis(out.index.set_levels(level, level="Date")).sort_index()
+
+    for frame in (labelled, labelled.sort_index(), labelled.sample(frac=1.0)):
+        pd.testing.assert_frame_equal(
+            parsed(calculate_daily_return(frame)), calculate_daily_return(df)
+        )
+        pd.testing.assert_frame_equal(
+            parsed(calculate_forward_returns(frame)), calculate_forward_returns(df)
+        )
+
+
+def test_returns_of_empty_frame():
+    empty = _long_frame(dense=True).iloc[:0]
+    out = calculate_daily_return(empty)
+    assert out.empty and list(out.columns) == ["ClosePrice", "Return"]
+    forward = calculate_forward_returns(empty, horizons=[1])
+    assert forward.empty and list(forward.columns) == [
+        "Return",
+        "LogReturn",
+        "Fwd1",
+        "LogFwd1",
+    ]
+
+
+def test_calculate_forward_returns_errors():
+    df = _long_frame(dense=True)
+    with pytest.raises(ValueError, match="horizons must be positive integers"):
+        calculate_forward_returns(df, horizons=[0, 5])
+    with pytest.raises(ValueError, match="Missing 'ClosePrice'"):
+        calculate_forward_returns(df.rename(columns={"ClosePrice": "Close"}))
+
+
+def test_day_index_matches_mask_scan(market_data):
+    days = DayIndex(market_data)
+    assert len(days) == market_data["Date"].nunique()
+    assert days.frame["Date"].dtype == "datetime64[ns]"
+    for date in ["01/02/2020", "2020-01-15", pd.Timestamp("2020-02-25")]:
+        expected = market_data[pd.to_datetime(market_data["Date"]) == date]
+        out = get_single_day_info(days, date)
+        pd.testing.assert_frame_equal(
+            out.drop(columns="Date"), expected.drop(columns="Date")
+        )
+    assert "2020-01-15" in days
+    assert get_single_day_info(days, "2020-01-04").empty  # a Saturday
+
+
+def test_day_index_slices_share_memory(market_data):
+    days = DayIndex(market_data)
+    day = days.day("2020-01-15")
+    assert np.shares_memory(
+        day["ClosePrice"].to_numpy(), days.frame["ClosePrice"].to_numpy()
+    )
+
+
+def test_day_index_unsorted_and_ranges(market_data):
+    shuffled = market_data.sample(frac=1.0, random_state=0)
+    days = DayIndex(shuffled, date_format="%m/%d/%Y")
+    assert days.dates.is_monotonic_increasing
+    window = days.between("2020-01-10", "2020-01-16")
+    assert sorted(window["Date"].unique()) == list(
+        pd.bdate_range("2020-01-10", "2020-01-16")
+    )
+    assert len(days.between()) == len(market_data)
+    assert days.between("2021-01-01").empty
+    counts = {date: len(day) for date, day in days}
+    assert set(counts.values()) == {market_data["Symbol"].nunique()}
+
+
+def test_day_index_multiindex():
+    df = _long_frame(dense=False)
+    days = DayIndex(calculate_daily_return(df))
+    date = df.index.get_level_values("Date")[10]
+    pd.testing.assert_frame_equal(
+        days.day(date), calculate_daily_return(df).xs(date, drop_level=False)
+    )
+    with pytest.raises(ValueError, match="No valid date column"):
+        DayIndex(df.reset_index(drop=True))
@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+import pandas as pd
+
+import simplequant
+
+# Import cost of simplequant on top of numpy and pandas, measured in a fresh
+# interpreter. Headless workers are started thousands of times a day, so
+# plotting and scipy must stay out of this path.
+IMPORT_BUDGET_S = 1.0
+HEAVY_MODULES = ["matplotlib", "seaborn", "scipy", "sklearn"]
+
+_PROBE = """
+import json, sys, time
+import numpy, pandas
+start = time.perf_counter()
+import simplequant, simplequant.factor
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": [m for m in %r if m in sys.modules],
+    "float_format": pandas.options.display.float_format is not None,
+}))
+""" % (HEAVY_MODULES,)
+
+
+# Directory containing the simplequant package, so the child imports the same
+# tree as the tests whatever directory pytest runs from
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(simplequant.__file__)))
+
+
+def _probe() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return json.loads(out.stdout)
+
+
+def test_import_skips_heavy_modules_and_stays_in_budget():
+    # Best of three, so a busy machine does not fail the guard
+    results = [_probe() for _ in range(3)]
+    assert results[0]["loaded"] == []
+    assert not results[0]["float_format"]
+    elapsed = min(r["elapsed"] for r in results)
+    assert elapsed < IMPORT_BUDGET_S, f"import simplequant took {elapsed:.2f}s"
+
+
+def test_lazy_plot_exports():
+    from simplequant import plot
+
+    assert set(plot.__all__) <= set(simplequant.__all__)
+    assert simplequant.plot_model_comparison is plot.plot_model_comparison
+    assert "plot_factor_matrix" in dir(simplequant)
+    assert pd.options.display.float_format is None
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="not_a_function"):
+        simplequant.not_a_function
@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant import (
+    AlphaMatrixIngestor,
+    LocalAlphaSource,
+    ddb_alpha_matrix_to_df,
+    save_alpha_matrices,
+    storage_dtype,
+)
+
+
+@pytest.fixture
+def matrices():
+    rng = np.random.default_rng(0)
+    dates = np.array(["2021-01-04", "2021-01-05", "2021-01-06"], dtype="datetime64[ns]")
+    tickers = np.array(["000001", "000002", "600000", "600519"], dtype=object)
+    return {
+        f"alpha_{k:03d}": (rng.normal(size=(3, 4)), dates, tickers) for k in range(1, 4)
+    }
+
+
+def test_to_frame_wraps_values_without_copy(matrices):
+    values, dates, tickers = matrices["alpha_001"]
+    df = ddb_alpha_matrix_to_df(matrices["alpha_001"])
+    assert np.shares_memory(df.to_numpy(), values)
+    expected = pd.DataFrame(values, index=pd.to_datetime(dates), columns=tickers)
+    pd.testing.assert_frame_equal(df, expected, check_names=False)
+
+
+def test_label_indexes_are_cached(matrices):
+    ingestor = AlphaMatrixIngestor()
+    frames = [ingestor.to_frame(m) for m in matrices.values()]
+    assert ingestor.misses == 2 and ingestor.hits == 4
+    assert all(f.index is frames[0].index for f in frames)
+    assert all(f.columns is frames[0].columns for f in frames)
+
+    values, dates, tickers = matrices["alpha_001"]
+    with pytest.raises(
+        ValueError, match=r"values must have shape \(n_dates, n_tickers\)"
+    ):
+        ingestor.to_frame((values[:2], dates, tickers))
+
+
+def test_stack_into_cube(matrices):
+    cube = AlphaMatrixIngestor().stack(matrices)
+    assert cube.values.shape == (3, 4, 3)
+    assert cube.factors == list(matrices)
+    for k, (values, _, _) in enumerate(matrices.values()):
+        np.testing.assert_array_equal(cube.values[:, :, k], values)
+    np.testing.assert_array_equal(cube.frame("alpha_002"), matrices["alpha_002"][0])
+    assert list(cube.frames()) == list(matrices)
+    with pytest.raises(KeyError, match="Factor 'alpha_999' is not in the cube"):
+        cube.frame("alpha_999")
+
+    with storage_dtype("float32"):
+        assert AlphaMatrixIngestor().stack(matrices).values.dtype == np.float32
+
+
+def test_stack_aligns_different_labels(matrices):
+    values, dates, tickers = matrices["alpha_001"]
+    other = (values[1:, :2], dates[1:], tickers[:2][::-1])
+    cube = AlphaMatrixIngestor().stack({"a": matrices["alpha_001"], "b": other})
+    assert cube.values.shape == (3, 4, 2)
+    b = cube.frame("b")
+    assert np.isnan(b.iloc[0]).all() and np.isnan(b.iloc[:, 2:]).all().all()
+    np.testing.assert_array_equal(b.loc[dates[1:], tickers[:2][::-1]], values[1:, :2])
+
+
+def test_local_source_replays_matrices(matrices, tmp_path):
+    source = save_alpha_matrices(tmp_path / "alphas", matrices)
+    assert source.names == list(matrices) and len(source) == 3
+    assert len(list((tmp_path / "alphas").glob("*-*.npy"))) == 2
+
+    fetched = LocalAlphaSource(tmp_path / "alphas").fetch()
+    first = next(iter(fetched.values()))
+    for name, (values, dates, tickers) in fetched.items():
+        assert isinstance(values, np.memmap)
+        np.testing.assert_array_equal(values, matrices[name][0])
+        assert dates is first[1] and tickers is first[2]
+    assert list(fetched["alpha_001"][2]) == list(matrices["alpha_001"][2])
+
+    ingestor = AlphaMatrixIngestor()
+    cube = ingestor.stack(fetched)
+    np.testing.assert_array_equal(
+        cube.values, AlphaMatrixIngestor().stack(matrices).values
+    )
+
+    with pytest.raises(FileExistsError):
+        save_alpha_matrices(tmp_path / "alphas", matrices)
+    with pytest.raises(KeyError, match="Alpha 'alpha_999' is not in the source"):
+        source["alpha_999"]
+    with pytest.raises(FileNotFoundError):
+        LocalAlphaSource(tmp_path)
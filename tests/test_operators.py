@@ -0,0 +1,135 @@
+import pytest
+import numpy as np
+from scipy.stats import rankdata
+
+from simplequant.factor.operators import (
+    delta,
+    ts_sum,
+    ts_mean,
+    ts_max,
+    ts_min,
+    ts_std,
+    ts_corr,
+    ts_regbeta,
+    ts_regresi,
+    ts_trend,
+    ts_trend_resid,
+    ts_rank,
+    ts_quantile,
+    sma,
+    decay_linear,
+    ts_prod,
+    ts_argmax,
+    ts_argmin,
+    wma,
+)
+
+
+@pytest.fixture
+def x():
+    rng = np.random.default_rng(1)
+    values = 10 + rng.normal(size=(50, 4)).cumsum(axis=0)
+    values[20, 1] = np.nan
+    values[30:38, 2] = 7.25  # constant stretch
+    return values
+
+
+def brute_force(x, window, func):
+    out = np.full(x.shape, np.nan)
+    for t in range(window - 1, len(x)):
+        for j in range(x.shape[1]):
+            win = x[t - window + 1 : t + 1, j]
+            if not np.isnan(win).any():
+                out[t, j] = func(win)
+    return out
+
+
+@pytest.mark.parametrize("window", [1, 3, 5, 8])
+@pytest.mark.parametrize(
+    "op, func",
+    [
+        (ts_sum, np.sum),
+        (ts_mean, np.mean),
+        (ts_max, np.max),
+        (ts_min, np.min),
+        (ts_std, np.std),
+        (ts_rank, lambda w: rankdata(w)[-1]),
+        (
+            decay_linear,
+            lambda w: np.dot(w, np.arange(1, len(w) + 1)) / w.size / (w.size + 1) * 2,
+        ),
+        (ts_prod, np.prod),
+        (ts_argmax, lambda w: np.argmax(w) + 1),
+        (ts_argmin, lambda w: np.argmin(w) + 1),
+        (wma, lambda w: np.average(w, weights=0.9 ** np.arange(len(w))[::-1])),
+    ],
+)
+def test_rolling_matches_brute_force(x, window, op, func):
+    np.testing.assert_allclose(
+        op(x, window), brute_force(x, window, func), rtol=1e-9, atol=1e-9
+    )
+
+
+def test_ts_std_constant_window_is_zero(x):
+    assert ts_std(x, 8)[37, 2] == 0.0
+
+
+def test_ts_corr(x):
+    y = np.sqrt(np.abs(x)) + np.arange(50)[:, None] % 3
+    expected = np.full(x.shape, np.nan)
+    for t in range(5, 50):
+        for j in range(4):
+            a, b = x[t - 5 : t + 1, j], y[t - 5 : t + 1, j]
+            if not (np.isnan(a).any() or np.ptp(a) == 0):
+                expected[t, j] = np.corrcoef(a, b)[0, 1]
+    np.testing.assert_allclose(ts_corr(x, y, 6), expected, rtol=1e-7, atol=1e-9)
+
+
+def test_rolling_regressions(x):
+    y = np.sqrt(np.abs(x)) + np.arange(50)[:, None] % 3
+    sequence = np.arange(1.0, 7.0)
+
+    def fit(a, b):
+        slope, intercept = np.polyfit(b, a, 1)
+        return slope, a[-1] - intercept - slope * b[-1]
+
+    for t, j in [(5, 0), (17, 3), (40, 1), (45, 2)]:
+        a, b = y[t - 5 : t + 1, j], x[t - 5 : t + 1, j]
+        np.testing.assert_allclose(
+            [ts_regbeta(a[:, None], b[:, None], 6)[-1, 0], ts_regresi(y, x, 6)[t, j]],
+            fit(a, b),
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            [ts_trend(y, 6)[t, j], ts_trend_resid(y, 6)[t, j]],
+            fit(a, sequence),
+            atol=1e-9,
+        )
+    # Windows with a NaN or a constant regressor
+    assert np.isnan(ts_trend(x, 6)[20, 1]) and np.isnan(ts_regbeta(y, x, 8)[37, 2])
+
+
+def test_ts_quantile(x):
+    np.testing.assert_allclose(
+        ts_quantile(x, 10, 75), brute_force(x, 10, lambda w: np.percentile(w, 75))
+    )
+
+
+def test_delta(x):
+    np.testing.assert_allclose(delta(x, 2)[2:], x[2:] - x[:-2])
+    assert np.isnan(delta(x, 2)[:2]).all()
+
+
+def test_sma_recursion():
+    x = np.array([[1.0], [2.0], [3.0]])
+    np.testing.assert_allclose(sma(x, 3, 1)[:, 0], [1.0, 4 / 3, 17 / 9])
+
+
+def test_invalid_window(x):
+    with pytest.raises(ValueError, match="window must be a positive integer"):
+        ts_mean(x, 0)
+
+
+def test_invalid_sma_weights(x):
+    with pytest.raises(ValueError, match="SMA requires 0 < m <= n"):
+        sma(x, 2, 3)
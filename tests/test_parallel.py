@@ -0,0 +1,88 @@
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import numpy as np
+
+from simplequant import (
+    RegressionStats,
+    compute_factors_parallel,
+    neutralize_all_factors,
+    neutralize_parallel,
+    to_panel,
+)
+from simplequant import parallel
+from simplequant.factor import register_formula, registry
+
+
+def test_compute_factors_parallel_matches_serial(market_data):
+    panel = to_panel(market_data)
+    serial = registry.compute_factors(panel)
+    parallel = compute_factors_parallel(panel, n_workers=2)
+    assert list(parallel) == list(serial)
+    for name, frame in serial.items():
+        np.testing.assert_array_equal(parallel[name].to_numpy(), frame.to_numpy())
+
+
+def test_compute_factors_parallel_spawn_sees_runtime_factors(market_data, monkeypatch):
+    # Spawned workers import a fresh registry without the formula registered here
+    spawn = multiprocessing.get_context("spawn")
+    monkeypatch.setattr(
+        parallel,
+        "ProcessPoolExecutor",
+        functools.partial(ProcessPoolExecutor, mp_context=spawn),
+    )
+    panel = to_panel(market_data)
+    names = ["test_parallel_formula", "test_parallel_lambda", "alpha_001"]
+    try:
+        register_formula(names[0], "CLOSE - DELAY(CLOSE, 3)")
+        spec = registry.REGISTRY["alpha_002"]
+        registry.register_factor(
+            registry.FactorSpec(
+                name=names[1],
+                lookback=spec.lookback,
+                columns=spec.columns,
+                output="float",
+                func=spec.func,
+                panel_func=lambda data: spec.panel_func(data) * 2,
+            )
+        )
+        serial = registry.compute_factors(panel, names)
+        result = compute_factors_parallel(panel, names, n_workers=2)
+        for name in names:
+            np.testing.assert_array_equal(result[name], serial[name])
+    finally:
+        for name in names[:2]:
+            registry.REGISTRY.pop(name, None)
+
+
+def test_neutralize_parallel_matches_serial():
+    rng = np.random.default_rng(0)
+    factors = rng.normal(size=(6, 30, 4))
+    factors[2, 5, 1] = np.nan
+    exposures = rng.normal(size=(6, 30, 3))
+    parallel = neutralize_parallel(factors, exposures, fit_intercept=True, n_workers=2)
+    for d in range(6):
+        np.testing.assert_array_equal(
+            parallel[d],
+            neutralize_all_factors(factors[d], exposures[d], fit_intercept=True),
+        )
+
+
+def test_neutralize_parallel_merges_worker_stats():
+    rng = np.random.default_rng(1)
+    factors = rng.normal(size=(5, 20, 2))
+    factors[1, 3, 0] = np.nan
+    exposures = rng.normal(size=(5, 20, 2))
+    serial, parallel = RegressionStats(), RegressionStats()
+    neutralize_parallel(factors, exposures, n_workers=1, stats=serial)
+    neutralize_parallel(factors, exposures, n_workers=2, stats=parallel)
+    assert parallel.calls == serial.calls == 5
+    assert parallel.skips == serial.skips == {"invalid": 1}
+    assert parallel.regressed == serial.regressed == 9
+
+
+def test_neutralize_parallel_shape_mismatch():
+    with pytest.raises(ValueError, match="must share \\(n_dates, n_samples\\)"):
+        neutralize_parallel(np.ones((2, 5, 1)), np.ones((2, 4, 1)))
@@ -1,8 +1,15 @@
+import os
+import re
+
 import pytest
 import pandas as pd
 import numpy as np
 
-from simplequant import plot_factor_matrix, plot_model_comparison
+from simplequant import (
+    plot_factor_matrix,
+    plot_model_comparison,
+    render_factor_matrices,
+)
 
 
 # plot_factor_matrix tests
@@ -38,3 +45,144 @@ def test_invalid_metric_name():
 
     with pytest.raises(ValueError, match="Invalid metric 'bad_metric'"):
         plot_model_comparison(df, metric="bad_metric")
+
+
+def test_plot_model_comparison_saves_without_showing(tmp_path, monkeypatch):
+    import matplotlib.pyplot as plt
+
+    shown = []
+    monkeypatch.setattr(plt, "show", lambda *a, **k: shown.append(True))
+    df = pd.DataFrame(
+        {"Model 1": [0.1, 0.2, 0.3]}, index=pd.date_range("2025-01-01", periods=3)
+    )
+    path = tmp_path / "out" / "r2.png"
+    plot_model_comparison(df, metric="r2", save_path=str(path))
+    assert path.exists()
+    assert not shown
+
+
+# render_factor_matrices tests
+
+
+def _corr_stack(n_dates=3, k=4, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(n_dates, 50, k))
+    stack = np.stack([np.corrcoef(day, rowvar=False) for day in x])
+    dates = pd.date_range("2025-01-01", periods=n_dates)
+    return stack, dates, [f"F{i}" for i in range(k)]
+
+
+def test_render_pngs_one_per_date(tmp_path):
+    from PIL import Image
+
+    stack, dates, names = _corr_stack()
+    paths = render_factor_matrices(
+        stack,
+        dates,
+        names,
+        "corr",
+        str(tmp_path / "frames"),
+        n_workers=2,
+        figsize=(4, 3),
+        dpi=50,
+    )
+    assert [os.path.basename(p) for p in paths] == [
+        "corr_2025-01-01.png",
+        "corr_2025-01-02.png",
+        "corr_2025-01-03.png",
+    ]
+    sizes = {Image.open(p).size for p in paths}
+    assert sizes == {(200, 150)}
+
+
+def test_render_gif_and_pdf(tmp_path):
+    from PIL import Image
+
+    stack, dates, names = _corr_stack(n_dates=4)
+    (gif,) = render_factor_matrices(
+        stack * 0.01,
+        dates,
+        names,
+        "cov",
+        str(tmp_path / "cov.gif"),
+        n_workers=1,
+        figsize=(4, 3),
+        dpi=50,
+    )
+    with Image.open(gif) as image:
+        assert image.n_frames == 4
+
+    (pdf,) = render_factor_matrices(
+        stack, dates, names, "corr", str(tmp_path / "corr.pdf"), figsize=(4, 3)
+    )
+    with open(pdf, "rb") as f:
+        assert re.search(rb"/Count (\d+)", f.read()).group(1) == b"4"
+
+
+def test_render_gif_across_workers(tmp_path):
+    from PIL import Image, ImageSequence
+
+    stack, dates, names = _corr_stack(n_dates=6)
+    (gif,) = render_factor_matrices(
+        stack,
+        dates,
+        names,
+        "corr",
+        str(tmp_path / "corr.gif"),
+        n_workers=2,
+        figsize=(4, 3),
+        dpi=50,
+    )
+    with Image.open(gif) as image:
+        assert image.n_frames == 6
+        # Frames differ, so they arrive in date order rather than repeated
+        frames = [np.asarray(f.convert("RGB")) for f in ImageSequence.Iterator(image)]
+    assert all((a != b).any() for a, b in zip(frames, frames[1:]))
+
+
+def test_render_gif_frame_cap(tmp_path, monkeypatch):
+    from simplequant import plot
+
+    monkeypatch.setattr(plot, "GIF_MAX_FRAMES", 3)
+    stack, dates, names = _corr_stack(n_dates=4)
+    with pytest.raises(ValueError, match="GIF output must have at most 3 frames"):
+        render_factor_matrices(stack, dates, names, "corr", str(tmp_path / "c.gif"))
+    assert not (tmp_path / "c.gif").exists()
+
+
+def test_render_annotation_threshold(tmp_path, monkeypatch):
+    from simplequant import plot
+    from simplequant.plot import ANNOTATE_MAX_FACTORS
+
+    configs = []
+    init = plot._init_renderer
+    monkeypatch.setattr(
+        plot, "_init_renderer", lambda config: configs.append(config) or init(config)
+    )
+    for k in (3, ANNOTATE_MAX_FACTORS + 1):
+        stack, dates, names = _corr_stack(n_dates=1, k=k)
+        render_factor_matrices(
+            stack,
+            dates,
+            names,
+            "corr",
+            str(tmp_path),
+            n_workers=1,
+            figsize=(4, 3),
+            dpi=50,
+        )
+    assert [config[-1] for config in configs] == [True, False]
+    assert len(plot._RENDERER.texts) == 0
+
+    renderer = plot._MatrixRenderer(["A", "B"], "corr", (4, 3), 50, True)
+    renderer.update(np.array([[1.0, 0.25], [0.25, np.nan]]), "2025-01-01")
+    assert [t.get_text() for t in renderer.texts] == ["1.00", "0.25", "0.25", ""]
+    assert renderer.title.get_text() == "Correlation Matrix on 2025-01-01"
+
+
+def test_render_rejects_mismatched_shapes(tmp_path):
+    stack, dates, names = _corr_stack()
+    with pytest.raises(ValueError, match="matrices must have shape"):
+        render_factor_matrices(stack, dates, names[:2], "corr", str(tmp_path))
+    with pytest.raises(ValueError, match="dates must have one entry"):
+        render_factor_matrices(stack, dates[:2], names, "corr", str(tmp_path))
@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+
+from simplequant import (
+    get_storage_dtype,
+    neutralize_cube,
+    set_storage_dtype,
+    storage_dtype,
+    to_panel,
+)
+from simplequant.factor import precision_report
+from simplequant.factor.operators import ts_corr, ts_var
+from simplequant.factor.registry import compute_factors
+
+
+def test_storage_dtype_context_restores_previous():
+    assert get_storage_dtype() == np.float64
+    with storage_dtype("float32") as dtype:
+        assert dtype == np.float32
+        assert get_storage_dtype() == np.float32
+    assert get_storage_dtype() == np.float64
+
+
+def test_storage_dtype_rejects_other_dtypes():
+    for dtype in ("float16", "int64", "not-a-dtype", None):
+        with pytest.raises(ValueError, match="dtype must be float32 or float64"):
+            set_storage_dtype(dtype)
+    assert get_storage_dtype() == np.float64
+
+
+def test_to_panel_follows_storage_dtype(market_data):
+    assert to_panel(market_data)["ClosePrice"].dtype == np.float64
+    with storage_dtype(np.float32):
+        panel = to_panel(market_data)
+    assert all(values.dtype == np.float32 for values in panel.fields.values())
+    assert panel.astype("float64")["ClosePrice"].dtype == np.float64
+
+
+def test_rolling_moments_accumulate_in_float64():
+    # A large level with small moves: squaring in float32 would lose the variance
+    rng = np.random.default_rng(0)
+    x = (1e4 + rng.normal(0, 0.1, size=(200, 3))).astype(np.float32)
+    y = (x + rng.normal(0, 0.05, size=x.shape)).astype(np.float32)
+    np.testing.assert_array_equal(ts_var(x, 20), ts_var(x.astype(float), 20))
+    np.testing.assert_array_equal(
+        ts_corr(x, y, 20), ts_corr(x.astype(float), y.astype(float), 20)
+    )
+
+
+def test_float32_factors_close_to_float64(market_data):
+    names = ["alpha_002", "alpha_014", "alpha_018"]
+    reference = compute_factors(market_data, names)
+    with storage_dtype("float32"):
+        reduced = compute_factors(market_data, names)
+    for name in names:
+        assert reduced[name].to_numpy().dtype == np.float32
+        np.testing.assert_allclose(
+            reduced[name].to_numpy(), reference[name].to_numpy(), rtol=1e-4, atol=1e-4
+        )
+
+
+def test_neutralize_cube_float32_storage():
+    rng = np.random.default_rng(1)
+    exposures = rng.normal(size=(5, 30, 3))
+    factors = rng.normal(size=(5, 30, 4))
+    reference = neutralize_cube(factors, exposures, fit_intercept=True)
+    with storage_dtype("float32"):
+        out = neutralize_cube(
+            factors.astype(np.float32), exposures.astype(np.float32), fit_intercept=True
+        )
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, reference, atol=1e-5)
+
+
+def test_precision_report(market_data):
+    names = ["alpha_004", "alpha_014", "alpha_018"]
+    report = precision_report(market_data, names)
+    assert list(report.index) == names
+    assert list(report.columns) == [
+        "max_abs_dev",
+        "max_rel_dev",
+        "nan_mismatch",
+        "passed",
+    ]
+    assert report.loc["alpha_014", "max_rel_dev"] < 1e-5
+    assert report.loc["alpha_014", "passed"]
+    assert (report["nan_mismatch"] == 0).all()
+    assert get_storage_dtype() == np.float64
@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant.factor import gtja, registry
+
+
+def test_registry_covers_gtja():
+    assert set(registry.REGISTRY) == set(gtja.PANEL_ALPHAS)
+    spec = registry.REGISTRY["alpha_004"]
+    assert spec.lookback == 20
+    assert spec.columns == ("ClosePrice", "Volume")
+    assert spec.output == "sign"
+    assert spec.func is gtja.alpha_004
+
+
+def test_required_columns_and_lookback():
+    names = ["alpha_001", "alpha_019"]
+    assert registry.required_columns(names) == [
+        "OpenPrice",
+        "LowPrice",
+        "ClosePrice",
+        "Volume",
+    ]
+    assert registry.required_lookback(names) == 12
+    assert registry.group_by_lookback(["alpha_015", "alpha_004", "alpha_017"]) == {
+        20: ["alpha_004"],
+        5: ["alpha_015", "alpha_017"],
+    }
+
+
+def test_unknown_factor():
+    with pytest.raises(ValueError, match="Unknown factors"):
+        registry.get_factor_specs(["alpha_999"])
+
+
+def test_duplicate_registration():
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register_factor(registry.REGISTRY["alpha_001"])
+
+
+def test_trim_history(market_data):
+    dates = pd.to_datetime(market_data["Date"].unique())
+    trimmed = registry.trim_history(market_data, ["alpha_017"], start=dates[10])
+    assert list(trimmed.columns) == ["Symbol", "Date", "ClosePrice"]
+    assert trimmed["Date"].min() == dates[6]
+
+
+def test_compute_factors_uses_trimmed_history(market_data):
+    dates = pd.to_datetime(market_data["Date"].unique())
+    names = ["alpha_004", "alpha_017"]
+    result = registry.compute_factors(market_data, names, start=dates[25])
+    for name in names:
+        full = gtja.compute_panel(market_data, name)
+        pd.testing.assert_frame_equal(result[name], full.loc[dates[25] :])
+
+
+def test_compute_latest_matches_panel(market_data):
+    names = ["alpha_001", "alpha_004", "alpha_025"]
+    latest = registry.compute_latest(market_data, names)
+    for name in names:
+        expected = gtja.compute_panel(market_data, name).iloc[-1]
+        np.testing.assert_allclose(latest[name], expected, rtol=1e-7)
+
+    short = registry.compute_latest(market_data.groupby("Symbol").head(10), names)
+    assert np.isnan(short["alpha_004"]).all()
+    assert np.isfinite(short["alpha_001"]).all()
@@ -1,10 +1,12 @@
 import pytest
 import numpy as np
 from simplequant import (
+    RegressionStats,
     evaluate_regression_model,
     regress_model,
     compute_correlation_from_covariance,
     neutralize_all_factors,
+    neutralize_cube,
 )
 
 
@@ -53,10 +55,10 @@ def test_evaluate_regression_model_correct():
 
 
 def test_regress_model_error_1():
-    y_true = np.array([[1, 2, 3, 4, 5]])
+    y_true = np.ones((5, 2, 2))
     x = np.eye(5)
     with pytest.raises(
-        ValueError, match=r"y_true must be 1-D; got ndim=\d+, shape=\(.+\)\."
+        ValueError, match=r"y_true must be 1-D or 2-D; got ndim=\d+, shape=\(.+\)\."
     ):
         regress_model(y_true, x)
 
@@ -88,3 +90,237 @@ def test_regress_model_correct():
     assert res["beta"] == pytest.approx(np.array([1.35, -0.75]), abs=1e-4)
     assert res["intercept"] == pytest.approx(0.8200, abs=1e-4)
     assert res["R2"] == pytest.approx(0.9120, abs=1e-4)
+
+
+def test_regress_model_without_metrics():
+    y_true = np.array([0.7, 2.4, 3.3, 2.1, 4.6])
+    x = np.array([[1.0, 2.0], [2.0, 1.0], [3.0, 3.0], [4.0, 5.0], [5.0, 4.0]])
+    res = regress_model(y_true, x, fit_intercept=True, compute_metrics=False)
+    assert set(res) == {"beta", "intercept", "residual"}
+    assert res["beta"] == pytest.approx(np.array([1.35, -0.75]), abs=1e-4)
+
+
+def test_regress_model_multi_target_matches_single():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(30, 3))
+    y = rng.normal(size=(30, 4))
+    res = regress_model(y, x, fit_intercept=True)
+    assert res["beta"].shape == (4, 3)
+    assert res["residual"].shape == (30, 4)
+    for k in range(4):
+        single = regress_model(y[:, k], x, fit_intercept=True)
+        np.testing.assert_allclose(res["beta"][k], single["beta"])
+        np.testing.assert_allclose(res["intercept"][k], single["intercept"])
+        np.testing.assert_allclose(res["R2"][k], single["R2"])
+
+
+def test_regress_model_weights():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=(40, 2))
+    y = x @ np.array([1.0, -2.0]) + 0.5 + rng.normal(size=40)
+    weights = rng.uniform(0.5, 2.0, size=40)
+    res = regress_model(y, x, fit_intercept=True, weights=weights)
+
+    # Weighted normal equations with an intercept column
+    design = np.column_stack([np.ones(40), x])
+    coef = np.linalg.solve(
+        design.T @ (weights[:, None] * design), design.T @ (weights * y)
+    )
+    assert res["intercept"] == pytest.approx(coef[0])
+    np.testing.assert_allclose(res["beta"], coef[1:])
+    # Integer weights equal repeating rows
+    counts = np.array([1, 2, 3, 1] * 10)
+    res = regress_model(y, x, fit_intercept=True, weights=counts.astype(float))
+    repeated = regress_model(np.repeat(y, counts), np.repeat(x, counts, axis=0), True)
+    np.testing.assert_allclose(res["beta"], repeated["beta"])
+    assert res["R2"] == pytest.approx(repeated["R2"])
+    assert res["MAE"] == pytest.approx(repeated["MAE"])
+
+
+def test_regress_model_invalid_weights():
+    x = np.eye(3)
+    y = np.ones(3)
+    with pytest.raises(ValueError, match="weights must have shape"):
+        regress_model(y, x, weights=np.ones(2))
+    with pytest.raises(ValueError, match="weights must be finite and non-negative"):
+        regress_model(y, x, weights=np.array([1.0, -1.0, 1.0]))
+
+
+def test_neutralize_all_factors_weighted():
+    rng = np.random.default_rng(3)
+    exposure = rng.normal(size=(50, 3))
+    factors = rng.normal(size=(50, 4))
+    weights = rng.uniform(0.1, 1.0, size=50)
+    out = neutralize_all_factors(factors, exposure, fit_intercept=True, weights=weights)
+    for j in range(4):
+        res = regress_model(
+            factors[:, j], exposure, fit_intercept=True, weights=weights
+        )
+        np.testing.assert_allclose(out[:, j], res["residual"], atol=1e-10)
+
+
+def test_neutralize_all_factors_matches_per_column_regression():
+    rng = np.random.default_rng(0)
+    exposure = rng.normal(size=(50, 3))
+    factors = rng.normal(size=(50, 5))
+    factors[:, 1] = 2.5  # constant
+    factors[3, 2] = np.nan  # invalid
+    factors[:, 3] *= 1e11  # overflow
+
+    out = neutralize_all_factors(factors, exposure, fit_intercept=True)
+
+    for j in (0, 4):
+        res = regress_model(factors[:, j], exposure, fit_intercept=True)
+        np.testing.assert_allclose(out[:, j], res["residual"], atol=1e-10)
+    np.testing.assert_array_equal(out[:, 1], factors[:, 1])
+    np.testing.assert_array_equal(out[:, 2], 0.0)
+    np.testing.assert_array_equal(out[:, 3], 0.0)
+
+
+def test_neutralize_all_factors_rank_deficient_exposure():
+    rng = np.random.default_rng(1)
+    industry = np.eye(3)[rng.integers(0, 3, size=40)]
+    factors = rng.normal(size=(40, 2))
+
+    out = neutralize_all_factors(factors, industry, fit_intercept=True)
+
+    for j in range(2):
+        res = regress_model(factors[:, j], industry, fit_intercept=True)
+        np.testing.assert_allclose(out[:, j], res["residual"], atol=1e-10)
+
+
+def test_neutralize_all_factors_regression_failure(capsys):
+    factors = np.arange(12.0).reshape(6, 2) ** 2
+    exposure = np.ones((6, 1))
+    exposure[0, 0] = np.nan
+
+    out = neutralize_all_factors(
+        factors, exposure, factor_names=["a", "b"], date_str="2025-01-02", verbose=True
+    )
+
+    np.testing.assert_array_equal(out, 0.0)
+    assert "[Error] 2025-01-02 a: regression failed" in capsys.readouterr().out
+
+
+def test_neutralize_cube_matches_per_date():
+    rng = np.random.default_rng(2)
+    factors = rng.normal(size=(7, 30, 4))
+    exposures = rng.normal(size=(7, 30, 3))
+    exposures[1, 4] = np.nan  # stock without exposures on one date
+    factors[2, 7] = np.nan  # stock absent on one date
+    factors[3, 9, 2] = np.nan  # one missing value zeroes that factor's date
+    factors[4, :, 1] = 1.5  # constant factor on one date
+
+    out = neutralize_cube(factors, exposures, fit_intercept=True, max_memory_mb=0)
+
+    for d in range(7):
+        valid = np.isfinite(exposures[d]).all(axis=1) & ~np.isnan(factors[d]).all(
+            axis=1
+        )
+        expected = neutralize_all_factors(
+            factors[d][valid], exposures[d][valid], fit_intercept=True
+        )
+        np.testing.assert_allclose(out[d][valid], expected, atol=1e-10)
+        assert np.isnan(out[d][~valid]).all()
+
+
+def test_neutralize_cube_mask():
+    rng = np.random.default_rng(3)
+    factors = rng.normal(size=(2, 20, 2))
+    exposures = rng.normal(size=(2, 20, 2))
+    mask = np.ones((2, 20), dtype=bool)
+    mask[0, :5] = False
+
+    out = neutralize_cube(factors, exposures, mask=mask)
+
+    assert np.isnan(out[0, :5]).all()
+    np.testing.assert_allclose(
+        out[0, 5:], neutralize_all_factors(factors[0, 5:], exposures[0, 5:]), atol=1e-10
+    )
+
+
+def test_neutralize_cube_shape_mismatch():
+    with pytest.raises(ValueError, match="must share \\(n_dates, n_samples\\)"):
+        neutralize_cube(np.ones((2, 5, 1)), np.ones((3, 5, 1)))
+
+
+def test_compute_correlation_invalid_input_does_not_print(capsys):
+    import pandas as pd
+
+    cov = pd.DataFrame(np.eye(2), index=["a", "b"], columns=["a", "c"])
+    with pytest.raises(ValueError, match="got shape=\\(2, 2\\)"):
+        compute_correlation_from_covariance(cov)
+    assert capsys.readouterr().out == ""
+
+
+def test_neutralize_stats_count_skips_per_reason():
+    rng = np.random.default_rng(4)
+    factors = rng.normal(size=(20, 4))
+    factors[3, 0] = np.nan
+    factors[:, 1] = 2.0
+    factors[5, 2] = 1e12
+    exposure = rng.normal(size=(20, 2))
+    names = ["nan", "const", "big", "ok"]
+
+    stats = RegressionStats()
+    out = neutralize_all_factors(factors, exposure, factor_names=names, stats=stats)
+    np.testing.assert_array_equal(
+        out, neutralize_all_factors(factors, exposure, factor_names=names)
+    )
+    neutralize_all_factors(factors[:, 3:], exposure, stats=stats)
+
+    assert (stats.calls, stats.cross_sections, stats.columns) == (2, 2, 5)
+    assert stats.regressed == 2
+    assert stats.skips == {"invalid": 1, "constant": 1, "overflow": 1}
+    assert stats.factor_skips == {
+        ("invalid", "nan"): 1,
+        ("constant", "const"): 1,
+        ("overflow", "big"): 1,
+    }
+    assert set(stats.seconds) == {"classify", "fit", "residual"}
+
+    failed = RegressionStats()
+    exposure[0, 0] = np.nan
+    neutralize_all_factors(factors, exposure, stats=failed)
+    assert failed.skips["error"] == 1 and failed.errors == {"ValueError": 1}
+
+    total = stats + failed
+    assert total.as_dict()["calls"] == 3
+    assert total.as_dict()["skip.error"] == 1
+    assert RegressionStats.combine([stats, failed]) == total
+
+
+def test_neutralize_cube_stats_match_per_date():
+    rng = np.random.default_rng(5)
+    factors = rng.normal(size=(6, 25, 3))
+    factors[1, 4, 0] = np.nan
+    factors[2, :, 1] = 0.5
+    exposures = rng.normal(size=(6, 25, 2))
+    names = ["a", "b", "c"]
+
+    cube_stats, date_stats = RegressionStats(), RegressionStats()
+    neutralize_cube(
+        factors, exposures, stats=cube_stats, factor_names=names, max_memory_mb=0
+    )
+    for d in range(6):
+        neutralize_all_factors(
+            factors[d], exposures[d], factor_names=names, stats=date_stats
+        )
+
+    assert cube_stats.calls == 1
+    for key in ("cross_sections", "columns", "regressed", "skips", "factor_skips"):
+        assert getattr(cube_stats, key) == getattr(date_stats, key)
+
+
+def test_regress_model_stats_stages():
+    rng = np.random.default_rng(6)
+    stats = RegressionStats()
+    regress_model(rng.normal(size=30), rng.normal(size=(30, 2)), stats=stats)
+    regress_model(
+        rng.normal(size=30),
+        rng.normal(size=(30, 2)),
+        compute_metrics=False,
+        stats=stats,
+    )
+    assert stats.calls == 2
+    assert set(stats.seconds) == {"fit", "residual", "metrics"}
@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from simplequant import MarketDataStore, build_store, to_panel, write_store
+
+SAMPLE_CSV = Path(__file__).parents[1] / "data" / "sample_data.csv"
+
+
+def test_build_store_round_trip(market_data, tmp_path):
+    csv_path = tmp_path / "market.csv"
+    market_data.to_csv(csv_path, index=False)
+    store = build_store(str(csv_path), str(tmp_path / "store"))
+
+    expected = to_panel(pd.read_csv(csv_path))
+    reopened = MarketDataStore(str(tmp_path / "store"))
+    assert reopened.fields == list(expected.fields)
+    assert reopened.dates.equals(expected.dates)
+    assert reopened.symbols.equals(expected.symbols)
+    for c in expected.fields:
+        np.testing.assert_array_equal(reopened[c], expected[c])
+    assert store.shape == expected.shape
+
+
+def test_store_read_is_zero_copy(market_data, tmp_path):
+    store = write_store(to_panel(market_data), str(tmp_path / "store"))
+    full = store["ClosePrice"]
+    dates = store.dates
+
+    panel = store.read(["ClosePrice"], start=dates[5], end=dates[9])
+    assert list(panel.dates) == list(dates[5:10])
+    assert np.shares_memory(panel["ClosePrice"], full)
+    np.testing.assert_array_equal(panel["ClosePrice"], full[5:10])
+
+    contiguous = store.read(symbols=list(store.symbols[1:3]))
+    assert np.shares_memory(contiguous["Volume"], store["Volume"])
+    assert contiguous.symbols.equals(store.symbols[1:3])
+
+    gathered = store.read(symbols=[store.symbols[2], store.symbols[0]])
+    np.testing.assert_array_equal(gathered["Volume"], store["Volume"][:, [2, 0]])
+    with pytest.raises(ValueError, match="read-only"):
+        panel["ClosePrice"][0, 0] = 0.0
+
+
+def test_store_errors(market_data, tmp_path):
+    path = str(tmp_path / "store")
+    store = write_store(to_panel(market_data), path)
+    with pytest.raises(FileExistsError):
+        write_store(to_panel(market_data), path)
+    write_store(to_panel(market_data, ["ClosePrice"]), path, overwrite=True)
+    assert MarketDataStore(path).fields == ["ClosePrice"]
+    with pytest.raises(KeyError, match="Field 'VWAP' is not in the store"):
+        store["VWAP"]
+    with pytest.raises(ValueError, match="Unknown symbols"):
+        store.read(symbols=["999999"])
+    with pytest.raises(FileNotFoundError):
+        MarketDataStore(str(tmp_path / "missing"))
+
+
+def test_build_store_sample_data(tmp_path):
+    store = build_store(str(SAMPLE_CSV), str(tmp_path / "store"))
+    df = pd.read_csv(SAMPLE_CSV)
+    assert store.shape == (df["Date"].nunique(), df["Symbol"].nunique())
+    assert store.dates[0] == pd.Timestamp("2018-01-02")
+
+
+def test_build_store_date_format(market_data, tmp_path):
+    iso = market_data.assign(Date=pd.to_datetime(market_data["Date"]).dt.date)
+    csv_path = tmp_path / "iso.csv"
+    iso.to_csv(csv_path, index=False)
+    inferred = build_store(str(csv_path), str(tmp_path / "inferred"))
+    explicit = build_store(
+        str(csv_path), str(tmp_path / "explicit"), date_format="%Y-%m-%d"
+    )
+    expected = to_panel(market_data).dates
+    assert inferred.dates.equals(expected) and explicit.dates.equals(expected)
+
+
+def test_overwrite_keeps_old_store_until_replaced(market_data, tmp_path, monkeypatch):
+    path = str(tmp_path / "store")
+    write_store(to_panel(market_data), path)
+
+    replace = os.replace
+
+    def failing_replace(src, dst):
+        if os.path.basename(src).startswith(".store-") and not src.endswith(".old"):
+            raise OSError("simulated failure")
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError, match="simulated failure"):
+        write_store(to_panel(market_data, ["ClosePrice"]), path, overwrite=True)
+    assert MarketDataStore(path).fields == list(to_panel(market_data).fields)
+
+    monkeypatch.setattr(os, "replace", replace)
+    write_store(to_panel(market_data, ["ClosePrice"]), path, overwrite=True)
+    assert MarketDataStore(path).fields == ["ClosePrice"]
+    assert os.listdir(tmp_path) == ["store"]
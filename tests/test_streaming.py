@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+
+from simplequant import to_panel
+from simplequant.factor import gtja, StreamingCalculator
+
+
+def expected_panel(market_data):
+    panel = to_panel(market_data)
+    return {name: gtja.compute_panel(panel, name) for name in gtja.PANEL_ALPHAS}
+
+
+def test_streaming_matches_panel(market_data, tmp_path):
+    expected = expected_panel(market_data)
+    calc = StreamingCalculator()
+    assert calc.window == 20
+
+    for i, (date, bars) in enumerate(market_data.groupby("Date", sort=False)):
+        if i == 25:
+            calc.save(tmp_path / "state.npz")
+            calc = StreamingCalculator.load(tmp_path / "state.npz")
+        row = calc.update(bars)
+        for name, frame in expected.items():
+            np.testing.assert_allclose(
+                row[name].to_numpy(), frame.iloc[i].to_numpy(), rtol=1e-9, atol=1e-12
+            )
+
+
+def test_streaming_new_and_missing_symbols(market_data):
+    dates = market_data["Date"].unique()
+    calc = StreamingCalculator(names=["alpha_015"], symbols=[600000])
+    for date in dates[:5]:
+        bars = market_data[market_data["Date"] == date]
+        row = calc.update(bars[bars["Symbol"] != 600002])
+    assert list(row.index) == [600000, 600001]
+    assert np.isfinite(row["alpha_015"]).all()
+
+    row = calc.update(market_data[market_data["Date"] == dates[5]])
+    assert np.isnan(row.loc[600002, "alpha_015"])
+
+
+def test_streaming_rejects_stale_date(market_data):
+    calc = StreamingCalculator(names=["alpha_002"])
+    bars = market_data[market_data["Date"] == market_data["Date"].iloc[1]]
+    calc.update(bars)
+    with pytest.raises(ValueError, match="date must be after the last update"):
+        calc.update(bars)
+
+
+def test_streaming_unknown_alpha():
+    with pytest.raises(ValueError, match="Unknown factors"):
+        StreamingCalculator(names=["alpha_999"])